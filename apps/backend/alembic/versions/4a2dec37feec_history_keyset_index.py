@@ -0,0 +1,29 @@
+"""history keyset index
+
+Revision ID: 4a2dec37feec
+Revises: 643ecb69f264
+Create Date: 2026-10-19 10:12:41.208115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a2dec37feec'
+down_revision: Union[str, None] = '643ecb69f264'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 键集分页按 (created_at, id) 倒序扫描，复合索引同时覆盖按创建时间排序的需求
+    op.drop_index('ix_translations_created_at', table_name='translations', if_exists=True)
+    op.create_index('ix_translations_created_at_id', 'translations', ['created_at', 'id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_translations_created_at_id', table_name='translations', if_exists=True)
+    op.create_index('ix_translations_created_at', 'translations', ['created_at'], unique=False, if_not_exists=True)
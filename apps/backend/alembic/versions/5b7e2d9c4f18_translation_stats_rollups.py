@@ -0,0 +1,58 @@
+"""translation stats rollups
+
+Revision ID: 5b7e2d9c4f18
+Revises: d3f8a6c2e914
+Create Date: 2026-10-19 16:12:37.260491
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2d9c4f18'
+down_revision: Union[str, None] = 'd3f8a6c2e914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('translation_daily_stats',
+    sa.Column('realm', sa.String(length=64), nullable=False, comment='租户'),
+    sa.Column('day', sa.Date(), nullable=False, comment='日期（UTC）'),
+    sa.Column('direction', sa.String(length=20), nullable=False, comment='翻译方向'),
+    sa.Column('perspective', sa.String(length=20), nullable=False, comment='识别的视角'),
+    sa.Column('count', sa.Integer(), nullable=False, comment='翻译数'),
+    sa.PrimaryKeyConstraint('realm', 'day', 'direction', 'perspective')
+    )
+    op.create_table('gap_category_daily_stats',
+    sa.Column('realm', sa.String(length=64), nullable=False, comment='租户'),
+    sa.Column('day', sa.Date(), nullable=False, comment='日期（UTC）'),
+    sa.Column('category', sa.String(length=64), nullable=False, comment='缺失信息分类'),
+    sa.Column('count', sa.Integer(), nullable=False, comment='出现次数'),
+    sa.PrimaryKeyConstraint('realm', 'day', 'category')
+    )
+
+    # 回填已有记录，之后由写入路径增量维护
+    op.execute("""
+        INSERT INTO translation_daily_stats (realm, day, direction, perspective, count)
+        SELECT realm, (created_at AT TIME ZONE 'UTC')::date, direction, coalesce(detected_perspective, 'unknown'), count(*)
+        FROM translations
+        GROUP BY 1, 2, 3, 4
+    """)
+    op.execute("""
+        INSERT INTO gap_category_daily_stats (realm, day, category, count)
+        SELECT t.realm, (t.created_at AT TIME ZONE 'UTC')::date, left(g.value ->> 'category', 64), count(*)
+        FROM translations t
+        CROSS JOIN LATERAL jsonb_array_elements(t.gaps_identified -> 'gaps') AS g(value)
+        WHERE jsonb_typeof(t.gaps_identified -> 'gaps') = 'array'
+          AND coalesce(g.value ->> 'category', '') <> ''
+        GROUP BY 1, 2, 3
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('gap_category_daily_stats')
+    op.drop_table('translation_daily_stats')
@@ -0,0 +1,44 @@
+"""history search indexes
+
+Revision ID: 6e9055d6f9c3
+Revises: 4a2dec37feec
+Create Date: 2026-10-19 11:02:17.530964
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e9055d6f9c3'
+down_revision: Union[str, None] = '4a2dec37feec'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pg_trgm 三元组索引支持任意位置的 ILIKE 匹配，中文无需分词扩展
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_translations_content_trgm', 'translations', ['content'], unique=False,
+        postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'}, if_not_exists=True,
+    )
+    op.create_index(
+        'ix_translations_translated_content_trgm', 'translations', ['translated_content'], unique=False,
+        postgresql_using='gin', postgresql_ops={'translated_content': 'gin_trgm_ops'}, if_not_exists=True,
+    )
+    # 缺失信息分类过滤使用 JSONB 包含查询 (@>)
+    op.create_index(
+        'ix_translations_gaps_identified', 'translations', ['gaps_identified'], unique=False,
+        postgresql_using='gin', postgresql_ops={'gaps_identified': 'jsonb_path_ops'}, if_not_exists=True,
+    )
+    op.create_index('ix_translations_direction', 'translations', ['direction'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_translations_direction', table_name='translations', if_exists=True)
+    op.drop_index('ix_translations_gaps_identified', table_name='translations', if_exists=True)
+    op.drop_index('ix_translations_translated_content_trgm', table_name='translations', if_exists=True)
+    op.drop_index('ix_translations_content_trgm', table_name='translations', if_exists=True)
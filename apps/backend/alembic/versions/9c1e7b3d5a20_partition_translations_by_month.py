@@ -0,0 +1,124 @@
+"""partition translations by month
+
+Revision ID: 9c1e7b3d5a20
+Revises: 6e9055d6f9c3
+Create Date: 2026-10-19 14:26:05.417382
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c1e7b3d5a20'
+down_revision: Union[str, None] = '6e9055d6f9c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 迁移时预建的未来月份数，之后由应用内的分区维护任务滚动预建
+PREMAKE_MONTHS = 3
+
+_INDEXES = (
+    'ix_translations_created_at_id',
+    'ix_translations_direction',
+    'ix_translations_content_trgm',
+    'ix_translations_translated_content_trgm',
+    'ix_translations_gaps_identified',
+)
+
+_COLUMNS = 'id, content, translated_content, direction, detected_perspective, gaps_identified, created_at'
+
+
+def _translation_columns() -> list[sa.Column]:
+    return [
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False, comment='原始内容'),
+        sa.Column('translated_content', sa.Text(), nullable=False, comment='翻译结果'),
+        sa.Column('direction', sa.String(length=20), nullable=False, comment='翻译方向: pm_to_dev / dev_to_pm'),
+        sa.Column('detected_perspective', sa.String(length=20), nullable=True, comment='识别的视角: pm / dev / unknown'),
+        sa.Column('gaps_identified', postgresql.JSONB(astext_type=sa.Text()), nullable=True, comment='识别的缺失信息'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='创建时间'),
+    ]
+
+
+def _create_indexes() -> None:
+    op.create_index('ix_translations_created_at_id', 'translations', ['created_at', 'id'], unique=False, if_not_exists=True)
+    op.create_index('ix_translations_direction', 'translations', ['direction'], unique=False, if_not_exists=True)
+    op.create_index(
+        'ix_translations_content_trgm', 'translations', ['content'], unique=False,
+        postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'}, if_not_exists=True,
+    )
+    op.create_index(
+        'ix_translations_translated_content_trgm', 'translations', ['translated_content'], unique=False,
+        postgresql_using='gin', postgresql_ops={'translated_content': 'gin_trgm_ops'}, if_not_exists=True,
+    )
+    op.create_index(
+        'ix_translations_gaps_identified', 'translations', ['gaps_identified'], unique=False,
+        postgresql_using='gin', postgresql_ops={'gaps_identified': 'jsonb_path_ops'}, if_not_exists=True,
+    )
+
+
+def _retire_table() -> None:
+    """将现有 translations 改名为 translations_legacy，并释放索引与主键名称"""
+    op.rename_table('translations', 'translations_legacy')
+    op.execute('ALTER TABLE translations_legacy RENAME CONSTRAINT translations_pkey TO translations_legacy_pkey')
+    for name in _INDEXES:
+        op.drop_index(name, table_name='translations_legacy', if_exists=True)
+
+
+def upgrade() -> None:
+    _retire_table()
+
+    # 分区键必须包含在主键中，主键改为 (id, created_at)
+    op.create_table(
+        'translations',
+        *_translation_columns(),
+        sa.PrimaryKeyConstraint('id', 'created_at'),
+        postgresql_partition_by='RANGE (created_at)',
+    )
+
+    # 按 UTC 月份建分区：覆盖已有数据的最早月份到当前月之后 PREMAKE_MONTHS 个月
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month_start timestamp;
+            last_month timestamp := date_trunc('month', now() AT TIME ZONE 'UTC') + interval '{PREMAKE_MONTHS} months';
+        BEGIN
+            SELECT coalesce(date_trunc('month', min(created_at) AT TIME ZONE 'UTC'), date_trunc('month', now() AT TIME ZONE 'UTC'))
+              INTO month_start FROM translations_legacy;
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF translations FOR VALUES FROM (%L) TO (%L)',
+                    'translations_p' || to_char(month_start, 'YYYY_MM'),
+                    to_char(month_start, 'YYYY-MM-DD HH24:MI:SS') || '+00',
+                    to_char(month_start + interval '1 month', 'YYYY-MM-DD HH24:MI:SS') || '+00'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END
+        $$
+    """)
+
+    op.execute(f'INSERT INTO translations ({_COLUMNS}) SELECT {_COLUMNS} FROM translations_legacy')
+    op.drop_table('translations_legacy')
+
+    # 在父表上建索引，自动传播到所有现有及后续分区
+    _create_indexes()
+
+
+def downgrade() -> None:
+    _retire_table()
+
+    op.create_table(
+        'translations',
+        *_translation_columns(),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute(f'INSERT INTO translations ({_COLUMNS}) SELECT {_COLUMNS} FROM translations_legacy')
+    # 删除分区父表会一并删除所有分区
+    op.drop_table('translations_legacy')
+
+    _create_indexes()
@@ -0,0 +1,63 @@
+"""translation bodies
+
+Revision ID: a4c9e1f7b2d6
+Revises: 5b7e2d9c4f18
+Create Date: 2026-10-19 17:03:52.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c9e1f7b2d6'
+down_revision: Union[str, None] = '5b7e2d9c4f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('translation_bodies',
+    sa.Column('hash', sa.LargeBinary(length=32), nullable=False, comment='正文 SHA-256'),
+    sa.Column('body', sa.LargeBinary(), nullable=False, comment='zlib 压缩的 UTF-8 正文'),
+    sa.Column('length', sa.Integer(), nullable=False, comment='正文字符数'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='创建时间'),
+    sa.PrimaryKeyConstraint('hash')
+    )
+    # 正文已在应用侧压缩，TOAST 只做行外存储不再压缩
+    op.execute('ALTER TABLE translation_bodies ALTER COLUMN body SET STORAGE EXTERNAL')
+
+    op.add_column('translations', sa.Column('content_hash', sa.LargeBinary(length=32), nullable=True, comment='外置原始内容的 SHA-256'))
+    op.add_column('translations', sa.Column('translated_hash', sa.LargeBinary(length=32), nullable=True, comment='外置翻译结果的 SHA-256'))
+    op.create_foreign_key('translations_content_hash_fkey', 'translations', 'translation_bodies', ['content_hash'], ['hash'])
+    op.create_foreign_key('translations_translated_hash_fkey', 'translations', 'translation_bodies', ['translated_hash'], ['hash'])
+    op.create_index(
+        'ix_translations_content_hash', 'translations', ['content_hash'], unique=False,
+        postgresql_where=sa.text('content_hash IS NOT NULL'), if_not_exists=True,
+    )
+    op.create_index(
+        'ix_translations_translated_hash', 'translations', ['translated_hash'], unique=False,
+        postgresql_where=sa.text('translated_hash IS NOT NULL'), if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    # 外置正文为应用侧 zlib 压缩，无法在 SQL 中还原为内联内容；存在外置正文时拒绝降级，避免丢失完整内容
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM translations WHERE content_hash IS NOT NULL OR translated_hash IS NOT NULL) THEN
+                RAISE EXCEPTION 'translations still reference translation_bodies; inline the bodies before downgrading';
+            END IF;
+        END
+        $$
+    """)
+    op.drop_index('ix_translations_translated_hash', table_name='translations', if_exists=True)
+    op.drop_index('ix_translations_content_hash', table_name='translations', if_exists=True)
+    op.drop_constraint('translations_translated_hash_fkey', 'translations', type_='foreignkey')
+    op.drop_constraint('translations_content_hash_fkey', 'translations', type_='foreignkey')
+    op.drop_column('translations', 'translated_hash')
+    op.drop_column('translations', 'content_hash')
+    op.drop_table('translation_bodies')
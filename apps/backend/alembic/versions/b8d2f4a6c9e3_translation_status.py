@@ -0,0 +1,27 @@
+"""translation status
+
+Revision ID: b8d2f4a6c9e3
+Revises: e7b3c5a1d8f2
+Create Date: 2026-10-19 21:06:42.913057
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d2f4a6c9e3'
+down_revision: Union[str, None] = 'e7b3c5a1d8f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 常量默认值只修改系统目录，不重写已有分区
+    op.add_column('translations', sa.Column('status', sa.String(length=16), server_default='completed', nullable=False, comment='状态: completed / cancelled'))
+
+
+def downgrade() -> None:
+    op.drop_column('translations', 'status')
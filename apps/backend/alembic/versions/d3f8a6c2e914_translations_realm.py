@@ -0,0 +1,37 @@
+"""translations realm
+
+Revision ID: d3f8a6c2e914
+Revises: 9c1e7b3d5a20
+Create Date: 2026-10-19 15:08:44.902115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f8a6c2e914'
+down_revision: Union[str, None] = '9c1e7b3d5a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 常量默认值的新增列只修改元数据，不重写已有分区；已有记录归属默认租户
+    op.add_column('translations', sa.Column('realm', sa.String(length=64), server_default='default', nullable=False, comment='租户'))
+    op.add_column('translations', sa.Column('username', sa.String(length=128), server_default='anonymous', nullable=False, comment='创建用户'))
+    # 历史查询均按租户过滤，(realm, created_at DESC, id DESC) 取代全局时间线索引
+    op.create_index(
+        'ix_translations_realm_created_at_id', 'translations',
+        ['realm', sa.text('created_at DESC'), sa.text('id DESC')], unique=False, if_not_exists=True,
+    )
+    op.drop_index('ix_translations_created_at_id', table_name='translations', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index('ix_translations_created_at_id', 'translations', ['created_at', 'id'], unique=False, if_not_exists=True)
+    op.drop_index('ix_translations_realm_created_at_id', table_name='translations', if_exists=True)
+    op.drop_column('translations', 'username')
+    op.drop_column('translations', 'realm')
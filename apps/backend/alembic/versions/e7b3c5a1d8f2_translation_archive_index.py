@@ -0,0 +1,35 @@
+"""translation archive index
+
+Revision ID: e7b3c5a1d8f2
+Revises: a4c9e1f7b2d6
+Create Date: 2026-10-19 19:41:08.527316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3c5a1d8f2'
+down_revision: Union[str, None] = 'a4c9e1f7b2d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('translation_archive_index',
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, comment='翻译记录 ID'),
+    sa.Column('realm', sa.String(length=64), nullable=False, comment='租户'),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, comment='记录创建时间'),
+    sa.Column('segment', sa.String(length=255), nullable=False, comment='段文件名'),
+    sa.Column('offset', sa.BigInteger(), nullable=False, comment='所在帧的字节偏移'),
+    sa.Column('length', sa.Integer(), nullable=False, comment='所在帧的字节长度'),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('translation_archive_index')
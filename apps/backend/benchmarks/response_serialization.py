@@ -0,0 +1,120 @@
+"""历史列表响应序列化基准
+
+对比每页历史响应的两条序列化路径（不依赖数据库与 Redis）：
+
+- legacy：逐行构建 TranslationSummary → TranslationHistory → CommonResponse，
+  再按 FastAPI 处理 response_model 的方式 model_dump、校验、转换为 JSON 兼容结构并用 json 编码
+- fast：行直接转换为字典（缓冲页直接嵌入已编码的 JSON 片段），orjson 一次编码
+
+用法（在 apps/backend 目录下）::
+
+    python benchmarks/response_serialization.py [--sizes 20 100] [--repeat 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from core.api.response import CommonResponse, fast_success_response
+from domain.translate.schema.response import TranslationHistory, TranslationSummary
+
+
+_HISTORY_ADAPTER = TypeAdapter(CommonResponse[TranslationHistory])
+
+
+def make_rows(size: int) -> list[dict[str, Any]]:
+    """构造与 _SUMMARY_COLUMNS 投影相同结构的行"""
+    now = datetime.now(UTC)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "content_preview": "登录页需要支持手机号验证码登录，并在失败三次后显示图形验证码。" * 4,
+            "translated_preview": "新增短信验证码登录接口，需限流并记录失败次数，第三次失败后要求图形验证码。" * 3,
+            "direction": "pm_to_dev",
+            "detected_perspective": "pm",
+            "gap_count": i % 5,
+            "created_at": now - timedelta(minutes=i),
+        }
+        for i in range(size)
+    ]
+
+
+def _page(content: list[Any], size: int) -> dict[str, Any]:
+    return {
+        "content": content,
+        "total": 12345,
+        "total_estimated": False,
+        "page": 1,
+        "size": size,
+        "total_pages": (12345 + size - 1) // size,
+        "next_cursor": None,
+    }
+
+
+def legacy_db(rows: list[dict[str, Any]]) -> bytes:
+    summaries = [TranslationSummary.model_validate(row) for row in rows]
+    response = CommonResponse(data=TranslationHistory(**_page(summaries, len(rows))))
+    value = _HISTORY_ADAPTER.validate_python(response.model_dump())
+    return bytes(JSONResponse(_HISTORY_ADAPTER.dump_python(value, mode="json")).body)
+
+
+def fast_db(rows: list[dict[str, Any]]) -> bytes:
+    return bytes(fast_success_response(_page([dict(row) for row in rows], len(rows))).body)
+
+
+def legacy_buffer(items: list[str]) -> bytes:
+    summaries = [TranslationSummary.model_validate(orjson.loads(item)) for item in items]
+    response = CommonResponse(data=TranslationHistory(**_page(summaries, len(items))))
+    value = _HISTORY_ADAPTER.validate_python(response.model_dump())
+    return bytes(JSONResponse(_HISTORY_ADAPTER.dump_python(value, mode="json")).body)
+
+
+def fast_buffer(items: list[str]) -> bytes:
+    orjson.loads(items[-1])  # 生成游标时解析最后一项
+    return bytes(fast_success_response(_page([orjson.Fragment(item) for item in items], len(items))).body)
+
+
+def measure(func: Callable[[Any], bytes], arg: Any, repeat: int) -> float:
+    """返回单页耗时（微秒，取 5 轮中的最小值）"""
+    return min(timeit.repeat(lambda: func(arg), number=repeat, repeat=5)) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 100], help="每页记录数")
+    parser.add_argument("--repeat", type=int, default=2000, help="每轮执行次数")
+    args = parser.parse_args()
+
+    print(f"{'source':<8} {'size':>5} {'legacy (us)':>12} {'fast (us)':>10} {'saved':>7}")
+    for size in args.sizes:
+        rows = make_rows(size)
+        items = [
+            orjson.dumps(TranslationSummary.model_validate(row).model_dump(), option=orjson.OPT_UTC_Z).decode()
+            for row in rows
+        ]
+        if orjson.loads(legacy_db(rows)) != orjson.loads(fast_db(rows)):
+            msg = "两条路径的输出不一致"
+            raise SystemExit(msg)
+        cases = (("db", legacy_db, fast_db, rows), ("buffer", legacy_buffer, fast_buffer, items))
+        for source, legacy, fast, arg in cases:
+            before = measure(legacy, arg, args.repeat)
+            after = measure(fast, arg, args.repeat)
+            print(f"{source:<8} {size:>5} {before:>12.1f} {after:>10.1f} {1 - after / before:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
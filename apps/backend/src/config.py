@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import Any, cast
+from typing import Any, Literal, cast
 
 from pydantic import BaseModel, Field
 
@@ -14,6 +14,39 @@ from core.logging import get_logger
 logger = get_logger(__name__)
 
 
+class PartitionConfig(BaseModel):
+    """按月分区维护配置"""
+
+    premake_months: int = 3  # 预先创建的未来月份分区数
+    retention_months: int | None = None  # 保留当前月之前的月数，None 表示永久保留
+    drop_expired: bool = False  # 过期分区直接删除；False 时仅分离（DETACH），保留分区表供归档或备份
+    maintenance_interval: int = 6 * 3600  # 维护任务执行间隔（秒）
+
+
+class BodyStoreConfig(BaseModel):
+    """正文内容寻址存储配置"""
+
+    enabled: bool = False  # 启用后长正文去重压缩存放于 translation_bodies
+    min_length: int = 1000  # 正文字符数达到该值才外置，短正文保持内联
+    inline_length: int = 500  # 外置正文在 translations 中保留的前缀字符数（列表预览与关键词搜索使用），不小于预览长度
+    compression_level: int = 6  # zlib 压缩级别
+
+
+class ReplicaConfig(BaseModel):
+    """只读副本配置（未设置的连接参数沿用主库配置）"""
+
+    host: str
+    port: int = 5432
+    username: str | None = None
+    password: str | None = None
+    name: str | None = None
+    pool_size: int | None = None
+
+
+def _empty_replicas() -> list[ReplicaConfig]:
+    return []
+
+
 class DatabaseConfig(BaseModel):
     """数据库配置"""
 
@@ -27,11 +60,24 @@ class DatabaseConfig(BaseModel):
     pool_timeout: int = 30
     pool_recycle: int = 3600
     pool_pre_ping: bool = True
+    partitioning: PartitionConfig = Field(default_factory=PartitionConfig)
+    body_store: BodyStoreConfig = Field(default_factory=BodyStoreConfig)
+    replicas: list[ReplicaConfig] = Field(default_factory=_empty_replicas)
+    replica_max_lag: float = 5.0  # 副本复制延迟超过该值（秒）时读请求回退主库
+    replica_lag_check_interval: float = 5.0  # 副本延迟检测间隔（秒）
+    read_your_writes_window: float = 10.0  # 用户写入后该时间（秒）内的读请求固定走主库
 
     def build_url(self) -> str:
         """构建数据库连接 URL"""
         return f"postgresql+psycopg://{self.username}:{self.password}@{self.host}:{self.port}/{self.name}"
 
+    def build_replica_url(self, replica: ReplicaConfig) -> str:
+        """构建只读副本连接 URL"""
+        username = replica.username or self.username
+        password = replica.password if replica.password is not None else self.password
+        name = replica.name or self.name
+        return f"postgresql+psycopg://{username}:{password}@{replica.host}:{replica.port}/{name}"
+
 
 class DashScopeConfig(BaseModel):
     """DashScope LLM 配置"""
@@ -43,10 +89,36 @@ class DashScopeConfig(BaseModel):
     request_timeout: int = 60
 
 
+class CircuitBreakerConfig(BaseModel):
+    """LLM 熔断配置（视角识别、缺失分析、翻译各阶段独立统计）"""
+
+    enabled: bool = True
+    window_seconds: float = 60.0  # 失败率统计的滑动窗口（秒）
+    min_calls: int = 10  # 窗口内调用数达到该值才计算失败率
+    failure_rate: float = 0.5  # 失败率达到该值时打开熔断
+    open_seconds: float = 30.0  # 熔断持续时间（秒），之后放行探测调用
+    half_open_probes: int = 2  # 探测调用数，全部成功后关闭熔断
+
+
+def _empty_weights() -> dict[str, float]:
+    return {}
+
+
+class SchedulerConfig(BaseModel):
+    """LLM 调用调度配置：流式 > 同步 > 批量，同一类型内按租户权重公平排队"""
+
+    enabled: bool = True
+    max_concurrency: int = 32  # 同时进行的 LLM 调用上限，超出的调用排队
+    default_weight: float = 1.0  # 未单独配置的租户权重
+    realm_weights: dict[str, float] = Field(default_factory=_empty_weights)  # 租户 -> 权重
+
+
 class LLMConfig(BaseModel):
     """LLM 配置"""
 
     dashscope: DashScopeConfig = Field(default_factory=DashScopeConfig)
+    circuit_breaker: CircuitBreakerConfig = Field(default_factory=CircuitBreakerConfig)
+    scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig)
 
 
 class RedisConfig(BaseModel):
@@ -61,6 +133,7 @@ class RedisConfig(BaseModel):
     socket_timeout: float = 5.0
     socket_connect_timeout: float = 2.0
     health_check_interval: int = 15
+    translation_cache_ttl: int = 7 * 24 * 3600  # 翻译详情缓存有效期（秒），记录不可变，可长期缓存
 
 
 class LoggingConfig(BaseModel):
@@ -71,12 +144,104 @@ class LoggingConfig(BaseModel):
     include_timestamp: bool = True
 
 
+def _compressible_types() -> list[str]:
+    return ["application/json", "application/x-ndjson", "text/csv"]
+
+
+class CompressionConfig(BaseModel):
+    """响应压缩配置（brotli 需安装可选依赖，未安装时只使用 gzip）"""
+
+    enabled: bool = True
+    minimum_size: int = 1024  # 小于该字节数的响应不压缩
+    gzip_level: int = 6
+    brotli_quality: int = 4  # 动态压缩取较低质量，兼顾压缩率与 CPU
+    content_types: list[str] = Field(default_factory=_compressible_types)  # 压缩的响应类型（前缀匹配）
+
+
 class ServerConfig(BaseModel):
     """服务器配置"""
 
     host: str = "0.0.0.0"
     port: int = 8000
     cors_origins: list[str] = Field(default_factory=lambda: ["http://localhost:5173"])
+    realm_header: str = "X-Realm"  # 网关注入的租户请求头
+    username_header: str = "X-Username"  # 网关注入的用户名请求头
+    compression: CompressionConfig = Field(default_factory=CompressionConfig)
+
+
+class RateLimitConfig(BaseModel):
+    """翻译请求限流配置（Redis 令牌桶，按租户 + 用户，请求数与估算 token 数分别限制）"""
+
+    enabled: bool = True
+    requests_per_minute: int = 60  # 每分钟补充的请求数
+    request_burst: int = 60  # 请求桶容量（允许的突发请求数）
+    tokens_per_minute: int = 200_000  # 每分钟补充的估算 token 数
+    token_burst: int = 200_000  # token 桶容量
+    tokens_per_char: float = 3.0  # 每个输入字符估算的 token 数（含视角识别、缺失分析、翻译三次调用的输入与输出）
+
+
+class StreamingConfig(BaseModel):
+    """流式翻译（SSE）配置"""
+
+    coalesce_window: float = 0.03  # 合并内容增量的时间窗口（秒），0 表示不合并
+    coalesce_max_bytes: int = 256  # 暂存增量达到该字节数时立即写出
+    buffer_max_bytes: int = 1024 * 1024  # 单个流积压的最大字节数，超出视为慢客户端并断开
+    slow_client_policy: Literal["finish", "cancel"] = "finish"  # 断开慢客户端后：finish 继续生成并保存；cancel 取消
+    disconnect_check_interval: float = 0.5  # 检测客户端断开的间隔（秒）
+    disconnect_policy: Literal["persist_partial", "drop"] = "drop"  # 取消后：保存已生成的部分译文或丢弃
+
+
+def _admission_paths() -> list[str]:
+    return ["/api/translate"]
+
+
+class AdmissionConfig(BaseModel):
+    """过载保护配置：负载取各指标与上限之比的最大值，逐级降级，达到 1 时拒绝新的翻译请求"""
+
+    enabled: bool = True
+    paths: list[str] = Field(default_factory=_admission_paths)  # 受保护的 POST 路径（前缀匹配）
+    max_in_flight: int = 64  # 进行中的翻译请求（含流式）上限
+    max_llm_in_flight: int = 128  # 进行中（含调度器排队）的 LLM 调用上限
+    max_loop_lag: float = 0.5  # 事件循环调度延迟上限（秒）
+    skip_gaps_at: float = 0.6  # 负载达到该值时跳过缺失分析
+    translate_only_at: float = 0.8  # 负载达到该值时视角识别也改用关键词规则
+    retry_after: int = 5  # 拒绝时 Retry-After 响应头（秒）
+    loop_lag_interval: float = 0.5  # 事件循环延迟采样间隔（秒）
+
+
+class DeadlineConfig(BaseModel):
+    """翻译请求时限配置：覆盖视角识别、缺失分析与翻译全部阶段（含 LLM 重试）"""
+
+    default_seconds: float = 90.0  # 默认总时限（秒）
+    max_seconds: float = 300.0  # 请求头可指定的最大时限（秒）
+    header: str = "X-Request-Timeout"  # 客户端指定时限（秒）的请求头
+    perspective_share: float = 0.25  # 视角识别最多占用剩余时间的比例，超时按 unknown 处理
+    gaps_share: float = 0.3  # 缺失分析最多占用剩余时间的比例
+    translate_reserve: float = 30.0  # 为翻译阶段预留的时间（秒），剩余不足时跳过缺失分析
+
+
+class HistoryConfig(BaseModel):
+    """翻译历史查询配置"""
+
+    max_offset: int = 1000  # 页码分页允许的最大偏移量，超出后需使用游标分页
+    exact_count_threshold: int = 10000  # 估算行数低于该值时执行精确 count(*)
+    recent_buffer_enabled: bool = True  # 是否启用 Redis 最近历史缓冲
+    recent_buffer_size: int = 200  # 每个租户缓冲的最新记录数
+    export_batch_size: int = 1000  # 导出时服务端游标每批拉取的行数
+    stats_max_days: int = 366  # 统计接口单次查询的最大天数
+
+
+class ArchiveConfig(BaseModel):
+    """冷数据归档配置（需安装可选依赖 zstandard）"""
+
+    enabled: bool = False
+    directory: str = "data/archive"  # 段文件目录（相对于后端工作目录），可指向挂载的对象存储
+    after_days: int = 180  # 创建超过该天数的记录移入归档
+    batch_size: int = 5000  # 每个段文件包含的最大记录数
+    max_batches: int = 20  # 单次归档任务最多处理的批次数
+    frame_size: int = 256 * 1024  # 每个 zstd 帧的目标未压缩大小（字节），越小单条读取越快、压缩率越低
+    compression_level: int = 10  # zstd 压缩级别
+    interval: int = 24 * 3600  # 归档任务执行间隔（秒）
 
 
 class AppConfig(BaseModel):
@@ -87,6 +252,12 @@ class AppConfig(BaseModel):
     server: ServerConfig = Field(default_factory=ServerConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     redis: RedisConfig = Field(default_factory=RedisConfig)
+    history: HistoryConfig = Field(default_factory=HistoryConfig)
+    streaming: StreamingConfig = Field(default_factory=StreamingConfig)
+    deadline: DeadlineConfig = Field(default_factory=DeadlineConfig)
+    admission: AdmissionConfig = Field(default_factory=AdmissionConfig)
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    archive: ArchiveConfig = Field(default_factory=ArchiveConfig)
 
 
 class ConfigManager:
@@ -176,6 +347,36 @@ class ConfigManager:
         """获取 Redis 配置"""
         return self.config.redis
 
+    @property
+    def archive(self) -> ArchiveConfig:
+        """获取归档配置"""
+        return self.config.archive
+
+    @property
+    def history(self) -> HistoryConfig:
+        """获取翻译历史配置"""
+        return self.config.history
+
+    @property
+    def streaming(self) -> StreamingConfig:
+        """获取流式翻译配置"""
+        return self.config.streaming
+
+    @property
+    def deadline(self) -> DeadlineConfig:
+        """获取请求时限配置"""
+        return self.config.deadline
+
+    @property
+    def admission(self) -> AdmissionConfig:
+        """获取过载保护配置"""
+        return self.config.admission
+
+    @property
+    def rate_limit(self) -> RateLimitConfig:
+        """获取限流配置"""
+        return self.config.rate_limit
+
 
 # 全局单例
 config_manager = ConfigManager()
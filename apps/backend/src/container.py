@@ -8,7 +8,14 @@
 from dependency_injector import containers, providers
 
 from config import config_manager
+from core.cache.redis_service import redis_service
+from core.ratelimit import RateLimiter
+from domain.translate.repository.archive_repository import TranslationArchive
+from domain.translate.repository.recent_history import RecentHistoryBuffer
+from domain.translate.repository.stats_repository import TranslationStatsRepository
 from domain.translate.repository.translate_repository import TranslateRepository
+from domain.translate.repository.translation_cache import TranslationCache
+from domain.translate.service.maintenance_service import TranslationMaintenance
 from domain.translate.service.translate_service import TranslateService
 from llm.dashscope import create_dashscope_llm
 
@@ -20,10 +27,31 @@ class AppContainer(containers.DeclarativeContainer):
 
     llm = providers.Singleton(create_dashscope_llm)
 
-    translate_repository = providers.Singleton(TranslateRepository)
+    redis = providers.Singleton(redis_service)
+
+    rate_limiter = providers.Singleton(RateLimiter, redis=redis)
+
+    translation_archive = providers.Singleton(TranslationArchive)
+
+    translate_repository = providers.Singleton(TranslateRepository, archive=translation_archive)
+
+    translation_stats_repository = providers.Singleton(TranslationStatsRepository)
+
+    translation_cache = providers.Singleton(TranslationCache, redis=redis)
+
+    recent_history = providers.Singleton(RecentHistoryBuffer, redis=redis, repository=translate_repository)
 
     translate_service = providers.Singleton(
         TranslateService,
         llm=llm,
         repository=translate_repository,
+        cache=translation_cache,
+        recent=recent_history,
+        stats=translation_stats_repository,
+    )
+
+    translation_maintenance = providers.Singleton(
+        TranslationMaintenance,
+        repository=translate_repository,
+        archive=translation_archive,
     )
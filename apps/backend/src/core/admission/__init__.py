@@ -0,0 +1,13 @@
+"""过载保护模块"""
+
+from core.admission.controller import AdmissionController, DegradationLevel, admission_controller, current_degradation
+from core.admission.middleware import AdmissionMiddleware
+
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionMiddleware",
+    "DegradationLevel",
+    "admission_controller",
+    "current_degradation",
+]
@@ -0,0 +1,149 @@
+"""准入控制：根据进行中的请求数、LLM 调用数与事件循环延迟计算降级等级"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any
+
+from config import config_manager
+from core.metrics import metrics_registry
+
+
+_degradation_level = metrics_registry.gauge(
+    "bridgetalk_degradation_level",
+    "当前降级等级（0=normal, 1=skip_gaps, 2=translate_only, 3=reject）",
+)
+_requests_in_flight = metrics_registry.gauge(
+    "bridgetalk_admission_in_flight",
+    "进行中的翻译请求数（含流式）",
+)
+_llm_in_flight = metrics_registry.gauge(
+    "bridgetalk_llm_in_flight",
+    "进行中（含排队）的 LLM 调用数",
+)
+_loop_lag = metrics_registry.gauge(
+    "bridgetalk_event_loop_lag_seconds",
+    "事件循环调度延迟（指数平滑）",
+)
+_admitted = metrics_registry.counter(
+    "bridgetalk_admission_admitted_total",
+    "按降级等级统计的已准入翻译请求数",
+    labels=("level",),
+)
+_rejected = metrics_registry.counter(
+    "bridgetalk_admission_rejected_total",
+    "过载时被拒绝（503）的翻译请求数",
+)
+
+# 事件循环延迟的平滑系数
+_LAG_SMOOTHING = 0.3
+
+
+class DegradationLevel(IntEnum):
+    """降级等级，数值越大降级越多"""
+
+    NORMAL = 0
+    SKIP_GAPS = 1  # 跳过缺失分析
+    TRANSLATE_ONLY = 2  # 视角识别也改用关键词规则，只调用 LLM 翻译
+    REJECT = 3  # 拒绝新请求
+
+
+_current_level: ContextVar[DegradationLevel] = ContextVar("degradation_level", default=DegradationLevel.NORMAL)
+
+
+def current_degradation() -> DegradationLevel:
+    """当前请求准入时的降级等级"""
+    return _current_level.get()
+
+
+class AdmissionController:
+    """准入控制器（进程内）
+
+    负载取各指标与其上限之比的最大值：达到 skip_gaps_at 跳过缺失分析，达到 translate_only_at 只保留翻译阶段，
+    达到 1 拒绝新请求。等级在请求准入时确定，已准入的请求不受后续负载变化影响。
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.llm_in_flight = 0
+        self.loop_lag = 0.0
+
+    def load(self) -> float:
+        """当前负载（1 表示达到上限）"""
+        admission_config = config_manager.admission
+        return max(
+            self.in_flight / admission_config.max_in_flight,
+            self.llm_in_flight / admission_config.max_llm_in_flight,
+            self.loop_lag / admission_config.max_loop_lag,
+        )
+
+    def level(self) -> DegradationLevel:
+        """按当前负载计算降级等级"""
+        admission_config = config_manager.admission
+        if not admission_config.enabled:
+            return DegradationLevel.NORMAL
+        load = self.load()
+        if load >= 1:
+            level = DegradationLevel.REJECT
+        elif load >= admission_config.translate_only_at:
+            level = DegradationLevel.TRANSLATE_ONLY
+        elif load >= admission_config.skip_gaps_at:
+            level = DegradationLevel.SKIP_GAPS
+        else:
+            level = DegradationLevel.NORMAL
+        _degradation_level.set(level)
+        return level
+
+    @contextmanager
+    def admit(self, level: DegradationLevel) -> Iterator[None]:
+        """在请求处理期间计入进行中请求，并将降级等级写入请求上下文"""
+        _admitted.inc(level=str(int(level)))
+        self.in_flight += 1
+        _requests_in_flight.set(self.in_flight)
+        token = _current_level.set(level)
+        try:
+            yield
+        finally:
+            _current_level.reset(token)
+            self.in_flight -= 1
+            _requests_in_flight.set(self.in_flight)
+
+    def reject(self) -> None:
+        """记录一次拒绝"""
+        _rejected.inc()
+
+    @contextmanager
+    def llm_call(self) -> Iterator[None]:
+        """计入一次进行中的 LLM 调用"""
+        self.llm_in_flight += 1
+        _llm_in_flight.set(self.llm_in_flight)
+        try:
+            yield
+        finally:
+            self.llm_in_flight -= 1
+            _llm_in_flight.set(self.llm_in_flight)
+
+    async def sample_loop_lag(self) -> None:
+        """采样事件循环延迟：让出一次调度后重新获得执行的耗时"""
+        started = time.monotonic()
+        await asyncio.sleep(0)
+        sample = time.monotonic() - started
+        self.loop_lag = self.loop_lag * (1 - _LAG_SMOOTHING) + sample * _LAG_SMOOTHING
+        _loop_lag.set(self.loop_lag)
+
+    def snapshot(self) -> dict[str, Any]:
+        """状态快照（健康检查使用）"""
+        return {
+            "level": int(self.level()),
+            "in_flight": self.in_flight,
+            "llm_in_flight": self.llm_in_flight,
+            "loop_lag": round(self.loop_lag, 4),
+        }
+
+
+admission_controller = AdmissionController()
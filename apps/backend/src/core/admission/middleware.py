@@ -0,0 +1,65 @@
+"""准入中间件：过载时拒绝新的翻译请求，并在响应中报告降级等级"""
+
+from __future__ import annotations
+
+import orjson
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import config_manager
+from core.admission.controller import DegradationLevel, admission_controller
+from core.api.response import error_response
+
+
+DEGRADATION_HEADER = "X-Degradation-Level"
+
+
+class AdmissionMiddleware:
+    """对 admission.paths 下的 POST 请求做准入控制
+
+    采用纯 ASGI 实现，流式响应在整个响应体发送期间都计入进行中请求。
+    准入的响应带 X-Degradation-Level 头；达到拒绝等级时返回 503 与 Retry-After。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or not self._protected(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        level = admission_controller.level()
+        if level is DegradationLevel.REJECT:
+            admission_controller.reject()
+            await self._reject(send)
+            return
+
+        async def send_with_level(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[DEGRADATION_HEADER] = str(int(level))
+            await send(message)
+
+        with admission_controller.admit(level):
+            await self.app(scope, receive, send_with_level)
+
+    @staticmethod
+    def _protected(path: str) -> bool:
+        return any(path.startswith(prefix) for prefix in config_manager.admission.paths)
+
+    @staticmethod
+    async def _reject(send: Send) -> None:
+        body = orjson.dumps(error_response("服务繁忙，请稍后重试", code=503).model_dump())
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(config_manager.admission.retry_after).encode()),
+                    (DEGRADATION_HEADER.lower().encode(), str(int(DegradationLevel.REJECT)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,29 @@
+"""不透明游标编解码，用于键集（keyset）分页。"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from typing import Any, cast
+
+import orjson
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """将排序键值编码为 URL 安全的不透明游标"""
+    raw = orjson.dumps(values)
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str) -> list[Any]:
+    """解码游标，格式非法时抛出 ValueError"""
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, orjson.JSONDecodeError) as exc:
+        msg = "无效的分页游标"
+        raise ValueError(msg) from exc
+    if isinstance(values, list):
+        return cast(list[Any], values)
+    msg = "无效的分页游标"
+    raise ValueError(msg)
@@ -0,0 +1,32 @@
+"""HTTP 条件请求工具：ETag 生成与 If-None-Match 匹配。"""
+
+from __future__ import annotations
+
+from fastapi import Response
+
+
+def make_etag(*parts: object, weak: bool = False) -> str:
+    """由若干组成部分生成 ETag"""
+    tag = '"' + ".".join(str(part) for part in parts) + '"'
+    return f"W/{tag}" if weak else tag
+
+
+def _opaque(tag: str) -> str:
+    """去掉弱校验前缀，得到不透明标签（If-None-Match 使用弱比较）"""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """判断 If-None-Match 头是否与当前 ETag 匹配"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = _opaque(etag)
+    return any(_opaque(candidate) == current for candidate in if_none_match.split(","))
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    """构建 304 Not Modified 响应"""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
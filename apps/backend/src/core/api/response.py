@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+import orjson
+from fastapi import Response
 from pydantic import BaseModel
 
 
@@ -29,6 +33,29 @@ def error_response(
     return CommonResponse(code=code, message=message, data=None)
 
 
+class FastJSONResponse(Response):
+    """orjson 编码的 JSON 响应
+
+    路由直接返回该响应时 FastAPI 跳过 response_model 的校验与序列化（response_model 仍用于生成 OpenAPI）；
+    内容须已是 orjson 可编码的结构（dict / list / UUID / datetime / orjson.Fragment 等）。
+    UTC 时间编码为 ``Z`` 后缀，与 Pydantic 的 JSON 输出一致。
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+def fast_success_response(
+    data: Any = None,
+    message: str = "success",
+    headers: dict[str, str] | None = None,
+) -> FastJSONResponse:
+    """构建成功响应（快速路径），结构与 CommonResponse 一致"""
+    return FastJSONResponse({"code": 200, "message": message, "data": data}, headers=headers)
+
+
 class PageParams(BaseModel):
     """分页参数"""
 
@@ -0,0 +1,6 @@
+"""冷数据归档模块"""
+
+from core.archive.segments import FrameLocation, LocalSegmentStore, SegmentWriter, read_frame_lines
+
+
+__all__ = ["FrameLocation", "LocalSegmentStore", "SegmentWriter", "read_frame_lines"]
@@ -0,0 +1,123 @@
+"""zstd 压缩的 JSONL 段文件
+
+段文件由若干独立的 zstd 帧顺序拼接而成，每帧包含若干条 JSON 行。
+索引只需记录记录所在帧的 (偏移量, 长度)：读取单条记录时 seek 到帧起点、读取并解压这一帧，
+无需解压整个段文件。拼接后的文件仍是合法的 zstd 流，可直接用 ``zstd -dc`` 整体解压。
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+try:
+    import zstandard
+except ImportError:  # 可选依赖：pip install "bridgetalk[archive]"
+    zstandard = None
+
+
+def _require_zstandard() -> Any:
+    if zstandard is None:
+        msg = "归档功能需要安装 zstandard：pip install 'bridgetalk[archive]'"
+        raise RuntimeError(msg)
+    return zstandard
+
+
+@dataclass(frozen=True)
+class FrameLocation:
+    """帧在段文件中的位置"""
+
+    offset: int
+    length: int
+
+
+class SegmentWriter:
+    """在内存中构建段文件内容
+
+    记录按写入顺序累积，未压缩大小达到 frame_size 时封装为一个独立帧。
+    """
+
+    def __init__(self, frame_size: int = 256 * 1024, level: int = 10) -> None:
+        self.frame_size = frame_size
+        self._compressor = _require_zstandard().ZstdCompressor(level=level, write_content_size=True)
+        self._buffer = io.BytesIO()
+        self._pending: list[bytes] = []
+        self._pending_keys: list[str] = []
+        self._pending_size = 0
+        self.locations: dict[str, FrameLocation] = {}
+
+    def add(self, key: str, record: dict[str, Any]) -> None:
+        """追加一条记录，key 为索引键（通常是记录 ID）"""
+        line = orjson.dumps(record) + b"\n"
+        self._pending.append(line)
+        self._pending_keys.append(key)
+        self._pending_size += len(line)
+        if self._pending_size >= self.frame_size:
+            self._flush_frame()
+
+    def _flush_frame(self) -> None:
+        if not self._pending:
+            return
+        frame = self._compressor.compress(b"".join(self._pending))
+        location = FrameLocation(offset=self._buffer.tell(), length=len(frame))
+        self._buffer.write(frame)
+        for key in self._pending_keys:
+            self.locations[key] = location
+        self._pending.clear()
+        self._pending_keys.clear()
+        self._pending_size = 0
+
+    def finish(self) -> bytes:
+        """封装剩余记录并返回完整段文件内容"""
+        self._flush_frame()
+        return self._buffer.getvalue()
+
+
+def read_frame_lines(frame: bytes) -> Iterator[dict[str, Any]]:
+    """解压单个帧并逐行解析"""
+    data = _require_zstandard().ZstdDecompressor().decompress(frame)
+    for line in data.splitlines():
+        if line:
+            yield orjson.loads(line)
+
+
+class LocalSegmentStore:
+    """本地目录段文件存储（同步接口，调用方通过 asyncio.to_thread 执行）
+
+    也可指向挂载的对象存储目录（如 s3fs / ossfs）。
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def write(self, name: str, data: bytes) -> None:
+        """原子写入段文件：先写临时文件并落盘，再重命名"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        target = self.directory / name
+        temp = target.with_suffix(target.suffix + ".tmp")
+        with temp.open("wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        temp.replace(target)
+
+    def read_range(self, name: str, offset: int, length: int) -> bytes:
+        """读取段文件中的一段字节"""
+        with (self.directory / name).open("rb") as file:
+            file.seek(offset)
+            data = file.read(length)
+        if len(data) != length:
+            msg = f"归档段文件不完整: {name}"
+            raise OSError(msg)
+        return data
+
+    def delete(self, name: str) -> None:
+        """删除段文件（归档事务失败时清理）"""
+        (self.directory / name).unlink(missing_ok=True)
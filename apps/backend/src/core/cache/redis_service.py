@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from functools import lru_cache
-from typing import cast
+from typing import Any, cast
 
 import redis.asyncio as redis
 from redis.asyncio import ConnectionPool, Redis
+from redis.commands.core import AsyncScript
 from redis.exceptions import RedisError
 
 from config import config_manager
 from core.logging import get_logger
+from core.metrics import metrics_registry
 
 
 logger = get_logger(__name__)
 _DEFAULT_PREFIX = "bridgetalk"
 
+_cache_requests = metrics_registry.counter(
+    "bridgetalk_cache_requests_total",
+    "读穿缓存请求次数（result: hit / miss）",
+    ("namespace", "result"),
+)
+
 
 class RedisService:
     """Redis 服务（单实例）"""
@@ -24,6 +32,7 @@ class RedisService:
     def __init__(self) -> None:
         self._client: Redis | None = None
         self._key_prefix = _DEFAULT_PREFIX
+        self._scripts: dict[str, AsyncScript] = {}
         self._initialize_client()
 
     def _initialize_client(self) -> None:
@@ -82,6 +91,36 @@ class RedisService:
             logger.exception("Redis GET 失败: %s", prefixed_key)
             return None
 
+    async def read_through[T](
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T | None]],
+        *,
+        encode: Callable[[T], bytes],
+        decode: Callable[[str | bytes], T],
+        ex: int | None = None,
+        namespace: str = "default",
+    ) -> T | None:
+        """读穿缓存：命中直接返回，未命中时调用 loader 加载并回填
+
+        Redis 不可用或缓存内容无法解码时按未命中处理，loader 返回 None 时不回填。
+        """
+        cached = await self.get(key)
+        if cached is not None:
+            try:
+                value = decode(cached)
+            except ValueError:
+                logger.warning("缓存内容解码失败，回源加载: %s", self._build_key(key))
+            else:
+                _cache_requests.inc(namespace=namespace, result="hit")
+                return value
+        _cache_requests.inc(namespace=namespace, result="miss")
+
+        value = await loader()
+        if value is not None:
+            await self.set(key, encode(value), ex=ex)
+        return value
+
     async def delete(self, *keys: str) -> int:
         """DELETE 操作（自动添加前缀）"""
         if not keys or self._client is None:
@@ -105,6 +144,30 @@ class RedisService:
             logger.exception("Redis EXPIRE 失败: %s", prefixed_key)
             return False
 
+    async def run_script(
+        self,
+        script: str,
+        keys: Sequence[str],
+        args: Sequence[str | int | float] = (),
+    ) -> Any:
+        """执行 Lua 脚本（自动添加 key 前缀）
+
+        脚本按内容注册一次，之后通过 EVALSHA 执行，服务端脚本缓存丢失时自动回退 EVAL。
+        执行失败时记录日志并返回 None。
+        """
+        if self._client is None:
+            logger.error("Redis 客户端未初始化")
+            return None
+        if (registered := self._scripts.get(script)) is None:
+            registered = self._client.register_script(script)
+            self._scripts[script] = registered
+        prefixed_keys = [self._build_key(key) for key in keys]
+        try:
+            return await registered(keys=prefixed_keys, args=list(args))
+        except (RedisError, ValueError):
+            logger.exception("Redis 脚本执行失败: %s", prefixed_keys)
+            return None
+
     async def scan_iter(self, match: str) -> AsyncIterator[str]:
         """SCAN 迭代器（自动添加前缀到 match 模式）"""
         if self._client is None:
@@ -1,5 +1,14 @@
 """请求上下文模块"""
 
+from core.context.deadline import (
+    DeadlineExceededError,
+    clear_deadline,
+    remaining_time,
+    request_deadline,
+    set_deadline,
+    stage_budget,
+    stage_timeout,
+)
 from core.context.request import (
     RequestContext,
     RequestContextParams,
@@ -11,10 +20,17 @@ from core.context.request import (
 
 
 __all__ = [
+    "DeadlineExceededError",
     "RequestContext",
     "RequestContextParams",
+    "clear_deadline",
     "clear_request_context",
     "current_realm",
     "get_request_context",
+    "remaining_time",
+    "request_deadline",
+    "set_deadline",
     "set_request_context",
+    "stage_budget",
+    "stage_timeout",
 ]
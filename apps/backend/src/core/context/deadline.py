@@ -0,0 +1,70 @@
+"""请求时限：截止时间保存在上下文变量中，随请求传递到各处理阶段"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextvars import ContextVar
+
+from config import config_manager
+
+
+# 截止时间（time.monotonic() 时钟），None 表示不限时
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceededError(TimeoutError):
+    """请求时限已耗尽"""
+
+
+def request_deadline(header_value: str | None = None) -> float:
+    """计算请求的截止时间：优先使用请求头指定的秒数（不超过配置上限），否则使用配置的默认时限
+
+    请求头非法时忽略，使用默认时限。
+    """
+    deadline_config = config_manager.deadline
+    seconds = deadline_config.default_seconds
+    if header_value:
+        try:
+            requested = float(header_value)
+        except ValueError:
+            requested = 0.0
+        if requested > 0:
+            seconds = min(requested, deadline_config.max_seconds)
+    return time.monotonic() + seconds
+
+
+def set_deadline(deadline: float | None) -> None:
+    """设置当前请求的截止时间"""
+    _deadline.set(deadline)
+
+
+def clear_deadline() -> None:
+    """清理当前请求的截止时间"""
+    _deadline.set(None)
+
+
+def remaining_time() -> float | None:
+    """当前请求的剩余时间（秒），未设置截止时间时返回 None"""
+    if (deadline := _deadline.get()) is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def stage_budget(share: float = 1.0, reserve: float = 0.0) -> float | None:
+    """当前阶段可用的时间：为后续阶段预留 reserve 秒后，最多占用剩余时间的 share
+
+    未设置截止时间时返回 None（不限时）；可用时间不足时抛出 DeadlineExceededError。
+    """
+    if (remaining := remaining_time()) is None:
+        return None
+    budget = min(remaining - reserve, remaining * share)
+    if budget <= 0:
+        msg = f"请求剩余时间不足（剩余 {max(remaining, 0):.1f} 秒）"
+        raise DeadlineExceededError(msg)
+    return budget
+
+
+def stage_timeout(share: float = 1.0, reserve: float = 0.0) -> asyncio.Timeout:
+    """当前阶段的超时上下文（见 stage_budget），超时抛出 TimeoutError"""
+    return asyncio.timeout(stage_budget(share, reserve))
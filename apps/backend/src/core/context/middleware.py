@@ -0,0 +1,63 @@
+"""请求上下文中间件：从网关注入的请求头建立 RequestContext"""
+
+from __future__ import annotations
+
+import re
+
+import orjson
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from config import config_manager
+from core.api.response import error_response
+from core.context.request import RequestContextParams, clear_request_context, set_request_context
+
+
+# 租户名会拼入 Redis key 与缓存 key，只允许安全字符
+_REALM_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+_USERNAME_MAX_LENGTH = 128
+
+
+class RequestContextMiddleware:
+    """为每个 HTTP 请求设置请求上下文
+
+    采用纯 ASGI 实现，上下文在整个请求（包括流式响应体的生成）期间有效；
+    未携带租户头时使用默认租户，租户头非法时直接拒绝请求。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        server_config = config_manager.server
+        headers = Headers(scope=scope)
+        params = RequestContextParams(request_id=headers.get("x-request-id"))
+        if realm := headers.get(server_config.realm_header):
+            if not _REALM_PATTERN.match(realm):
+                await self._reject(send, f"无效的租户标识: {server_config.realm_header}")
+                return
+            params.realm = realm
+        if username := headers.get(server_config.username_header):
+            params.username = username[:_USERNAME_MAX_LENGTH]
+
+        set_request_context(params)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            clear_request_context()
+
+    @staticmethod
+    async def _reject(send: Send, message: str) -> None:
+        body = orjson.dumps(error_response(message, code=400).model_dump())
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
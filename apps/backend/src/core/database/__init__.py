@@ -5,7 +5,7 @@ from __future__ import annotations
 from sqlalchemy import MetaData
 
 from .base import Base
-from .state import DatabaseRegistry, database_registry
+from .state import DatabaseRegistry, ReplicaState, database_registry
 
 
 def get_metadata() -> MetaData:
@@ -16,6 +16,7 @@ def get_metadata() -> MetaData:
 __all__ = [
     "Base",
     "DatabaseRegistry",
+    "ReplicaState",
     "database_registry",
     "get_metadata",
 ]
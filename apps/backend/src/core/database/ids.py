@@ -0,0 +1,35 @@
+"""时间有序的 UUID（UUIDv7，RFC 9562）。
+
+ID 的高 48 位为毫秒时间戳：新记录在索引中按时间追加，且可以从 ID 反推创建时间，
+用于按 created_at 分区的表在主键查询时做分区裁剪。
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import uuid
+from datetime import UTC, datetime
+
+
+_VERSION = 7
+
+
+def uuid7() -> uuid.UUID:
+    """生成 UUIDv7"""
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10))
+    rand_a = rand >> 62 & 0x0FFF
+    rand_b = rand & 0x3FFF_FFFF_FFFF_FFFF
+    value = timestamp_ms << 80 | _VERSION << 76 | rand_a << 64 | 0b10 << 62 | rand_b
+    return uuid.UUID(int=value)
+
+
+def uuid7_time(value: uuid.UUID) -> datetime | None:
+    """提取 UUIDv7 中的时间戳，非 v7 的 ID 返回 None"""
+    if value.version != _VERSION:
+        return None
+    return datetime.fromtimestamp(int.from_bytes(value.bytes[:6]) / 1000, tz=UTC)
+
+
+__all__ = ["uuid7", "uuid7_time"]
@@ -0,0 +1,148 @@
+"""按月范围分区的维护：预建未来分区、按保留期分离或删除过期分区。"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def _empty_names() -> list[str]:
+    return []
+
+
+def month_start(value: date) -> date:
+    """所在月份的第一天"""
+    return value.replace(day=1)
+
+
+def add_months(value: date, months: int) -> date:
+    """月份加减（value 须为月初）"""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+@dataclass
+class PartitionReport:
+    """分区维护结果"""
+
+    created: list[str] = field(default_factory=_empty_names)
+    detached: list[str] = field(default_factory=_empty_names)
+    dropped: list[str] = field(default_factory=_empty_names)
+
+
+class MonthlyPartitionManager:
+    """按月 RANGE 分区管理器
+
+    分区命名为 ``{table}_pYYYY_MM``，区间为 [月初, 下月初)，边界按 UTC 计算。
+    维护操作持有事务级 advisory lock，多实例同时执行时串行化。
+    """
+
+    def __init__(self, table: str) -> None:
+        self.table = table
+        self._name_pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})_(\d{{2}})$")
+
+    def partition_name(self, month: date) -> str:
+        """分区表名"""
+        return f"{self.table}_p{month.year:04d}_{month.month:02d}"
+
+    async def list_partitions(self, session: AsyncSession) -> dict[date, str]:
+        """列出已挂载的按月分区：月初 -> 分区表名"""
+        result = await session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = CAST(:table AS regclass)"
+            ),
+            {"table": self.table},
+        )
+        partitions: dict[date, str] = {}
+        for name in result.scalars():
+            if match := self._name_pattern.match(name):
+                partitions[date(int(match[1]), int(match[2]), 1)] = name
+        return partitions
+
+    async def _lock(self, session: AsyncSession) -> None:
+        await session.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": f"partition:{self.table}"})
+
+    async def ensure_partitions(self, session: AsyncSession, months_ahead: int, today: date | None = None) -> list[str]:
+        """确保当前月及未来 months_ahead 个月的分区存在"""
+        current = month_start(today or datetime.now(UTC).date())
+        await self._lock(session)
+        existing = await self.list_partitions(session)
+        created: list[str] = []
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            if month in existing:
+                continue
+            name = self.partition_name(month)
+            lower = f"{month.isoformat()} 00:00:00+00"
+            upper = f"{add_months(month, 1).isoformat()} 00:00:00+00"
+            await session.execute(
+                text(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{self.table}" '
+                    f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+                )
+            )
+            created.append(name)
+        return created
+
+    async def expire_partitions(
+        self,
+        session: AsyncSession,
+        retention_months: int,
+        *,
+        drop: bool,
+        today: date | None = None,
+    ) -> PartitionReport:
+        """分离（drop=True 时同时删除）整体早于保留期的分区
+
+        保留当前月及之前 retention_months 个月的分区，替代逐行 DELETE。
+        """
+        cutoff = add_months(month_start(today or datetime.now(UTC).date()), -retention_months)
+        report = PartitionReport()
+        await self._lock(session)
+        for month, name in sorted((await self.list_partitions(session)).items()):
+            if add_months(month, 1) > cutoff:
+                continue
+            await session.execute(text(f'ALTER TABLE "{self.table}" DETACH PARTITION "{name}"'))
+            report.detached.append(name)
+            if drop:
+                await session.execute(text(f'DROP TABLE "{name}"'))
+                report.dropped.append(name)
+        return report
+
+    async def maintain(
+        self,
+        session: AsyncSession,
+        *,
+        months_ahead: int,
+        retention_months: int | None,
+        drop: bool,
+    ) -> PartitionReport:
+        """执行一次完整维护（调用方负责提交事务）"""
+        report = PartitionReport(created=await self.ensure_partitions(session, months_ahead))
+        if retention_months is not None:
+            expired = await self.expire_partitions(session, retention_months, drop=drop)
+            report.detached = expired.detached
+            report.dropped = expired.dropped
+        if report.created or report.detached:
+            logger.info(
+                "分区维护完成: %s 新建=%s 分离=%s 删除=%s",
+                self.table,
+                report.created,
+                report.detached,
+                report.dropped,
+            )
+        return report
+
+
+__all__ = ["MonthlyPartitionManager", "PartitionReport", "add_months", "month_start"]
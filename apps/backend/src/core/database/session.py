@@ -3,22 +3,61 @@
 from __future__ import annotations
 
 import asyncio
+import random
 import subprocess
 import sys
+import time
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from config import config_manager
-from core.database import database_registry
+from core.context.request import get_request_context
+from core.database import ReplicaState, database_registry
 from core.logging import get_logger
+from core.metrics import metrics_registry
 
 
 logger = get_logger(__name__)
 _DEFAULT_REALM = "default"
 _MIGRATION_CMD = [sys.executable, "-m", "alembic", "upgrade", "head"]
 
+# 副本复制延迟：不在恢复模式（非副本）视为 0；WAL 已全部回放视为 0；否则为最后回放事务距今的时间
+_REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+    END
+""")
+
+# 写后读：(租户, 用户) -> 固定走主库的截止时间（time.monotonic）
+_primary_pins: dict[tuple[str, str], float] = {}
+_PIN_PRUNE_THRESHOLD = 1024
+
+_read_routes = metrics_registry.counter(
+    "bridgetalk_db_read_route_total",
+    "只读查询的路由目标（target: replica / primary；回退主库时 reason: pinned / lag）",
+    ("target", "reason"),
+)
+_replica_lag = metrics_registry.gauge(
+    "bridgetalk_db_replica_lag_seconds",
+    "只读副本复制延迟（秒），不可用时为 -1",
+    ("replica",),
+)
+
+
+def _get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """获取已注册的 SessionFactory。"""
+    session_factory = database_registry.get_session_factory(_DEFAULT_REALM)
+    if session_factory is None:
+        msg = "数据库 SessionFactory 未初始化"
+        raise RuntimeError(msg)
+    return session_factory
+
 
 async def db_session() -> AsyncGenerator[AsyncSession]:
     """
@@ -27,11 +66,80 @@ async def db_session() -> AsyncGenerator[AsyncSession]:
     - 每次调用创建一个新的 AsyncSession
     - 请求结束时自动关闭 Session, 连接归还到连接池
     """
-    session_factory = database_registry.get_session_factory(_DEFAULT_REALM)
-    if session_factory is None:
-        msg = "数据库 SessionFactory 未初始化"
-        raise RuntimeError(msg)
-    async with session_factory() as session:
+    async with _get_session_factory()() as session:
+        yield session
+
+
+def mark_primary_write() -> None:
+    """记录当前用户刚完成写入，随后的读请求在 read_your_writes_window 内固定走主库"""
+    db_config = config_manager.database
+    if not db_config.replicas:
+        return
+    context = get_request_context()
+    now = time.monotonic()
+    # 窗口不短于允许的最大延迟，保证窗口结束后副本一定已回放该写入
+    _primary_pins[(context.realm, context.username)] = now + max(
+        db_config.read_your_writes_window, db_config.replica_max_lag
+    )
+    if len(_primary_pins) > _PIN_PRUNE_THRESHOLD:
+        for key in [key for key, expires in _primary_pins.items() if expires <= now]:
+            del _primary_pins[key]
+
+
+def _pinned_to_primary() -> bool:
+    context = get_request_context()
+    key = (context.realm, context.username)
+    if (expires := _primary_pins.get(key)) is None:
+        return False
+    if expires > time.monotonic():
+        return True
+    _primary_pins.pop(key, None)
+    return False
+
+
+def _get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    """选择只读查询的 SessionFactory：延迟达标的副本优先，否则回退主库"""
+    replicas = database_registry.get_replicas(_DEFAULT_REALM)
+    if not replicas:
+        return _get_session_factory()
+    if _pinned_to_primary():
+        _read_routes.inc(target="primary", reason="pinned")
+        return _get_session_factory()
+    available = [replica for replica in replicas if replica.available(config_manager.database.replica_max_lag)]
+    if not available:
+        _read_routes.inc(target="primary", reason="lag")
+        return _get_session_factory()
+    _read_routes.inc(target="replica", reason="")
+    return random.choice(available).session_factory  # noqa: S311
+
+
+async def db_read_session() -> AsyncGenerator[AsyncSession]:
+    """
+    提供只读查询的 AsyncSession 依赖。
+
+    配置了只读副本时路由到复制延迟达标的副本；无可用副本或当前用户刚写入过时使用主库。
+    只能用于不写入的查询。
+    """
+    async with _get_read_session_factory()() as session:
+        yield session
+
+
+@asynccontextmanager
+async def read_session_scope() -> AsyncGenerator[AsyncSession]:
+    """短生命周期的只读 AsyncSession，路由规则同 db_read_session"""
+    async with _get_read_session_factory()() as session:
+        yield session
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncGenerator[AsyncSession]:
+    """
+    提供短生命周期的 AsyncSession。
+
+    用于流式等长耗时请求：仅在真正读写数据库时借出连接，退出上下文立即归还连接池，
+    避免连接在整个 LLM 调用期间被占用。
+    """
+    async with _get_session_factory()() as session:
         yield session
 
 
@@ -62,16 +170,55 @@ async def initialize_db_engines() -> AsyncEngine:
     session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
     database_registry.register_session_factory(_DEFAULT_REALM, session_factory)
 
+    for index, replica_config in enumerate(db_config.replicas):
+        replica_engine = create_async_engine(
+            db_config.build_replica_url(replica_config),
+            pool_size=replica_config.pool_size or db_config.pool_size,
+            max_overflow=db_config.max_overflow,
+            pool_timeout=db_config.pool_timeout,
+            pool_recycle=db_config.pool_recycle,
+            pool_pre_ping=db_config.pool_pre_ping,
+            echo=False,
+        )
+        database_registry.register_replica(
+            _DEFAULT_REALM,
+            ReplicaState(
+                name=f"replica-{index}",
+                engine=replica_engine,
+                session_factory=async_sessionmaker(bind=replica_engine, class_=AsyncSession, expire_on_commit=False),
+            ),
+        )
+        logger.info("Read replica engine initialized: replica-%s (%s)", index, replica_config.host)
+
     logger.info("Database engine initialized")
     return engine
 
 
+async def check_replica_lag() -> None:
+    """检测所有只读副本的复制延迟（由周期任务调用），结果用于读请求路由"""
+    for replica in database_registry.get_replicas(_DEFAULT_REALM):
+        previous = replica.lag
+        try:
+            async with replica.engine.connect() as conn:
+                lag = (await conn.execute(_REPLICA_LAG_SQL)).scalar_one()
+            replica.lag = max(float(lag), 0.0) if lag is not None else None
+        except Exception:
+            replica.lag = None
+            if previous is not None:
+                logger.warning("Read replica unavailable: %s", replica.name, exc_info=True)
+        _replica_lag.set(replica.lag if replica.lag is not None else -1, replica=replica.name)
+        if previous is None and replica.lag is not None:
+            logger.info("Read replica available: %s (lag %.3fs)", replica.name, replica.lag)
+
+
 async def close_db_engines() -> None:
     """关闭数据库引擎。"""
     engine = database_registry.get_engine(_DEFAULT_REALM)
     if engine is not None:
         await engine.dispose()
         logger.info("Database engine disposed")
+    for replica in database_registry.get_replicas(_DEFAULT_REALM):
+        await replica.engine.dispose()
     database_registry.clear()
 
 
@@ -19,12 +19,32 @@ def _empty_session_factories() -> dict[str, async_sessionmaker[AsyncSession]]:
     return {}
 
 
+def _empty_replicas() -> dict[str, list[ReplicaState]]:
+    return {}
+
+
+@dataclass
+class ReplicaState:
+    """只读副本的引擎与最近一次检测到的复制延迟。"""
+
+    name: str
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    lag: float | None = None  # 复制延迟（秒），None 表示尚未检测或不可用
+
+    def available(self, max_lag: float) -> bool:
+        """副本可用且延迟不超过 max_lag。"""
+
+        return self.lag is not None and self.lag <= max_lag
+
+
 @dataclass
 class DatabaseRegistry:
     """记录多租户数据库资源的注册表。"""
 
     _engines: dict[str, AsyncEngine] = field(default_factory=_empty_engines)
     _session_factories: dict[str, async_sessionmaker[AsyncSession]] = field(default_factory=_empty_session_factories)
+    _replicas: dict[str, list[ReplicaState]] = field(default_factory=_empty_replicas)
 
     def register_engine(self, realm: str, engine: AsyncEngine) -> None:
         """注册或更新指定租户的 AsyncEngine。"""
@@ -46,6 +66,16 @@ class DatabaseRegistry:
 
         return self._session_factories.get(realm)
 
+    def register_replica(self, realm: str, replica: ReplicaState) -> None:
+        """为指定租户追加一个只读副本。"""
+
+        self._replicas.setdefault(realm, []).append(replica)
+
+    def get_replicas(self, realm: str) -> list[ReplicaState]:
+        """获取指定租户的所有只读副本。"""
+
+        return list(self._replicas.get(realm, ()))
+
     def engines(self) -> Mapping[str, AsyncEngine]:
         """返回所有已注册引擎的只读视图。"""
 
@@ -61,9 +91,10 @@ class DatabaseRegistry:
 
         self._engines.clear()
         self._session_factories.clear()
+        self._replicas.clear()
 
 
 # 默认注册表实例，供未通过容器注入的模块使用。
 database_registry = DatabaseRegistry()
 
-__all__ = ["DatabaseRegistry", "database_registry"]
+__all__ = ["DatabaseRegistry", "ReplicaState", "database_registry"]
@@ -0,0 +1,6 @@
+"""指标模块"""
+
+from core.metrics.registry import Counter, Gauge, Histogram, MetricsRegistry, metrics_registry
+
+
+__all__ = ["Counter", "Gauge", "Histogram", "MetricsRegistry", "metrics_registry"]
@@ -0,0 +1,6 @@
+"""分布式限流模块"""
+
+from core.ratelimit.limiter import RateLimiter, RateLimitResult
+
+
+__all__ = ["RateLimitResult", "RateLimiter"]
@@ -0,0 +1,120 @@
+"""分布式限流：Redis 令牌桶，按租户 + 用户分别限制请求数与估算的 LLM token 数
+
+每个租户用户一个哈希 ``ratelimit:{realm}:{username}``，保存两个令牌桶的剩余量与上次补充时间。
+检查与扣减在一个 Lua 脚本中原子完成（一次 EVALSHA 往返），时间取 Redis 服务端 TIME，多实例间无时钟偏差。
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from config import config_manager
+from core.cache.redis_service import RedisService
+from core.context.request import get_request_context
+from core.logging import get_logger
+from core.metrics import metrics_registry
+
+
+logger = get_logger(__name__)
+
+_rate_limit_checks = metrics_registry.counter(
+    "bridgetalk_rate_limit_checks_total",
+    "限流检查次数（result: allowed / limited / error）",
+    labels=("result",),
+)
+
+# KEYS[1] 桶哈希；ARGV: 请求容量, 请求每秒补充量, token 容量, token 每秒补充量, 本次 token 消耗
+# 返回 {是否放行, 请求剩余, token 剩余, 需等待秒数}（小数以字符串返回，避免被截断为整数）
+_BUCKET_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local request_capacity, request_rate = tonumber(ARGV[1]), tonumber(ARGV[2])
+local token_capacity, token_rate = tonumber(ARGV[3]), tonumber(ARGV[4])
+local cost = math.min(tonumber(ARGV[5]), token_capacity)
+local state = redis.call('HMGET', KEYS[1], 'requests', 'tokens', 'ts')
+local elapsed = math.max(now - (tonumber(state[3]) or now), 0)
+local requests = math.min(request_capacity, (tonumber(state[1]) or request_capacity) + elapsed * request_rate)
+local tokens = math.min(token_capacity, (tonumber(state[2]) or token_capacity) + elapsed * token_rate)
+local allowed = 0
+local wait = 0
+if requests >= 1 and tokens >= cost then
+  requests = requests - 1
+  tokens = tokens - cost
+  allowed = 1
+else
+  if requests < 1 then
+    wait = math.max(wait, (1 - requests) / request_rate)
+  end
+  if tokens < cost then
+    wait = math.max(wait, (cost - tokens) / token_rate)
+  end
+end
+redis.call('HSET', KEYS[1], 'requests', requests, 'tokens', tokens, 'ts', now)
+local refill = math.max((request_capacity - requests) / request_rate, (token_capacity - tokens) / token_rate)
+redis.call('EXPIRE', KEYS[1], math.ceil(refill) + 1)
+return {allowed, tostring(requests), tostring(tokens), tostring(wait)}
+"""
+
+
+def _empty_headers() -> dict[str, str]:
+    return {}
+
+
+@dataclass
+class RateLimitResult:
+    """限流检查结果，headers 为应返回给客户端的限流响应头"""
+
+    allowed: bool = True
+    retry_after: int = 0
+    headers: dict[str, str] = field(default_factory=_empty_headers)
+
+
+class RateLimiter:
+    """按租户 + 用户的令牌桶限流器"""
+
+    def __init__(self, redis: RedisService) -> None:
+        self.redis = redis
+
+    async def check(self, tokens: int) -> RateLimitResult:
+        """检查当前请求上下文的租户用户能否再发起一次消耗 tokens 个估算 token 的请求，能则扣减
+
+        未启用或 Redis 不可用时放行（不返回限流头）。
+        """
+        rate_config = config_manager.rate_limit
+        if not rate_config.enabled:
+            return RateLimitResult()
+        context = get_request_context()
+        request_rate = rate_config.requests_per_minute / 60
+        token_rate = rate_config.tokens_per_minute / 60
+        raw = await self.redis.run_script(
+            _BUCKET_SCRIPT,
+            [f"ratelimit:{context.realm}:{context.username}"],
+            [rate_config.request_burst, request_rate, rate_config.token_burst, token_rate, tokens],
+        )
+        if raw is None:
+            _rate_limit_checks.inc(result="error")
+            return RateLimitResult()
+        allowed, requests_left, tokens_left, wait = cast(list[Any], raw)
+        result = RateLimitResult(allowed=allowed == 1, retry_after=math.ceil(float(wait)))
+        # 以剩余比例更低的桶作为 RateLimit-Limit / Remaining / Reset
+        limit, remaining, refill_rate = min(
+            (rate_config.request_burst, float(requests_left), request_rate),
+            (rate_config.token_burst, float(tokens_left), token_rate),
+            key=lambda bucket: bucket[1] / bucket[0],
+        )
+        result.headers = {
+            "RateLimit-Policy": (
+                f'"requests";q={rate_config.request_burst};w={math.ceil(rate_config.request_burst / request_rate)}, '
+                f'"tokens";q={rate_config.token_burst};w={math.ceil(rate_config.token_burst / token_rate)}'
+            ),
+            "RateLimit-Limit": str(limit),
+            "RateLimit-Remaining": str(math.floor(remaining)),
+            "RateLimit-Reset": str(math.ceil((limit - remaining) / refill_rate)),
+        }
+        if not result.allowed:
+            result.headers["Retry-After"] = str(result.retry_after)
+            logger.info("触发限流: realm=%s username=%s retry_after=%s", context.realm, context.username, wait)
+        _rate_limit_checks.inc(result="allowed" if result.allowed else "limited")
+        return result
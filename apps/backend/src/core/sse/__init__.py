@@ -2,6 +2,7 @@
 
 from core.sse.events import (
     SSEEventType,
+    encode_sse,
     sse_content_delta,
     sse_error,
     sse_event,
@@ -9,10 +10,13 @@ from core.sse.events import (
     sse_message_start,
     sse_ping,
 )
+from core.sse.stream import encode_event_stream
 
 
 __all__ = [
     "SSEEventType",
+    "encode_event_stream",
+    "encode_sse",
     "sse_content_delta",
     "sse_error",
     "sse_event",
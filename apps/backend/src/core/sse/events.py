@@ -78,3 +78,13 @@ def sse_ping() -> dict[str, str]:
 def sse_event(event_type: str, data: dict[str, Any]) -> str:
     """生成通用 SSE 事件字符串"""
     return f"event: {event_type}\ndata: {_to_json(data)}\n\n"
+
+
+_EVENT_PREFIXES: dict[str, bytes] = {}
+
+
+def encode_sse(event_type: str, data: Any) -> bytes:
+    """直接编码为 SSE 事件字节（orjson 输出不含换行，无需拆分 data 行）"""
+    if (prefix := _EVENT_PREFIXES.get(event_type)) is None:
+        prefix = _EVENT_PREFIXES.setdefault(event_type, f"event: {event_type}\ndata: ".encode())
+    return prefix + orjson.dumps(data) + b"\n\n"
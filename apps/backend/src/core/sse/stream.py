@@ -0,0 +1,220 @@
+"""SSE 事件流编码：上游与客户端解耦、合并连续的内容增量"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from typing import Any, Literal
+
+from core.logging import get_logger
+from core.metrics import metrics_registry
+from core.sse.events import encode_sse
+
+
+logger = get_logger(__name__)
+
+SlowClientPolicy = Literal["finish", "cancel"]
+
+_sse_events = metrics_registry.counter(
+    "bridgetalk_sse_events_total",
+    "SSE 流收到的事件数（kind=delta 为合并前的内容增量）",
+    labels=("kind",),
+)
+_sse_writes = metrics_registry.counter(
+    "bridgetalk_sse_writes_total",
+    "SSE 流写出的响应块数",
+)
+_client_lag = metrics_registry.histogram(
+    "bridgetalk_sse_client_lag_seconds",
+    "事件从上游产生到写给客户端的延迟",
+)
+_buffered_bytes = metrics_registry.histogram(
+    "bridgetalk_sse_buffered_bytes",
+    "每次写出时流缓冲中积压的字节数",
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576),
+)
+_disconnects = metrics_registry.counter(
+    "bridgetalk_sse_disconnects_total",
+    "上游完成前断开的客户端数",
+)
+_slow_clients = metrics_registry.counter(
+    "bridgetalk_sse_slow_clients_total",
+    "缓冲超过上限而被断开的慢客户端数",
+    labels=("policy",),
+)
+
+# policy=finish 时被断开客户端的上游任务，保持引用直至完成
+_detached: set[asyncio.Task[None]] = set()
+
+
+class _StreamBuffer:
+    """单个流的有界缓冲：后台任务全速读取上游，事件编码后暂存，连续的内容增量合并为一项
+
+    客户端读取过慢、积压超过 max_bytes 时标记 overflow，由写出端断开客户端。
+    """
+
+    def __init__(self, events: AsyncIterator[Mapping[str, Any]], *, max_bytes: int, delta_event: str) -> None:
+        self.max_bytes = max_bytes
+        self.delta_event = delta_event
+        # 每项为 [产生时间, 已编码事件 bytes 或 增量片段 list[str]]
+        self.items: deque[list[Any]] = deque()
+        self.size = 0
+        self.done = False
+        self.overflow = False
+        self.error: BaseException | None = None
+        self.changed = asyncio.Event()
+        self.cancelled = False
+        self.task = asyncio.create_task(self._produce(events))
+        self.watcher: asyncio.Task[None] | None = None
+
+    async def _produce(self, events: AsyncIterator[Mapping[str, Any]]) -> None:
+        try:
+            async for event in events:
+                if self.overflow:
+                    continue  # 客户端已断开，继续读完上游（policy=finish）但不再暂存
+                self._append(event)
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self.done = True
+            self.changed.set()
+
+    def _append(self, event: Mapping[str, Any]) -> None:
+        if event["event"] == self.delta_event:
+            _sse_events.inc(kind="delta")
+            delta: str = event["data"]["delta"]
+            if self.items and isinstance(self.items[-1][1], list):
+                self.items[-1][1].append(delta)
+            else:
+                self.items.append([time.monotonic(), [delta]])
+            self.size += len(delta.encode())
+        else:
+            _sse_events.inc(kind="other")
+            encoded = encode_sse(event["event"], event["data"])
+            self.items.append([time.monotonic(), encoded])
+            self.size += len(encoded)
+        if self.size > self.max_bytes:
+            self.overflow = True
+        self.changed.set()
+
+    @property
+    def only_deltas(self) -> bool:
+        """缓冲中只有一段待合并的增量（尚未遇到其他事件）"""
+        return len(self.items) == 1 and isinstance(self.items[0][1], list)
+
+    @property
+    def has_deltas(self) -> bool:
+        """缓冲中是否有待写出的增量"""
+        return any(isinstance(payload, list) for _, payload in self.items)
+
+    def take(self) -> bytes:
+        """取出全部暂存事件，编码为一个响应块"""
+        _client_lag.observe(time.monotonic() - self.items[0][0])
+        _buffered_bytes.observe(self.size)
+        chunk = b"".join(
+            encode_sse(self.delta_event, {"delta": "".join(payload)}) if isinstance(payload, list) else payload
+            for _, payload in self.items
+        )
+        self.items.clear()
+        self.size = 0
+        return chunk
+
+    async def wait(self, deadline: float | None = None) -> None:
+        """等待上游产生新事件或结束，最多等到 deadline（monotonic 时间）"""
+        self.changed.clear()
+        if self.done:
+            return
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self.changed.wait(), timeout)
+
+    def watch(self, disconnected: Callable[[], Awaitable[bool]], interval: float) -> None:
+        """后台定期检测客户端是否断开，断开后立即取消上游（不必等到下一次写出失败）"""
+
+        async def run() -> None:
+            while not self.task.done():
+                await asyncio.sleep(interval)
+                if await disconnected():
+                    _disconnects.inc()
+                    logger.info("SSE 客户端已断开，取消上游")
+                    self.cancel()
+                    return
+
+        self.watcher = asyncio.create_task(run())
+
+    def cancel(self) -> None:
+        """取消上游（只取消一次，避免打断上游取消后的收尾工作）"""
+        if not self.cancelled and not self.task.done():
+            self.cancelled = True
+            self.task.cancel()
+
+    async def close(self, policy: SlowClientPolicy) -> None:
+        """客户端不再读取：finish 让上游在后台完成（例如保存翻译记录），cancel 立即取消"""
+        if self.watcher is not None:
+            self.watcher.cancel()
+        if self.task.done():
+            return
+        if policy == "finish" and not self.cancelled:
+            self.overflow = True
+            _detached.add(self.task)
+            self.task.add_done_callback(_detached.discard)
+            return
+        self.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await asyncio.shield(self.task)
+
+
+async def encode_event_stream(
+    events: AsyncIterator[Mapping[str, Any]],
+    *,
+    window: float = 0.03,
+    max_bytes: int = 256,
+    delta_event: str = "content_delta",
+    buffer_max_bytes: int = 1024 * 1024,
+    slow_client_policy: SlowClientPolicy = "finish",
+    disconnected: Callable[[], Awaitable[bool]] | None = None,
+    disconnect_check_interval: float = 0.5,
+) -> AsyncIterator[bytes]:
+    """将 {"event", "data"} 事件流编码为 SSE 字节块
+
+    上游由后台任务全速读取到有界缓冲中，不受客户端读取速度影响；客户端落后时，积压的事件合并为一次写出，
+    连续的内容增量合并为一个事件。积压超过 buffer_max_bytes 时写出错误事件并断开客户端，
+    上游按 slow_client_policy 处理。客户端断开（disconnected 检测到，或生成器被关闭）时取消上游。
+
+    合并窗口：距上次写出增量超过 window 秒后到达的增量立即写出（首个 token 不被延迟）；
+    窗口内到达的增量暂存，在窗口结束、累计达到 max_bytes 或遇到其他事件时写出。window <= 0 时不等待。
+    """
+    buffer = _StreamBuffer(events, max_bytes=buffer_max_bytes, delta_event=delta_event)
+    if disconnected is not None:
+        buffer.watch(disconnected, disconnect_check_interval)
+    last_write = float("-inf")  # 上次写出增量的时间，窗口只从增量写出时起算
+    policy: SlowClientPolicy = "cancel"
+    try:
+        while True:
+            if buffer.overflow:
+                _slow_clients.inc(policy=slow_client_policy)
+                logger.warning("SSE 客户端读取过慢，积压 %s 字节，断开连接", buffer.size)
+                policy = slow_client_policy
+                buffer.items.clear()
+                yield encode_sse("error", {"message": "客户端读取过慢，连接已断开", "code": "slow_client"})
+                return
+            if not buffer.items:
+                if buffer.done:
+                    break
+                await buffer.wait()
+                continue
+            deadline = last_write + window
+            if buffer.only_deltas and buffer.size < max_bytes and not buffer.done and time.monotonic() < deadline:
+                await buffer.wait(deadline)
+                continue
+            if buffer.has_deltas:
+                last_write = time.monotonic()
+            _sse_writes.inc()
+            yield buffer.take()
+        if buffer.error is not None:
+            raise buffer.error
+    finally:
+        await buffer.close(policy)
@@ -0,0 +1,6 @@
+"""后台任务模块"""
+
+from core.tasks.periodic import PeriodicTask
+
+
+__all__ = ["PeriodicTask"]
@@ -0,0 +1,57 @@
+"""进程内周期任务"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+
+from core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class PeriodicTask:
+    """按固定间隔在事件循环中重复执行的后台任务
+
+    单次执行失败只记录日志，不影响后续调度。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval: float,
+        func: Callable[[], Awaitable[object]],
+        *,
+        run_immediately: bool = True,
+    ) -> None:
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self.run_immediately = run_immediately
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """启动任务（重复调用无副作用）"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        """停止任务并等待退出"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        if not self.run_immediately:
+            await asyncio.sleep(self.interval)
+        while True:
+            try:
+                await self.func()
+            except Exception:
+                logger.exception("周期任务执行失败: %s", self.name)
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,7 @@
+"""HTTP 传输层：响应压缩与预压缩静态文件"""
+
+from core.web.compression import CompressionMiddleware
+from core.web.static import PrecompressedStaticFiles
+
+
+__all__ = ["CompressionMiddleware", "PrecompressedStaticFiles"]
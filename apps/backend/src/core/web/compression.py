@@ -0,0 +1,74 @@
+"""JSON API 响应压缩中间件"""
+
+from __future__ import annotations
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import config_manager
+from core.web.encoding import accepted_encodings, brotli_module
+
+
+class _SelectiveResponder(IdentityResponder):
+    """只压缩指定内容类型的响应
+
+    在 Starlette 的判断（已编码、text/event-stream 不压缩）之上，再排除不在 content_types 中的响应，
+    静态文件等由 PrecompressedStaticFiles 提供预压缩版本，不在运行时压缩。
+    """
+
+    content_types: tuple[str, ...] = ()
+
+    async def send_with_compression(self, message: Message) -> None:
+        await super().send_with_compression(message)
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if not content_type.startswith(self.content_types):
+                self.content_type_is_excluded = True
+
+
+class _GZipResponder(_SelectiveResponder, GZipResponder):
+    pass
+
+
+class _BrotliResponder(_SelectiveResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli_module().Compressor(quality=quality)  # type: ignore[union-attr]
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        # 流式响应逐块 flush，客户端可以边收边解压
+        data = self.compressor.process(body)
+        return data + (self.compressor.flush() if more_body else self.compressor.finish())
+
+
+class CompressionMiddleware:
+    """按 Accept-Encoding 压缩 JSON / NDJSON / CSV 响应
+
+    安装了 brotli 且客户端支持时优先使用 br，否则使用 gzip；小于 minimum_size 的响应、
+    text/event-stream 与已设置 Content-Encoding 的响应原样返回。配置在每个请求时读取
+    （中间件在应用创建时注册，早于配置加载）。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        compression = config_manager.server.compression
+        if scope["type"] != "http" or not compression.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        accepted = accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        responder: _SelectiveResponder
+        if "br" in accepted and brotli_module() is not None:
+            responder = _BrotliResponder(self.app, compression.minimum_size, compression.brotli_quality)
+        elif "gzip" in accepted:
+            responder = _GZipResponder(self.app, compression.minimum_size, compresslevel=compression.gzip_level)
+        else:
+            # 不压缩，但仍为可压缩响应添加 Vary: Accept-Encoding
+            responder = _SelectiveResponder(self.app, compression.minimum_size)
+        responder.content_types = tuple(compression.content_types)
+        await responder(scope, receive, send)
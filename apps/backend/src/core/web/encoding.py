@@ -0,0 +1,28 @@
+"""内容编码协商"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+try:
+    import brotli
+except ImportError:  # 可选依赖：pip install "bridgetalk[compression]"
+    brotli = None
+
+
+def brotli_module() -> Any | None:
+    """返回 brotli 模块，未安装时返回 None"""
+    return brotli
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """解析 Accept-Encoding，返回客户端接受的编码（忽略 q=0 的项）"""
+    accepted: set[str] = set()
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if name := name.strip():
+            accepted.add(name)
+    return accepted
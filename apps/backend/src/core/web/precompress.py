@@ -0,0 +1,59 @@
+"""构建时生成静态文件的 .br / .gz 预压缩版本
+
+用法（在 apps/backend/src 目录下）::
+
+    python -m core.web.precompress ../static
+
+只处理文本类资源；压缩后不小于原文件的不生成。未安装 brotli 时只生成 .gz。
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+from pathlib import Path
+
+from core.web.encoding import brotli_module
+from core.web.static import PRECOMPRESSED_SUFFIXES
+
+
+COMPRESSIBLE_EXTENSIONS = frozenset({".html", ".js", ".mjs", ".css", ".json", ".svg", ".txt", ".xml", ".map", ".wasm"})
+MINIMUM_SIZE = 1024
+
+
+def _compress(encoding: str, data: bytes) -> bytes | None:
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if (brotli := brotli_module()) is not None:
+        return brotli.compress(data, quality=11)
+    return None
+
+
+def precompress_directory(directory: Path) -> int:
+    """为目录下的文本资源生成预压缩文件，返回生成的文件数"""
+    written = 0
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE_EXTENSIONS:
+            continue
+        data = path.read_bytes()
+        if len(data) < MINIMUM_SIZE:
+            continue
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+            compressed = _compress(encoding, data)
+            if compressed is not None and len(compressed) < len(data):
+                path.with_name(path.name + suffix).write_bytes(compressed)
+                written += 1
+    return written
+
+
+def main() -> None:
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="生成静态文件的预压缩版本")
+    parser.add_argument("directory", type=Path, help="静态文件目录（前端构建输出）")
+    args = parser.parse_args()
+    written = precompress_directory(args.directory)
+    print(f"directory={args.directory} written={written} brotli={brotli_module() is not None}")
+
+
+if __name__ == "__main__":
+    main()
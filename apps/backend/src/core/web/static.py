@@ -0,0 +1,82 @@
+"""预压缩静态文件"""
+
+from __future__ import annotations
+
+import mimetypes
+import os
+import re
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, PathLike, StaticFiles
+from starlette.types import Scope
+
+from core.web.encoding import accepted_encodings
+
+
+# 预压缩文件后缀，按优先级排列
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# 构建工具输出的带内容哈希的资源（如 Vite 的 assets/index-B3x9_kLq.js），内容变化时文件名随之变化
+_HASHED_ASSET_PATTERN = re.compile(r"(^|/)assets/.+-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$")
+
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """优先返回构建时生成的 .br / .gz 文件的静态文件服务
+
+    预压缩文件在创建时扫描一次（部署后静态目录不再变化），运行时不做压缩。
+    带内容哈希的资源长期缓存（immutable），其余文件（如 index.html）每次通过 ETag 校验。
+    不同编码的响应由各自文件的 stat 派生不同的 ETag。
+    """
+
+    def __init__(self, *, directory: PathLike, html: bool = False) -> None:
+        super().__init__(directory=directory, html=html)
+        self.root = Path(directory).resolve()
+        self.variants = self._scan_variants()
+
+    def _scan_variants(self) -> dict[str, dict[str, tuple[str, os.stat_result]]]:
+        """建立 原文件路径 -> {编码: (预压缩文件路径, stat)} 索引"""
+        variants: dict[str, dict[str, tuple[str, os.stat_result]]] = {}
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+            for variant in self.root.rglob(f"*{suffix}"):
+                original = variant.with_name(variant.name.removesuffix(suffix))
+                if original.is_file():
+                    variants.setdefault(str(original), {})[encoding] = (str(variant), variant.stat())
+        return variants
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        available = self.variants.get(str(full_path), {})
+        accepted = accepted_encodings(request_headers.get("accept-encoding", "")) if available else set()
+        encoding = next((name for name in PRECOMPRESSED_SUFFIXES if name in available and name in accepted), None)
+
+        if encoding is None:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        else:
+            variant_path, variant_stat = available[encoding]
+            response = FileResponse(
+                variant_path,
+                status_code=status_code,
+                stat_result=variant_stat,
+                media_type=mimetypes.guess_type(str(full_path))[0] or "text/plain",
+                headers={"Content-Encoding": encoding},
+            )
+        if available:
+            response.headers["Vary"] = "Accept-Encoding"
+        relative = Path(full_path).relative_to(self.root).as_posix()
+        hashed = _HASHED_ASSET_PATTERN.search(relative) is not None
+        response.headers["Cache-Control"] = _IMMUTABLE_CACHE_CONTROL if hashed else _REVALIDATE_CACHE_CONTROL
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
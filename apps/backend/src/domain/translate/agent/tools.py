@@ -9,8 +9,10 @@ from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 
+from core.context.deadline import stage_timeout
 from domain.translate.prompts.dev_to_pm import DEV_TO_PM_SYSTEM_PROMPT
 from domain.translate.prompts.pm_to_dev import PM_TO_DEV_SYSTEM_PROMPT
+from llm.breaker import CircuitOpenError, llm_breakers
 
 
 class PerspectiveResult(BaseModel):
@@ -129,6 +131,39 @@ GAPS_ANALYSIS_PROMPT_DEV = """你是一个资深的产品经理，正在审阅
 请返回 JSON 结果（只返回 JSON，不要其他内容）："""
 
 
+# LLM 熔断时视角识别的关键词回退
+_PM_KEYWORDS = (
+    "用户",
+    "需求",
+    "体验",
+    "业务",
+    "场景",
+    "功能",
+    "转化",
+    "留存",
+    "增长",
+    "收益",
+    "客户",
+    "运营",
+    "上线",
+)
+_DEV_KEYWORDS = (
+    "接口",
+    "架构",
+    "数据库",
+    "性能",
+    "缓存",
+    "部署",
+    "重构",
+    "并发",
+    "服务",
+    "代码",
+    "api",
+    "sql",
+    "redis",
+)
+
+
 def _extract_json_from_response(response: str) -> dict[str, Any]:
     """从 LLM 响应中提取 JSON"""
     content = response.strip()
@@ -152,15 +187,39 @@ def _extract_json_from_response(response: str) -> dict[str, Any]:
     raise ValueError(msg)
 
 
-async def identify_perspective_with_llm(content: str, llm: BaseChatModel) -> dict[str, Any]:
+def identify_perspective_heuristic(content: str) -> dict[str, Any]:
+    """按关键词命中数识别视角（LLM 不可用时的降级方案，置信度较低）"""
+    text = content.lower()
+    pm_hits = sum(text.count(keyword) for keyword in _PM_KEYWORDS)
+    dev_hits = sum(text.count(keyword) for keyword in _DEV_KEYWORDS)
+    perspective = "unknown"
+    if pm_hits != dev_hits:
+        perspective = "pm" if pm_hits > dev_hits else "dev"
+    total = pm_hits + dev_hits
+    confidence = 0.0 if total == 0 else min(0.3 + 0.4 * abs(pm_hits - dev_hits) / total, 0.7)
+    return {
+        "perspective": perspective,
+        "confidence": round(confidence, 2),
+        "reason": f"LLM 暂不可用，按关键词判断（产品 {pm_hits} / 技术 {dev_hits}）",
+    }
+
+
+async def identify_perspective_with_llm(
+    content: str, llm: BaseChatModel, *, budget_share: float = 1.0
+) -> dict[str, Any]:
     """使用 LLM 识别输入文本的视角类型
 
     Args:
         content: 需要分析的文本内容
         llm: LLM 实例
+        budget_share: 最多占用请求剩余时间的比例
 
     Returns:
         识别结果字典，包含 perspective、confidence 和 reason
+
+    Raises:
+        TimeoutError: 请求时限不足或调用超时
+        CircuitOpenError: 视角识别阶段已熔断
     """
     messages = [
         SystemMessage(content="你是一个专业的沟通分析师，擅长识别文本的表述视角。请严格按要求返回 JSON 格式。"),
@@ -168,7 +227,8 @@ async def identify_perspective_with_llm(content: str, llm: BaseChatModel) -> dic
     ]
 
     try:
-        response = await llm.ainvoke(messages)
+        async with llm_breakers.guard("detect_perspective"), stage_timeout(budget_share):
+            response = await llm.ainvoke(messages)
         response_text = str(response.content) if hasattr(response, "content") else str(response)
         result = _extract_json_from_response(response_text)
         # 验证并规范化结果
@@ -183,6 +243,8 @@ async def identify_perspective_with_llm(content: str, llm: BaseChatModel) -> dic
             "confidence": round(confidence, 2),
             "reason": reason,
         }
+    except (TimeoutError, CircuitOpenError):
+        raise
     except Exception as e:
         return {
             "perspective": "unknown",
@@ -192,7 +254,12 @@ async def identify_perspective_with_llm(content: str, llm: BaseChatModel) -> dic
 
 
 async def analyze_gaps_with_llm(
-    content: str, perspective: str, llm: BaseChatModel
+    content: str,
+    perspective: str,
+    llm: BaseChatModel,
+    *,
+    budget_share: float = 1.0,
+    reserve: float = 0.0,
 ) -> dict[str, Any]:
     """使用 LLM 分析输入文本中缺失的关键信息
 
@@ -200,9 +267,15 @@ async def analyze_gaps_with_llm(
         content: 需要分析的文本内容
         perspective: 文本的视角类型（pm 或 dev）
         llm: LLM 实例
+        budget_share: 最多占用请求剩余时间的比例
+        reserve: 为后续翻译阶段预留的时间（秒）
 
     Returns:
         分析结果字典，包含 gaps 和 suggestions
+
+    Raises:
+        TimeoutError: 预留后剩余时间不足或调用超时
+        CircuitOpenError: 缺失分析阶段已熔断
     """
     if perspective == "pm":
         prompt = GAPS_ANALYSIS_PROMPT_PM.format(content=content)
@@ -218,7 +291,8 @@ async def analyze_gaps_with_llm(
     ]
 
     try:
-        response = await llm.ainvoke(messages)
+        async with llm_breakers.guard("analyze_gaps"), stage_timeout(budget_share, reserve):
+            response = await llm.ainvoke(messages)
         response_text = str(response.content) if hasattr(response, "content") else str(response)
         result = _extract_json_from_response(response_text)
         # 验证并规范化结果
@@ -228,15 +302,19 @@ async def analyze_gaps_with_llm(
         validated_gaps: list[dict[str, Any]] = []
         for gap in gaps:
             if isinstance(gap, dict) and "category" in gap and "description" in gap:
-                validated_gaps.append({
-                    "category": str(gap["category"]),
-                    "description": str(gap["description"]),
-                    "importance": gap.get("importance", "medium"),
-                })
+                validated_gaps.append(
+                    {
+                        "category": str(gap["category"]),
+                        "description": str(gap["description"]),
+                        "importance": gap.get("importance", "medium"),
+                    }
+                )
         return {
             "gaps": validated_gaps,
             "suggestions": [str(s) for s in suggestions] if suggestions else [],
         }
+    except (TimeoutError, CircuitOpenError):
+        raise
     except Exception as e:
         return {
             "gaps": [],
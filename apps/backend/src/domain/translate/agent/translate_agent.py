@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass, field
 from typing import Any, TypedDict, cast
 
@@ -12,18 +12,32 @@ from langchain_core.messages import AIMessageChunk, BaseMessage, HumanMessage, S
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
+from config import config_manager
+from core.admission.controller import DegradationLevel, current_degradation
+from core.context.deadline import stage_timeout
 from core.logging import get_logger
+from core.metrics import metrics_registry
 from domain.translate.agent.tools import (
     analyze_gaps_with_llm,
     get_system_prompt,
+    identify_perspective_heuristic,
     identify_perspective_with_llm,
 )
 from domain.translate.graph.checkpoint import TenantAwareRedisSaver
 from domain.translate.prompts.dev_to_pm import DEV_TO_PM_SYSTEM_PROMPT
+from llm.breaker import CircuitOpenError, llm_breakers
 
 
 logger = get_logger(__name__)
 
+_stage_skipped = metrics_registry.counter(
+    "bridgetalk_translate_stages_skipped_total",
+    "因请求时限不足（deadline）、LLM 熔断（circuit_open）或过载降级（overload）而跳过或中断的处理阶段数",
+    labels=("stage", "reason"),
+)
+_DEADLINE_MESSAGE = "翻译超时：请求时限已耗尽"
+_UNAVAILABLE_MESSAGE = "LLM 服务暂不可用，请稍后重试"
+
 
 def _extract_text_content(message: BaseMessage) -> str:
     """从 LLM 消息中提取纯文本内容"""
@@ -65,6 +79,21 @@ def _empty_suggestions() -> list[str]:
     return []
 
 
+def _empty_stages() -> list[str]:
+    return []
+
+
+def _skip_reason(exc: Exception) -> str:
+    return "circuit_open" if isinstance(exc, CircuitOpenError) else "deadline"
+
+
+def _skip_stage(state: TranslateState, stage: str, reason: str) -> list[str]:
+    """记录被跳过的阶段（reason: deadline / circuit_open / overload），返回更新后的列表"""
+    _stage_skipped.inc(stage=stage, reason=reason)
+    logger.warning("跳过阶段: %s (%s)", stage, reason)
+    return [*state.get("skipped_stages", []), stage]
+
+
 class TranslateState(TypedDict, total=False):
     content: str
     context: str | None
@@ -77,6 +106,7 @@ class TranslateState(TypedDict, total=False):
     system_prompt: str
     translated_content: str
     error_message: str | None
+    skipped_stages: list[str]
 
 
 @dataclass
@@ -89,6 +119,7 @@ class TranslateResult:
     direction: str
     gaps: list[dict[str, Any]] = field(default_factory=_empty_gaps)
     suggestions: list[str] = field(default_factory=_empty_suggestions)
+    skipped_stages: list[str] = field(default_factory=_empty_stages)
 
 
 class TranslateAgent:
@@ -118,16 +149,30 @@ class TranslateAgent:
         return graph.compile(checkpointer=self.checkpointer)
 
     async def _node_detect_perspective(self, state: TranslateState) -> TranslateState:
+        if current_degradation() >= DegradationLevel.TRANSLATE_ONLY:
+            return self._heuristic_perspective(state, "overload")
         try:
             content = state.get("content", "")
             # 使用 AI 分析视角
-            result = await identify_perspective_with_llm(content, self.llm)
+            result = await identify_perspective_with_llm(
+                content, self.llm, budget_share=config_manager.deadline.perspective_share
+            )
             logger.info("AI 视角识别完成: %s (置信度: %s)", result["perspective"], result["confidence"])
             return {
                 "detected_perspective": result["perspective"],
                 "confidence": result["confidence"],
                 "reason": result["reason"],
             }
+        except CircuitOpenError:
+            return self._heuristic_perspective(state, "circuit_open")
+        except TimeoutError:
+            # 视角识别超时按 unknown 视角继续，保证翻译阶段仍有时间
+            return {
+                "detected_perspective": "unknown",
+                "confidence": 0.0,
+                "reason": "视角识别超时",
+                "skipped_stages": _skip_stage(state, "detect_perspective", "deadline"),
+            }
         except Exception as e:
             logger.exception("视角识别节点失败")
             return {
@@ -137,15 +182,35 @@ class TranslateAgent:
                 "error_message": f"视角识别失败: {e!s}",
             }
 
+    @staticmethod
+    def _heuristic_perspective(state: TranslateState, reason: str) -> TranslateState:
+        """LLM 熔断或过载降级时按关键词判断视角，翻译仍可进行"""
+        result = identify_perspective_heuristic(state.get("content", ""))
+        return {
+            "detected_perspective": result["perspective"],
+            "confidence": result["confidence"],
+            "reason": result["reason"],
+            "skipped_stages": _skip_stage(state, "detect_perspective", reason),
+        }
+
     async def _node_analyze_gaps(self, state: TranslateState) -> TranslateState:
         if state.get("error_message"):
             return {}
+        if current_degradation() >= DegradationLevel.SKIP_GAPS:
+            return self._without_gaps(state, "overload")
 
         try:
             content = state.get("content", "")
             perspective = state.get("detected_perspective", "unknown")
-            # 使用 AI 分析缺失信息
-            result = await analyze_gaps_with_llm(content, perspective, self.llm)
+            # 使用 AI 分析缺失信息（可选阶段：剩余时间不足以同时完成翻译时跳过）
+            deadline_config = config_manager.deadline
+            result = await analyze_gaps_with_llm(
+                content,
+                perspective,
+                self.llm,
+                budget_share=deadline_config.gaps_share,
+                reserve=deadline_config.translate_reserve,
+            )
             gaps = result.get("gaps", [])
             suggestions = result.get("suggestions", [])
             logger.info("AI 缺失分析完成: 发现 %d 项缺失信息", len(gaps))
@@ -158,6 +223,8 @@ class TranslateAgent:
                 "direction": direction,
                 "system_prompt": system_prompt,
             }
+        except (TimeoutError, CircuitOpenError) as e:
+            return self._without_gaps(state, _skip_reason(e))
         except Exception as e:
             logger.exception("缺失分析节点失败")
             perspective = state.get("detected_perspective", "unknown")
@@ -171,6 +238,19 @@ class TranslateAgent:
                 "error_message": f"缺失分析失败: {e!s}",
             }
 
+    @staticmethod
+    def _without_gaps(state: TranslateState, reason: str) -> TranslateState:
+        """跳过缺失分析，只确定翻译方向"""
+        perspective = state.get("detected_perspective", "unknown")
+        direction = "pm_to_dev" if perspective == "pm" else "dev_to_pm"
+        return {
+            "gaps": [],
+            "suggestions": [],
+            "direction": direction,
+            "system_prompt": get_system_prompt(direction),
+            "skipped_stages": _skip_stage(state, "analyze_gaps", reason),
+        }
+
     async def _node_translate(self, state: TranslateState) -> TranslateState:
         if state.get("error_message"):
             return {"translated_content": ""}
@@ -183,9 +263,15 @@ class TranslateAgent:
                 SystemMessage(content=system_prompt),
                 HumanMessage(content=self._build_translate_prompt(content, state.get("context"), gaps)),
             ]
-            response = await self.llm.ainvoke(messages)
+            async with llm_breakers.guard("translate"), stage_timeout():
+                response = await self.llm.ainvoke(messages)
             translated_content = _extract_text_content(response)
             return {"translated_content": translated_content}
+        except CircuitOpenError:
+            return {"translated_content": "", "error_message": _UNAVAILABLE_MESSAGE}
+        except TimeoutError:
+            logger.warning("翻译节点超时：请求时限已耗尽")
+            return {"translated_content": "", "error_message": _DEADLINE_MESSAGE}
         except Exception as e:
             logger.exception("翻译节点失败")
             return {
@@ -198,7 +284,14 @@ class TranslateAgent:
         content: str,
         context: str | None = None,
     ) -> TranslateResult:
-        """执行翻译（同步模式）"""
+        """执行翻译（同步模式）
+
+        Raises:
+            CircuitOpenError: 翻译阶段已熔断（快速失败，不执行预处理）
+        """
+        stage = "translate"
+        if not llm_breakers[stage].allow():
+            raise CircuitOpenError(stage)
         thread_id = uuid.uuid4().hex
         state = await self.graph.ainvoke(
             {"content": content, "context": context},
@@ -210,6 +303,7 @@ class TranslateAgent:
         suggestions = state.get("suggestions", [])
         direction = state.get("direction", "dev_to_pm")
         translated_content = state.get("translated_content", "")
+        skipped_stages = state.get("skipped_stages", [])
         logger.info("翻译完成，方向: %s，置信度: %s", direction, confidence)
 
         return TranslateResult(
@@ -219,6 +313,7 @@ class TranslateAgent:
             direction=direction,
             gaps=gaps,
             suggestions=suggestions,
+            skipped_stages=skipped_stages,
         )
 
     async def translate_stream(
@@ -226,7 +321,17 @@ class TranslateAgent:
         content: str,
         context: str | None = None,
     ) -> AsyncIterator[dict[str, Any]]:
-        """执行翻译（流式模式）"""
+        """执行翻译（流式模式）
+
+        翻译阶段每次读取 LLM 输出都以请求剩余时间为限，时限耗尽时发送 error 事件（code=deadline_exceeded）；
+        翻译阶段熔断时不执行预处理，直接发送 error 事件（code=llm_unavailable）。
+        """
+        if not llm_breakers["translate"].allow():
+            yield {
+                "event": "error",
+                "data": {"message": _UNAVAILABLE_MESSAGE, "stage": "translate", "code": "llm_unavailable"},
+            }
+            return
         thread_id = uuid.uuid4().hex
 
         # 阶段 1: 预处理（视角识别 + 缺失分析）
@@ -278,6 +383,7 @@ class TranslateAgent:
 
         direction = state.get("direction", "dev_to_pm")
         system_prompt = state.get("system_prompt", DEV_TO_PM_SYSTEM_PROMPT)
+        skipped_stages = state.get("skipped_stages", [])
 
         yield {
             "event": "translation_start",
@@ -292,14 +398,12 @@ class TranslateAgent:
 
         try:
             content_parts: list[str] = []
-            async for chunk in self.llm.astream(messages):
-                delta = _extract_chunk_content(chunk)
-                if delta:
-                    content_parts.append(delta)
-                    yield {
-                        "event": "content_delta",
-                        "data": {"delta": delta},
-                    }
+            async for delta in self._stream_deltas(messages):
+                content_parts.append(delta)
+                yield {
+                    "event": "content_delta",
+                    "data": {"delta": delta},
+                }
             full_content = "".join(content_parts)
 
             logger.info("[流式] 翻译完成，方向: %s", direction)
@@ -311,8 +415,22 @@ class TranslateAgent:
                     "direction": direction,
                     "gaps": gaps,
                     "suggestions": suggestions,
+                    "skipped_stages": skipped_stages,
                 },
             }
+        except CircuitOpenError:
+            _stage_skipped.inc(stage="translate", reason="circuit_open")
+            yield {
+                "event": "error",
+                "data": {"message": _UNAVAILABLE_MESSAGE, "stage": "translate", "code": "llm_unavailable"},
+            }
+        except TimeoutError:
+            _stage_skipped.inc(stage="translate", reason="deadline")
+            logger.warning("[流式] 翻译阶段超时：请求时限已耗尽")
+            yield {
+                "event": "error",
+                "data": {"message": _DEADLINE_MESSAGE, "stage": "translate", "code": "deadline_exceeded"},
+            }
         except Exception as e:
             logger.exception("翻译阶段失败")
             yield {
@@ -320,6 +438,18 @@ class TranslateAgent:
                 "data": {"message": f"翻译失败: {e!s}", "stage": "translate"},
             }
 
+    async def _stream_deltas(self, messages: Sequence[BaseMessage]) -> AsyncIterator[str]:
+        """流式读取译文增量：每次读取以请求剩余时间为限，调用结果计入翻译阶段熔断统计"""
+        async with llm_breakers.guard("translate"):
+            stream = aiter(self.llm.astream(messages))
+            while True:
+                async with stage_timeout():
+                    chunk = await anext(stream, None)
+                if chunk is None:
+                    return
+                if delta := _extract_chunk_content(chunk):
+                    yield delta
+
     def _build_translate_prompt(
         self,
         content: str,
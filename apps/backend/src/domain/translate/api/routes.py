@@ -3,110 +3,282 @@
 from __future__ import annotations
 
 import logging
-from typing import Annotated, Any
+import math
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+from typing import Annotated
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.api.response import CommonResponse, error_response, success_response
-from core.database.session import db_session
-from core.sse.events import sse_event
+from config import config_manager
+from core.api.etag import etag_matches, not_modified
+from core.api.response import CommonResponse, FastJSONResponse, error_response, fast_success_response, success_response
+from core.context.deadline import clear_deadline, request_deadline, set_deadline
+from core.database.session import db_read_session
+from core.ratelimit import RateLimiter, RateLimitResult
+from core.sse import encode_event_stream, encode_sse
 from domain.translate.schema.request import TranslateRequest
-from domain.translate.schema.response import TranslateResponse, TranslationRecord
+from domain.translate.schema.response import (
+    TranslateResponse,
+    TranslationHistory,
+    TranslationRecord,
+    TranslationSearchResult,
+    TranslationStats,
+)
+from domain.translate.service.history_export import EXPORT_MEDIA_TYPES, ExportFormat
 from domain.translate.service.translate_service import TranslateService
+from llm.breaker import CircuitOpenError
+from llm.scheduler import RequestClass, clear_request_class, set_request_class
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/translate", tags=["翻译"])
 
+# 详情不可变，允许浏览器长期缓存；历史列表每次需向服务端校验。
+# 数据按租户隔离，禁止共享缓存（代理/CDN）跨租户复用响应
+_DETAIL_CACHE_CONTROL = "private, max-age=31536000, immutable"
+_HISTORY_CACHE_CONTROL = "private, no-cache"
+
+# 流式翻译的精简 message_done（RFC 7240 Prefer 请求头）
+_MINIMAL_PREFERENCE = "return=minimal"
+
+
+def _estimated_tokens(request: TranslateRequest) -> int:
+    """估算一次翻译消耗的 LLM token 数（用于限流）"""
+    chars = len(request.content) + len(request.context or "")
+    return math.ceil(chars * config_manager.rate_limit.tokens_per_char)
+
+
+def _rate_limited(limit: RateLimitResult) -> FastJSONResponse:
+    """超出限流时的 429 响应（带 Retry-After 与 RateLimit-* 头）"""
+    body = error_response(f"请求过于频繁，请 {limit.retry_after} 秒后重试", code=429)
+    return FastJSONResponse(body.model_dump(), status_code=429, headers=limit.headers)
+
 
 @router.post("", response_model=CommonResponse[TranslateResponse])
 @inject
 async def translate(
     request: TranslateRequest,
-    session: Annotated[AsyncSession, Depends(db_session)],
+    http_request: Request,
+    response: Response,
     service: TranslateService = Depends(Provide["translate_service"]),
-) -> CommonResponse[TranslateResponse] | CommonResponse[None]:
-    """执行翻译（同步模式）"""
+    limiter: RateLimiter = Depends(Provide["rate_limiter"]),
+) -> CommonResponse[TranslateResponse] | CommonResponse[None] | Response:
+    """执行翻译（同步模式）
+
+    请求时限（deadline.default_seconds 或 deadline.header 请求头指定）覆盖全部阶段，跳过的阶段见 skipped_stages。
+    按租户 + 用户限流，超出时返回 429。
+    """
     if request.stream:
         return error_response("流式模式请使用 /api/translate/stream 端点", code=400)
 
+    limit = await limiter.check(_estimated_tokens(request))
+    if not limit.allowed:
+        return _rate_limited(limit)
+    response.headers.update(limit.headers)
+    set_deadline(request_deadline(http_request.headers.get(config_manager.deadline.header)))
+    set_request_class(RequestClass.SYNC)
     try:
-        result = await service.translate(session, request.content, request.context)
+        result = await service.translate(request.content, request.context)
         return success_response(result)
+    except CircuitOpenError as e:
+        return error_response(str(e), code=503)
     except Exception as e:
         logger.exception("翻译失败")
         return error_response(f"翻译失败: {e!s}", code=500)
+    finally:
+        clear_deadline()
+        clear_request_class()
 
 
-@router.post("/stream")
+@router.post("/stream", response_model=None)
 @inject
 async def translate_stream(
     request: TranslateRequest,
-    session: Annotated[AsyncSession, Depends(db_session)],
+    http_request: Request,
+    prefer: str | None = Header(None),
     service: TranslateService = Depends(Provide["translate_service"]),
-) -> StreamingResponse:
-    """执行翻译（流式模式）"""
+    limiter: RateLimiter = Depends(Provide["rate_limiter"]),
+) -> StreamingResponse | FastJSONResponse:
+    """执行翻译（流式模式）
+
+    不注入请求级 Session：流式响应持续时间取决于 LLM，持久化由 Service 在写入时借出短生命周期 Session。
+    LLM 输出由后台任务读取到有界缓冲，客户端读取速度不影响上游；事件直接编码为字节，连续的内容增量合并写出。
+    定期检测客户端断开，断开后取消预处理与 LLM 调用，部分译文按 streaming.disconnect_policy 保存或丢弃。
+    请求时限从收到请求时起算，跳过的阶段见 message_done 的 skipped_stages。按租户 + 用户限流，超出时返回 429。
+    """
+    limit = await limiter.check(_estimated_tokens(request))
+    if not limit.allowed:
+        return _rate_limited(limit)
+    streaming_config = config_manager.streaming
+    lean_done = request.lean_done or _MINIMAL_PREFERENCE in (prefer or "").lower()
+    deadline = request_deadline(http_request.headers.get(config_manager.deadline.header))
 
-    async def generate():
+    async def generate() -> AsyncIterator[bytes]:
+        # 上游任务在首次迭代时创建，复制此时的上下文（含截止时间与调度优先级）
+        set_deadline(deadline)
+        set_request_class(RequestClass.INTERACTIVE)
         try:
-            async for event in service.translate_stream(session, request.content, request.context):
-                yield sse_event(event["event"], event["data"])
+            async for chunk in encode_event_stream(
+                service.translate_stream(request.content, request.context, lean_done=lean_done),
+                window=streaming_config.coalesce_window,
+                max_bytes=streaming_config.coalesce_max_bytes,
+                buffer_max_bytes=streaming_config.buffer_max_bytes,
+                slow_client_policy=streaming_config.slow_client_policy,
+                disconnected=http_request.is_disconnected,
+                disconnect_check_interval=streaming_config.disconnect_check_interval,
+            ):
+                yield chunk
         except Exception as e:
             logger.exception("流式翻译失败")
-            yield sse_event("error", {"message": f"翻译失败: {e!s}"})
+            yield encode_sse("error", {"message": f"翻译失败: {e!s}"})
+        finally:
+            clear_deadline()
+            clear_request_class()
 
-    return StreamingResponse(
-        generate(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",
+        **limit.headers,
+    }
+    if lean_done:
+        headers["Preference-Applied"] = _MINIMAL_PREFERENCE
+    return StreamingResponse(generate(), media_type="text/event-stream", headers=headers)
 
 
-@router.get("/history", response_model=CommonResponse[dict[str, Any]])
+@router.get("/history", response_model=CommonResponse[TranslationHistory])
 @inject
 async def get_history(
-    session: Annotated[AsyncSession, Depends(db_session)],
+    session: Annotated[AsyncSession, Depends(db_read_session)],
     page: int = Query(1, ge=1, description="页码"),
     size: int = Query(20, ge=1, le=100, description="每页数量"),
+    cursor: str | None = Query(None, description="游标（来自上一页的 next_cursor），传入时忽略 page"),
+    if_none_match: str | None = Header(None),
     service: TranslateService = Depends(Provide["translate_service"]),
-) -> CommonResponse[dict[str, Any]] | CommonResponse[None]:
-    """获取翻译历史"""
+) -> FastJSONResponse | CommonResponse[None] | Response:
+    """获取翻译历史（快速路径：行直接编码为 JSON，response_model 仅用于 OpenAPI）"""
     try:
-        records, total = await service.get_history(session, page, size)
-        return success_response(
-            {
-                "content": [r.model_dump() for r in records],
-                "total": total,
-                "page": page,
-                "size": size,
-                "total_pages": (total + size - 1) // size,
-            }
-        )
+        etag = await service.history_etag(session)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, _HISTORY_CACHE_CONTROL)
+        history = await service.get_history(session, page, size, cursor)
+        return fast_success_response(history, headers={"ETag": etag, "Cache-Control": _HISTORY_CACHE_CONTROL})
+    except ValueError as e:
+        return error_response(str(e), code=400)
     except Exception as e:
         logger.exception("获取历史失败")
         return error_response(f"获取历史失败: {e!s}", code=500)
 
 
+@router.get("/search", response_model=CommonResponse[TranslationSearchResult])
+@inject
+async def search(
+    session: Annotated[AsyncSession, Depends(db_read_session)],
+    q: str = Query(..., min_length=1, max_length=200, description="关键词（匹配原文与译文）"),
+    direction: str | None = Query(None, description="翻译方向: pm_to_dev / dev_to_pm"),
+    perspective: str | None = Query(None, description="识别的视角: pm / dev / unknown"),
+    category: str | None = Query(None, description="缺失信息分类"),
+    size: int = Query(20, ge=1, le=100, description="每页数量"),
+    cursor: str | None = Query(None, description="游标（来自上一页的 next_cursor）"),
+    service: TranslateService = Depends(Provide["translate_service"]),
+) -> FastJSONResponse | CommonResponse[None]:
+    """搜索翻译历史（快速路径，同历史列表）"""
+    try:
+        result = await service.search(
+            session,
+            q,
+            direction=direction,
+            perspective=perspective,
+            category=category,
+            size=size,
+            cursor=cursor,
+        )
+        return fast_success_response(result)
+    except ValueError as e:
+        return error_response(str(e), code=400)
+    except Exception as e:
+        logger.exception("搜索失败")
+        return error_response(f"搜索失败: {e!s}", code=500)
+
+
+@router.get("/stats", response_model=CommonResponse[TranslationStats])
+@inject
+async def get_stats(
+    session: Annotated[AsyncSession, Depends(db_read_session)],
+    start: date | None = Query(None, description="起始日期（含，UTC），默认为 end 前 29 天"),
+    end: date | None = Query(None, description="结束日期（含，UTC），默认为今天"),
+    limit: int = Query(10, ge=1, le=50, description="返回的缺失信息分类数"),
+    service: TranslateService = Depends(Provide["translate_service"]),
+) -> CommonResponse[TranslationStats] | CommonResponse[None]:
+    """获取翻译统计（每日翻译量与高频缺失信息分类）"""
+    try:
+        stats = await service.get_stats(session, start, end, limit)
+        return success_response(stats)
+    except ValueError as e:
+        return error_response(str(e), code=400)
+    except Exception as e:
+        logger.exception("获取统计失败")
+        return error_response(f"获取统计失败: {e!s}", code=500)
+
+
+@router.get("/export", response_model=None)
+@inject
+async def export_history(
+    fmt: ExportFormat = Query("ndjson", alias="format", description="导出格式: ndjson / csv"),
+    start: datetime | None = Query(None, description="起始时间（含），ISO 8601"),
+    end: datetime | None = Query(None, description="结束时间（不含），ISO 8601"),
+    direction: str | None = Query(None, description="翻译方向: pm_to_dev / dev_to_pm"),
+    cursor: str | None = Query(None, description="续传游标（已导出的最后一条记录的 cursor 字段）"),
+    service: TranslateService = Depends(Provide["translate_service"]),
+) -> StreamingResponse | CommonResponse[None]:
+    """流式导出翻译历史
+
+    不注入请求级 Session：导出通过服务端游标逐批读取，由 Service 持有独立 Session 直至导出结束。
+    """
+    try:
+        chunks = service.export(fmt, start=start, end=end, direction=direction, cursor=cursor)
+    except ValueError as e:
+        return error_response(str(e), code=400)
+
+    media_type, extension = EXPORT_MEDIA_TYPES[fmt]
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="translations.{extension}"',
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.get("/{translation_id}", response_model=CommonResponse[TranslationRecord])
 @inject
 async def get_translation(
     translation_id: UUID,
-    session: Annotated[AsyncSession, Depends(db_session)],
+    response: Response,
+    session: Annotated[AsyncSession, Depends(db_read_session)],
+    if_none_match: str | None = Header(None),
     service: TranslateService = Depends(Provide["translate_service"]),
-) -> CommonResponse[TranslationRecord] | CommonResponse[None]:
-    """根据 ID 获取翻译记录"""
+) -> CommonResponse[TranslationRecord] | CommonResponse[None] | Response:
+    """根据 ID 获取翻译记录
+
+    记录不可变：ETag 只由租户与 ID 派生，If-None-Match 命中时直接返回 304，不加载记录。
+    """
+    etag = service.detail_etag(translation_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, _DETAIL_CACHE_CONTROL)
     try:
         record = await service.get_by_id(session, translation_id)
         if not record:
             return error_response("记录不存在", code=404)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = _DETAIL_CACHE_CONTROL
         return success_response(record)
     except Exception as e:
         logger.exception("获取记录失败")
@@ -0,0 +1,25 @@
+"""翻译记录归档索引模型"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database.base import Base
+
+
+class TranslationArchiveEntry(Base):
+    """已归档记录的位置索引：ID -> (段文件, 帧偏移, 帧长度)"""
+
+    __tablename__ = "translation_archive_index"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, comment="翻译记录 ID")
+    realm: Mapped[str] = mapped_column(String(64), nullable=False, comment="租户")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, comment="记录创建时间")
+    segment: Mapped[str] = mapped_column(String(255), nullable=False, comment="段文件名")
+    offset: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="所在帧的字节偏移")
+    length: Mapped[int] = mapped_column(Integer, nullable=False, comment="所在帧的字节长度")
@@ -0,0 +1,30 @@
+"""翻译正文内容寻址存储模型"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, LargeBinary, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database.base import Base
+
+
+class TranslationBody(Base):
+    """按内容哈希去重的压缩正文
+
+    translations 中超过阈值的正文只保留前缀，完整内容以 SHA-256 为键存放于此，
+    相同正文只存一份。正文在应用侧 zlib 压缩，列存储设为 EXTERNAL，避免数据库重复压缩。
+    """
+
+    __tablename__ = "translation_bodies"
+
+    hash: Mapped[bytes] = mapped_column(LargeBinary(32), primary_key=True, comment="正文 SHA-256")
+    body: Mapped[bytes] = mapped_column(LargeBinary, nullable=False, comment="zlib 压缩的 UTF-8 正文")
+    length: Mapped[int] = mapped_column(Integer, nullable=False, comment="正文字符数")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        comment="创建时间",
+    )
@@ -0,0 +1,38 @@
+"""翻译统计汇总模型
+
+按租户与 UTC 自然日增量维护的汇总表：每条翻译写入时在同一事务中累加计数，
+看板查询只读取汇总行，代价与原始记录表大小无关。
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import Date, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database.base import Base
+
+
+class TranslationDailyStat(Base):
+    """每日翻译量（按方向与视角）"""
+
+    __tablename__ = "translation_daily_stats"
+
+    realm: Mapped[str] = mapped_column(String(64), primary_key=True, comment="租户")
+    day: Mapped[date] = mapped_column(Date, primary_key=True, comment="日期（UTC）")
+    direction: Mapped[str] = mapped_column(String(20), primary_key=True, comment="翻译方向")
+    # 视角可能为空，汇总时归入 unknown 以便作为主键
+    perspective: Mapped[str] = mapped_column(String(20), primary_key=True, comment="识别的视角")
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="翻译数")
+
+
+class GapCategoryDailyStat(Base):
+    """每日缺失信息分类出现次数"""
+
+    __tablename__ = "gap_category_daily_stats"
+
+    realm: Mapped[str] = mapped_column(String(64), primary_key=True, comment="租户")
+    day: Mapped[date] = mapped_column(Date, primary_key=True, comment="日期（UTC）")
+    category: Mapped[str] = mapped_column(String(64), primary_key=True, comment="缺失信息分类")
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="出现次数")
@@ -7,11 +7,13 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from sqlalchemy import DateTime, Index, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, LargeBinary, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.database.base import Base
+from core.database.ids import uuid7
+from domain.translate.model.body import TranslationBody
 
 
 class TranslateDirection(str, Enum):
@@ -21,22 +23,79 @@ class TranslateDirection(str, Enum):
     DEV_TO_PM = "dev_to_pm"  # 开发 -> 产品
 
 
+class TranslationStatus(str, Enum):
+    """翻译记录状态"""
+
+    COMPLETED = "completed"  # 完整翻译
+    CANCELLED = "cancelled"  # 客户端中途断开，只保存了已生成的部分译文
+
+
 class Translation(Base):
     """翻译记录表"""
 
     __tablename__ = "translations"
+    # 按 created_at 月度范围分区，分区由 TranslationMaintenance 预建与过期清理
     __table_args__ = (
-        Index("ix_translations_created_at", "created_at"),
+        # 租户内键集分页：等值 realm + (created_at, id) 倒序，单租户翻页代价与其他租户数据量无关
+        Index("ix_translations_realm_created_at_id", "realm", text("created_at DESC"), text("id DESC")),
         Index("ix_translations_direction", "direction"),
+        # 关键词搜索：pg_trgm 三元组索引支持任意位置的 ILIKE 匹配，无需中文分词扩展
+        Index(
+            "ix_translations_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_translations_translated_content_trgm",
+            "translated_content",
+            postgresql_using="gin",
+            postgresql_ops={"translated_content": "gin_trgm_ops"},
+        ),
+        # 缺失信息分类过滤：JSONB 包含查询 (@>)
+        Index(
+            "ix_translations_gaps_identified",
+            "gaps_identified",
+            postgresql_using="gin",
+            postgresql_ops={"gaps_identified": "jsonb_path_ops"},
+        ),
+        # 外置正文引用：支撑孤立正文清理时的 NOT EXISTS 检查与外键删除检查
+        Index(
+            "ix_translations_content_hash",
+            "content_hash",
+            postgresql_where=text("content_hash IS NOT NULL"),
+        ),
+        Index(
+            "ix_translations_translated_hash",
+            "translated_hash",
+            postgresql_where=text("translated_hash IS NOT NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
+    # INSERT 时通过 RETURNING 取回 created_at 等服务端默认值，提交后可直接访问
+    __mapper_args__ = {"eager_defaults": True}  # noqa: RUF012
 
+    # UUIDv7：可从 ID 反推创建时间，主键查询据此裁剪分区
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
+    # 正文外置（content_hash / translated_hash 非空）时只保存前缀，完整内容见 translation_bodies
     content: Mapped[str] = mapped_column(Text, nullable=False, comment="原始内容")
     translated_content: Mapped[str] = mapped_column(Text, nullable=False, comment="翻译结果")
+    content_hash: Mapped[bytes | None] = mapped_column(
+        LargeBinary(32),
+        ForeignKey(TranslationBody.hash),
+        nullable=True,
+        comment="外置原始内容的 SHA-256",
+    )
+    translated_hash: Mapped[bytes | None] = mapped_column(
+        LargeBinary(32),
+        ForeignKey(TranslationBody.hash),
+        nullable=True,
+        comment="外置翻译结果的 SHA-256",
+    )
     direction: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
@@ -52,8 +111,29 @@ class Translation(Base):
         nullable=True,
         comment="识别的缺失信息",
     )
+    status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default=TranslationStatus.COMPLETED.value,
+        server_default=TranslationStatus.COMPLETED.value,
+        comment="状态: completed / cancelled",
+    )
+    realm: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        server_default="default",
+        comment="租户",
+    )
+    username: Mapped[str] = mapped_column(
+        String(128),
+        nullable=False,
+        server_default="anonymous",
+        comment="创建用户",
+    )
+    # 分区键必须包含在主键中
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         server_default=func.now(),
         nullable=False,
         comment="创建时间",
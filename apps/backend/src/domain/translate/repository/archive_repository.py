@@ -0,0 +1,89 @@
+"""翻译记录归档仓储：段文件读写与 ID 索引"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import config_manager
+from core.archive import LocalSegmentStore, SegmentWriter, read_frame_lines
+from core.database.ids import uuid7
+from core.logging import get_logger
+from domain.translate.model.archive import TranslationArchiveEntry
+
+
+logger = get_logger(__name__)
+
+
+class TranslationArchive:
+    """已归档翻译记录的存储
+
+    记录以 JSONL 形式写入 zstd 段文件，ID 索引保存在 translation_archive_index 表中，
+    按 ID 读取时只读取并解压所在的一个帧。
+    """
+
+    def __init__(self) -> None:
+        archive_config = config_manager.archive
+        self.enabled = archive_config.enabled
+        self.store = LocalSegmentStore(archive_config.directory)
+
+    async def get(self, session: AsyncSession, realm: str, translation_id: UUID) -> dict[str, Any] | None:
+        """按 ID 读取已归档的记录"""
+        stmt = select(TranslationArchiveEntry).where(
+            TranslationArchiveEntry.id == translation_id,
+            TranslationArchiveEntry.realm == realm,
+        )
+        if (entry := (await session.execute(stmt)).scalar_one_or_none()) is None:
+            return None
+        frame = await asyncio.to_thread(self.store.read_range, entry.segment, entry.offset, entry.length)
+        target = str(translation_id)
+        for record in read_frame_lines(frame):
+            if record["id"] == target:
+                return record
+        logger.error("归档索引与段文件不一致: id=%s, segment=%s", target, entry.segment)
+        return None
+
+    async def write_segment(self, session: AsyncSession, records: Sequence[Mapping[str, Any]]) -> str:
+        """写入一个段文件并登记索引（调用方负责提交事务，提交失败时应调用 discard 删除段文件）
+
+        段文件先落盘再写索引，事务提交前记录仍在数据库中，任一步失败都不会丢失数据。
+        """
+        archive_config = config_manager.archive
+        writer = SegmentWriter(frame_size=archive_config.frame_size, level=archive_config.compression_level)
+        for record in records:
+            writer.add(record["id"], dict(record))
+        data = writer.finish()
+
+        first_created = datetime.fromisoformat(records[0]["created_at"])
+        name = f"translations-{first_created:%Y%m%d}-{uuid7().hex}.jsonl.zst"
+        await asyncio.to_thread(self.store.write, name, data)
+
+        entries = [
+            {
+                "id": UUID(record["id"]),
+                "realm": record["realm"],
+                "created_at": datetime.fromisoformat(record["created_at"]),
+                "segment": name,
+                "offset": writer.locations[record["id"]].offset,
+                "length": writer.locations[record["id"]].length,
+            }
+            for record in records
+        ]
+        try:
+            await session.execute(insert(TranslationArchiveEntry), entries)
+        except BaseException:
+            await self.discard(name)
+            raise
+        logger.info("写入归档段文件: %s, 记录数=%s, 字节数=%s", name, len(records), len(data))
+        return name
+
+    async def discard(self, name: str) -> None:
+        """删除未能登记的段文件"""
+        await asyncio.to_thread(self.store.delete, name)
@@ -0,0 +1,265 @@
+"""最近翻译历史缓冲（Redis）
+
+每个租户在 Redis 中维护最新 N 条翻译摘要，写入时同步更新，历史列表的前几页直接从缓冲读取，
+超出缓冲范围时回退 SQL。Redis 数据结构：
+
+- ``recent:{realm}:ids``：排序集合，member 为翻译 ID，score 为创建时间（微秒时间戳）
+- ``recent:{realm}:items``：哈希，翻译 ID -> 摘要 JSON
+- ``recent:{realm}:meta``：哈希，ready（缓冲已从数据库播种）/ total / estimated
+
+同一时间戳的记录按 ID 字典序倒序返回，与 SQL 的 (created_at DESC, id DESC) 排序一致。
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import config_manager
+from core.cache.redis_service import RedisService
+from core.context.request import current_realm
+from core.database.session import session_scope
+from core.logging import get_logger
+from domain.translate.repository.translate_repository import TranslateRepository
+from domain.translate.schema.response import TranslationSummary
+
+
+logger = get_logger(__name__)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# 超出容量时淘汰最旧的记录：KEYS[1] ids, KEYS[2] items；ARGV[1] 容量
+_TRIM_LUA = """
+local overflow = redis.call('ZCARD', KEYS[1]) - tonumber(ARGV[1])
+if overflow > 0 then
+  local evicted = redis.call('ZRANGE', KEYS[1], 0, overflow - 1)
+  redis.call('ZREMRANGEBYRANK', KEYS[1], 0, overflow - 1)
+  redis.call('HDEL', KEYS[2], unpack(evicted))
+end
+"""
+
+# KEYS: ids, items, meta；ARGV: 容量, score, id, 摘要 JSON
+_PUSH_SCRIPT = (
+    """
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[3])
+redis.call('HSET', KEYS[2], ARGV[3], ARGV[4])
+"""
+    + _TRIM_LUA
+    + """
+if redis.call('HEXISTS', KEYS[3], 'ready') == 1 then
+  redis.call('HINCRBY', KEYS[3], 'total', 1)
+end
+return 1
+"""
+)
+
+# KEYS: ids, items, meta；ARGV: start, stop。未播种时返回 nil
+_READ_SCRIPT = """
+local meta = redis.call('HMGET', KEYS[3], 'ready', 'total', 'estimated')
+if not meta[1] then
+  return false
+end
+local ids = redis.call('ZREVRANGE', KEYS[1], ARGV[1], ARGV[2])
+local items = {}
+if #ids > 0 then
+  items = redis.call('HMGET', KEYS[2], unpack(ids))
+end
+return {meta[2], meta[3], items}
+"""
+
+# KEYS: ids, meta。未播种时返回 nil，缓冲为空时返回空列表，否则返回 {id, score}
+_LATEST_SCRIPT = """
+if redis.call('HEXISTS', KEYS[2], 'ready') == 0 then
+  return false
+end
+return redis.call('ZREVRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+"""
+
+# KEYS: ids, items, meta；ARGV: 容量, reset, total, estimated, 之后每 3 个为一组 (score, id, 摘要 JSON)
+_REBUILD_SCRIPT = (
+    """
+if ARGV[2] == '1' then
+  redis.call('DEL', KEYS[1], KEYS[2])
+end
+for i = 5, #ARGV, 3 do
+  redis.call('ZADD', KEYS[1], ARGV[i], ARGV[i + 1])
+  redis.call('HSET', KEYS[2], ARGV[i + 1], ARGV[i + 2])
+end
+"""
+    + _TRIM_LUA
+    + """
+redis.call('HSET', KEYS[3], 'ready', 1, 'total', ARGV[3], 'estimated', ARGV[4])
+return redis.call('ZCARD', KEYS[1])
+"""
+)
+
+# KEYS: ids, meta。返回 {缓冲内全部 ID（新到旧）, total}
+_SNAPSHOT_SCRIPT = """
+return {redis.call('ZREVRANGE', KEYS[1], 0, -1), redis.call('HGET', KEYS[2], 'total')}
+"""
+
+
+def epoch_micros(value: datetime) -> int:
+    """创建时间转换为微秒时间戳（缓冲排序分值，也用于派生历史 ETag）"""
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _encode(summary: TranslationSummary) -> str:
+    return orjson.dumps(summary.model_dump(), option=orjson.OPT_UTC_Z).decode()
+
+
+def _empty_ids() -> list[str]:
+    return []
+
+
+@dataclass
+class RecentPage:
+    """从缓冲读取的一页历史
+
+    items 为缓冲中已编码的摘要 JSON，原样嵌入响应，不再解析与校验；last 为解析后的最后一项（用于生成游标）。
+    """
+
+    items: list[orjson.Fragment]
+    last: dict[str, Any] | None
+    total: int
+    estimated: bool
+
+
+@dataclass
+class RecentHistoryReport:
+    """缓冲与数据库的一致性检查结果"""
+
+    realm: str
+    buffered: int
+    total_buffer: int | None
+    total_db: int
+    missing: list[str] = field(default_factory=_empty_ids)
+    unexpected: list[str] = field(default_factory=_empty_ids)
+
+    @property
+    def consistent(self) -> bool:
+        """缓冲内容是否与数据库最新 N 条一致"""
+        return not self.missing and not self.unexpected
+
+
+class RecentHistoryBuffer:
+    """最近翻译历史缓冲"""
+
+    def __init__(self, redis: RedisService, repository: TranslateRepository) -> None:
+        history_config = config_manager.history
+        self.redis = redis
+        self.repository = repository
+        self.enabled = history_config.recent_buffer_enabled
+        self.capacity = history_config.recent_buffer_size
+        self._seeding: dict[str, asyncio.Task[None]] = {}
+
+    @staticmethod
+    def _keys(realm: str) -> tuple[str, str, str]:
+        base = f"recent:{realm}"
+        return f"{base}:ids", f"{base}:items", f"{base}:meta"
+
+    def covers(self, offset: int, size: int) -> bool:
+        """判断页码范围是否落在缓冲容量内"""
+        return self.enabled and offset + size <= self.capacity
+
+    async def push(self, summary: TranslationSummary, realm: str | None = None) -> None:
+        """写入新记录并淘汰超出容量的旧记录"""
+        if not self.enabled:
+            return
+        ids_key, items_key, meta_key = self._keys(realm or current_realm())
+        await self.redis.run_script(
+            _PUSH_SCRIPT,
+            [ids_key, items_key, meta_key],
+            [self.capacity, epoch_micros(summary.created_at), str(summary.id), _encode(summary)],
+        )
+
+    async def read(self, offset: int, size: int) -> RecentPage | None:
+        """读取一页历史，缓冲未就绪或内容不完整时返回 None（调用方回退 SQL）"""
+        if not self.covers(offset, size):
+            return None
+        realm = current_realm()
+        raw = await self.redis.run_script(_READ_SCRIPT, self._keys(realm), [offset, offset + size - 1])
+        if raw is None:
+            self._schedule_seed(realm)
+            return None
+        total, estimated, items = cast(list[Any], raw)
+        if any(item is None for item in items):
+            logger.warning("最近历史缓冲数据不完整，回退数据库查询: realm=%s", realm)
+            return None
+        return RecentPage(
+            items=[orjson.Fragment(item) for item in items],
+            last=orjson.loads(items[-1]) if items else None,
+            total=int(total or 0),
+            estimated=estimated == "1",
+        )
+
+    async def latest_marker(self) -> str | None:
+        """最新记录的时间戳标记，缓冲未就绪时返回 None"""
+        if not self.enabled:
+            return None
+        ids_key, _, meta_key = self._keys(current_realm())
+        raw = await self.redis.run_script(_LATEST_SCRIPT, [ids_key, meta_key])
+        if raw is None:
+            return None
+        latest = cast(list[str], raw)
+        return str(int(float(latest[1]))) if latest else "empty"
+
+    async def rebuild(self, session: AsyncSession, realm: str, *, reset: bool = True) -> int:
+        """从数据库重新播种缓冲
+
+        reset=True 时先清空缓冲（用于运维重建）；reset=False 时与现有内容合并，
+        不会丢失播种期间并发写入的记录。
+
+        Returns:
+            缓冲中的记录数
+        """
+        rows = await self.repository.list_recent(session, realm, limit=self.capacity)
+        total, estimated = await self.repository.count_estimate(
+            session, realm, config_manager.history.exact_count_threshold
+        )
+        args: list[str | int | float] = [self.capacity, int(reset), total, int(estimated)]
+        for row in rows:
+            summary = TranslationSummary.model_validate(row)
+            args.extend([epoch_micros(summary.created_at), str(summary.id), _encode(summary)])
+        count = await self.redis.run_script(_REBUILD_SCRIPT, self._keys(realm), args)
+        logger.info("最近历史缓冲已重建: realm=%s, 记录数=%s, 总数=%s", realm, count, total)
+        return int(count or 0)
+
+    async def check(self, session: AsyncSession, realm: str) -> RecentHistoryReport:
+        """对比缓冲与数据库最新 N 条记录"""
+        ids_key, _, meta_key = self._keys(realm)
+        raw = await self.redis.run_script(_SNAPSHOT_SCRIPT, [ids_key, meta_key])
+        buffered_ids, total_buffer = cast(list[Any], raw) if raw is not None else ([], None)
+        rows = await self.repository.list_recent(session, realm, limit=self.capacity)
+        db_ids = [str(row["id"]) for row in rows]
+        total_db, _ = await self.repository.count_estimate(session, realm, config_manager.history.exact_count_threshold)
+        buffered = set(buffered_ids)
+        expected = set(db_ids)
+        return RecentHistoryReport(
+            realm=realm,
+            buffered=len(buffered_ids),
+            total_buffer=int(total_buffer) if total_buffer is not None else None,
+            total_db=total_db,
+            missing=[item for item in db_ids if item not in buffered],
+            unexpected=[item for item in buffered_ids if item not in expected],
+        )
+
+    def _schedule_seed(self, realm: str) -> None:
+        """后台播种缓冲（例如 Redis 被清空后），同一租户同时只运行一个任务"""
+        if realm in self._seeding:
+            return
+        task = asyncio.create_task(self._seed(realm))
+        self._seeding[realm] = task
+        task.add_done_callback(lambda _: self._seeding.pop(realm, None))
+
+    async def _seed(self, realm: str) -> None:
+        try:
+            async with session_scope() as session:
+                await self.rebuild(session, realm, reset=False)
+        except Exception:
+            logger.exception("最近历史缓冲播种失败: realm=%s", realm)
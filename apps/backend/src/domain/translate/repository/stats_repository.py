@@ -0,0 +1,138 @@
+"""翻译统计汇总仓储"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import UTC, date
+from typing import Any
+
+from sqlalchemy import RowMapping, delete, desc, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.translate.model.stats import GapCategoryDailyStat, TranslationDailyStat
+from domain.translate.model.translation import Translation
+
+
+# 分类名为 LLM 生成的自由文本，超长部分截断（与汇总表列宽一致）
+CATEGORY_MAX_LENGTH = 64
+UNKNOWN_PERSPECTIVE = "unknown"
+
+_REBUILD_DAILY_SQL = text("""
+    INSERT INTO translation_daily_stats (realm, day, direction, perspective, count)
+    SELECT realm, (created_at AT TIME ZONE 'UTC')::date, direction, coalesce(detected_perspective, 'unknown'), count(*)
+    FROM translations
+    WHERE realm = :realm
+    GROUP BY 1, 2, 3, 4
+""")
+
+_REBUILD_GAPS_SQL = text("""
+    INSERT INTO gap_category_daily_stats (realm, day, category, count)
+    SELECT t.realm, (t.created_at AT TIME ZONE 'UTC')::date, left(g.value ->> 'category', 64), count(*)
+    FROM translations t
+    CROSS JOIN LATERAL jsonb_array_elements(t.gaps_identified -> 'gaps') AS g(value)
+    WHERE t.realm = :realm
+      AND jsonb_typeof(t.gaps_identified -> 'gaps') = 'array'
+      AND coalesce(g.value ->> 'category', '') <> ''
+    GROUP BY 1, 2, 3
+""")
+
+
+def _gap_categories(gaps_identified: dict[str, Any] | None) -> Counter[str]:
+    """统计一条记录中各缺失信息分类的出现次数"""
+    categories: Counter[str] = Counter()
+    for gap in (gaps_identified or {}).get("gaps", []):
+        if isinstance(gap, dict) and (category := str(gap.get("category") or "")[:CATEGORY_MAX_LENGTH]):
+            categories[category] += 1
+    return categories
+
+
+class TranslationStatsRepository:
+    """翻译统计汇总仓储
+
+    写入路径在保存翻译的同一事务中累加计数（INSERT ... ON CONFLICT DO UPDATE），
+    汇总与原始记录始终一致；读取路径只扫描汇总表的主键范围。
+    """
+
+    async def record(self, session: AsyncSession, translation: Translation) -> None:
+        """累加一条新翻译记录的统计"""
+        day = translation.created_at.astimezone(UTC).date()
+        daily = insert(TranslationDailyStat).values(
+            realm=translation.realm,
+            day=day,
+            direction=translation.direction,
+            perspective=translation.detected_perspective or UNKNOWN_PERSPECTIVE,
+            count=1,
+        )
+        await session.execute(
+            daily.on_conflict_do_update(
+                index_elements=["realm", "day", "direction", "perspective"],
+                set_={"count": TranslationDailyStat.count + daily.excluded.count},
+            )
+        )
+
+        if not (categories := _gap_categories(translation.gaps_identified)):
+            return
+        # 按分类名排序写入，并发事务以相同顺序加行锁，避免死锁
+        gaps = insert(GapCategoryDailyStat).values(
+            [
+                {"realm": translation.realm, "day": day, "category": category, "count": count}
+                for category, count in sorted(categories.items())
+            ]
+        )
+        await session.execute(
+            gaps.on_conflict_do_update(
+                index_elements=["realm", "day", "category"],
+                set_={"count": GapCategoryDailyStat.count + gaps.excluded.count},
+            )
+        )
+
+    async def daily(self, session: AsyncSession, realm: str, start: date, end: date) -> list[RowMapping]:
+        """按日读取 [start, end] 范围内的翻译量"""
+        stmt = (
+            select(
+                TranslationDailyStat.day,
+                TranslationDailyStat.direction,
+                TranslationDailyStat.perspective,
+                TranslationDailyStat.count,
+            )
+            .where(TranslationDailyStat.realm == realm, TranslationDailyStat.day.between(start, end))
+            .order_by(TranslationDailyStat.day, TranslationDailyStat.direction, TranslationDailyStat.perspective)
+        )
+        result = await session.execute(stmt)
+        return list(result.mappings().all())
+
+    async def top_gap_categories(
+        self,
+        session: AsyncSession,
+        realm: str,
+        start: date,
+        end: date,
+        limit: int = 10,
+    ) -> list[RowMapping]:
+        """读取 [start, end] 范围内出现次数最多的缺失信息分类"""
+        total = func.sum(GapCategoryDailyStat.count).label("count")
+        stmt = (
+            select(GapCategoryDailyStat.category, total)
+            .where(GapCategoryDailyStat.realm == realm, GapCategoryDailyStat.day.between(start, end))
+            .group_by(GapCategoryDailyStat.category)
+            .order_by(desc(total), GapCategoryDailyStat.category)
+            .limit(limit)
+        )
+        result = await session.execute(stmt)
+        return list(result.mappings().all())
+
+    async def rebuild(self, session: AsyncSession, realm: str) -> None:
+        """从原始记录重新计算租户的全部汇总（调用方负责提交事务）
+
+        锁住汇总表直至提交：锁定前已写入汇总的事务先完成提交并被本次重算计入，
+        锁定后的写入等待重算提交后再累加，计数不会重复或遗漏。
+        注意：已过期分离的分区不再参与重算，其历史汇总会丢失。
+        """
+        await session.execute(
+            text("LOCK TABLE translation_daily_stats, gap_category_daily_stats IN SHARE ROW EXCLUSIVE MODE")
+        )
+        await session.execute(delete(TranslationDailyStat).where(TranslationDailyStat.realm == realm))
+        await session.execute(delete(GapCategoryDailyStat).where(GapCategoryDailyStat.realm == realm))
+        await session.execute(_REBUILD_DAILY_SQL, {"realm": realm})
+        await session.execute(_REBUILD_GAPS_SQL, {"realm": realm})
@@ -2,31 +2,132 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import hashlib
+import zlib
+from collections.abc import AsyncIterator, Iterable, Mapping
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
-from sqlalchemy import desc, func, select
+import orjson
+from sqlalchemy import CursorResult, RowMapping, Select, delete, desc, func, or_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from domain.translate.model.translation import Translation
+from config import config_manager
+from core.context.request import get_request_context
+from core.database.ids import uuid7_time
+from core.logging import get_logger
+from domain.translate.model.body import TranslationBody
+from domain.translate.model.translation import Translation, TranslationStatus
+from domain.translate.repository.archive_repository import TranslationArchive
 
 
 if TYPE_CHECKING:
     from domain.translate.agent.translate_agent import TranslateResult
 
 
+logger = get_logger(__name__)
+
+# UUIDv7 时间戳（应用时钟）与 created_at（数据库时钟）之间允许的偏差
+_ID_TIME_SLACK = timedelta(hours=1)
+
+# 列表预览截取的字符数
+PREVIEW_LENGTH = 200
+
+# 历史列表投影：只取截断预览、缺失项数量与元数据，不加载完整正文和 JSONB
+_SUMMARY_COLUMNS = (
+    Translation.id,
+    func.left(Translation.content, PREVIEW_LENGTH).label("content_preview"),
+    func.left(Translation.translated_content, PREVIEW_LENGTH).label("translated_preview"),
+    Translation.direction,
+    Translation.detected_perspective,
+    func.coalesce(func.jsonb_array_length(Translation.gaps_identified["gaps"]), 0).label("gap_count"),
+    Translation.status,
+    Translation.created_at,
+)
+
+
+# 归档列：完整记录（正文外置时由 resolve_bodies 补全）
+_ARCHIVE_COLUMNS = (
+    Translation.id,
+    Translation.realm,
+    Translation.username,
+    Translation.content,
+    Translation.translated_content,
+    Translation.content_hash,
+    Translation.translated_hash,
+    Translation.direction,
+    Translation.detected_perspective,
+    Translation.gaps_identified,
+    Translation.status,
+    Translation.created_at,
+)
+
+# 导出列：正文（外置时为前缀，由 resolve_bodies 补全），不含内部字段
+_EXPORT_COLUMNS = (
+    Translation.id,
+    Translation.content,
+    Translation.translated_content,
+    Translation.content_hash,
+    Translation.translated_hash,
+    Translation.direction,
+    Translation.detected_perspective,
+    Translation.gaps_identified,
+    Translation.status,
+    Translation.username,
+    Translation.created_at,
+)
+
+
+def body_hash(body: str) -> bytes:
+    """正文内容哈希（UTF-8 编码的 SHA-256）"""
+    return hashlib.sha256(body.encode()).digest()
+
+
+def full_text(inline: str, digest: bytes | None, bodies: Mapping[bytes, str]) -> str:
+    """还原完整正文：未外置时即内联内容，外置时取已解析的正文"""
+    if digest is None:
+        return inline
+    if (body := bodies.get(digest)) is None:
+        logger.warning("外置正文缺失，返回内联前缀: %s", digest.hex())
+        return inline
+    return body
+
+
+def _escape_like(value: str) -> str:
+    """转义 LIKE 通配符（PostgreSQL 默认以反斜杠为转义字符）"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 class TranslateRepository:
     """翻译记录仓储"""
 
+    def __init__(self, archive: TranslationArchive | None = None) -> None:
+        self.archive = archive
+
     async def create(
         self,
         session: AsyncSession,
         result: TranslateResult,
+        *,
+        status: TranslationStatus = TranslationStatus.COMPLETED,
     ) -> Translation:
-        """保存翻译记录"""
+        """保存翻译记录（租户与用户取自当前请求上下文）
+
+        启用正文外置时，长正文按内容哈希写入 translation_bodies（已存在则复用），记录中只保留前缀。
+        """
+        request_context = get_request_context()
+        bodies: dict[bytes, str] = {}
+        content, content_hash = self._offload(result.original_content, bodies)
+        translated_content, translated_hash = self._offload(result.translated_content, bodies)
+        if bodies:
+            await self._store_bodies(session, bodies)
         translation = Translation(
-            content=result.original_content,
-            translated_content=result.translated_content,
+            content=content,
+            translated_content=translated_content,
+            content_hash=content_hash,
+            translated_hash=translated_hash,
             direction=result.direction,
             detected_perspective=result.detected_perspective,
             gaps_identified={
@@ -35,34 +136,248 @@ class TranslateRepository:
             }
             if result.gaps
             else None,
+            status=status.value,
+            realm=request_context.realm,
+            username=request_context.username,
         )
         session.add(translation)
         await session.flush()
         return translation
 
+    @staticmethod
+    def _offload(body: str, bodies: dict[bytes, str]) -> tuple[str, bytes | None]:
+        """决定正文是否外置，返回 (内联内容, 内容哈希)"""
+        store_config = config_manager.database.body_store
+        if not store_config.enabled or len(body) < store_config.min_length:
+            return body, None
+        digest = body_hash(body)
+        bodies[digest] = body
+        return body[: max(store_config.inline_length, PREVIEW_LENGTH)], digest
+
+    @staticmethod
+    async def _store_bodies(session: AsyncSession, bodies: Mapping[bytes, str]) -> None:
+        """写入外置正文，相同哈希已存在时跳过（去重）"""
+        level = config_manager.database.body_store.compression_level
+        stmt = insert(TranslationBody).values(
+            [
+                {"hash": digest, "body": zlib.compress(body.encode(), level), "length": len(body)}
+                for digest, body in sorted(bodies.items())
+            ]
+        )
+        await session.execute(stmt.on_conflict_do_nothing(index_elements=["hash"]))
+
+    async def resolve_bodies(self, session: AsyncSession, digests: Iterable[bytes | None]) -> dict[bytes, str]:
+        """批量读取并解压外置正文（一次查询）"""
+        wanted = {digest for digest in digests if digest is not None}
+        if not wanted:
+            return {}
+        stmt = select(TranslationBody.hash, TranslationBody.body).where(TranslationBody.hash.in_(wanted))
+        result = await session.execute(stmt)
+        return {digest: zlib.decompress(body).decode() for digest, body in result.tuples()}
+
     async def get_by_id(
         self,
         session: AsyncSession,
+        realm: str,
         translation_id: UUID,
     ) -> Translation | None:
-        """根据 ID 获取翻译记录"""
-        stmt = select(Translation).where(Translation.id == translation_id)
+        """根据 ID 获取租户内的翻译记录
+
+        UUIDv7 的 ID 携带创建时间，附加 created_at 范围条件后只需扫描对应的月分区。
+        热表中不存在时回退到归档（返回未加入 Session 的临时实体，正文完整）。
+        """
+        stmt = select(Translation).where(Translation.id == translation_id, Translation.realm == realm)
+        if (id_time := uuid7_time(translation_id)) is not None:
+            stmt = stmt.where(Translation.created_at.between(id_time - _ID_TIME_SLACK, id_time + _ID_TIME_SLACK))
         result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+        if (translation := result.scalar_one_or_none()) is not None or self.archive is None:
+            return translation
+        if (record := await self.archive.get(session, realm, translation_id)) is None:
+            return None
+        return Translation(
+            id=UUID(record["id"]),
+            realm=record["realm"],
+            username=record["username"],
+            content=record["content"],
+            translated_content=record["translated_content"],
+            direction=record["direction"],
+            detected_perspective=record["detected_perspective"],
+            gaps_identified=record["gaps_identified"],
+            status=record.get("status", TranslationStatus.COMPLETED.value),
+            created_at=datetime.fromisoformat(record["created_at"]),
+        )
+
+    async def list_archivable(self, session: AsyncSession, before: datetime, limit: int) -> list[dict[str, Any]]:
+        """读取创建时间早于 before 的最早一批记录（全部租户），转换为归档格式（正文完整）"""
+        stmt = (
+            select(*_ARCHIVE_COLUMNS)
+            .where(Translation.created_at < before)
+            .order_by(Translation.created_at, Translation.id)
+            .limit(limit)
+        )
+        rows = (await session.execute(stmt)).mappings().all()
+        bodies = await self.resolve_bodies(
+            session, [digest for row in rows for digest in (row["content_hash"], row["translated_hash"])]
+        )
+        return [
+            {
+                "id": str(row["id"]),
+                "realm": row["realm"],
+                "username": row["username"],
+                "content": full_text(row["content"], row["content_hash"], bodies),
+                "translated_content": full_text(row["translated_content"], row["translated_hash"], bodies),
+                "direction": row["direction"],
+                "detected_perspective": row["detected_perspective"],
+                "gaps_identified": row["gaps_identified"],
+                "status": row["status"],
+                "created_at": row["created_at"].isoformat(),
+            }
+            for row in rows
+        ]
+
+    async def delete_archived(self, session: AsyncSession, ids: list[UUID], before: datetime) -> int:
+        """从热表删除已归档的记录（created_at 条件用于裁剪分区）"""
+        stmt = delete(Translation).where(Translation.id.in_(ids), Translation.created_at < before)
+        result = cast(CursorResult[Any], await session.execute(stmt))
+        return result.rowcount
 
     async def list_recent(
         self,
         session: AsyncSession,
+        realm: str,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Translation]:
-        """获取最近的翻译记录"""
-        stmt = select(Translation).order_by(desc(Translation.created_at)).offset(offset).limit(limit)
+        before: tuple[datetime, UUID] | None = None,
+    ) -> list[RowMapping]:
+        """获取租户最近的翻译记录摘要
+
+        按 (created_at, id) 倒序排列，走 (realm, created_at, id) 复合索引。传入 before 时使用键集分页，
+        只返回排在该位置之后的记录，查询代价与翻页深度无关；offset 仅用于兼容浅层页码分页。
+        完整正文只通过 get_by_id 获取。
+        """
+        stmt = (
+            select(*_SUMMARY_COLUMNS)
+            .where(Translation.realm == realm)
+            .order_by(desc(Translation.created_at), desc(Translation.id))
+        )
+        if before is not None:
+            stmt = stmt.where(tuple_(Translation.created_at, Translation.id) < before)
+        stmt = stmt.offset(offset).limit(limit)
         result = await session.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.mappings().all())
 
-    async def count(self, session: AsyncSession) -> int:
-        """统计翻译记录总数"""
-        stmt = select(func.count()).select_from(Translation)
+    async def search(
+        self,
+        session: AsyncSession,
+        realm: str,
+        query: str,
+        *,
+        direction: str | None = None,
+        perspective: str | None = None,
+        category: str | None = None,
+        limit: int = 20,
+        after: tuple[float, datetime, UUID] | None = None,
+    ) -> list[RowMapping]:
+        """在租户内按关键词搜索翻译记录摘要
+
+        原文或译文包含关键词（ILIKE，由 pg_trgm GIN 索引加速，不依赖分词）即命中，
+        按三元组相似度、创建时间倒序排列，after 为上一页最后一条的 (rank, created_at, id)。
+        缺失信息分类通过 JSONB 包含查询过滤（gaps_identified 的 jsonb_path_ops GIN 索引）。
+        """
+        pattern = "%" + _escape_like(query) + "%"
+        rank = func.greatest(
+            func.similarity(Translation.content, query),
+            func.similarity(Translation.translated_content, query),
+        )
+        stmt = select(*_SUMMARY_COLUMNS, rank.label("rank")).where(
+            Translation.realm == realm,
+            or_(
+                Translation.content.ilike(pattern),
+                Translation.translated_content.ilike(pattern),
+            ),
+        )
+        if direction:
+            stmt = stmt.where(Translation.direction == direction)
+        if perspective:
+            stmt = stmt.where(Translation.detected_perspective == perspective)
+        if category:
+            stmt = stmt.where(Translation.gaps_identified.contains({"gaps": [{"category": category}]}))
+        if after is not None:
+            stmt = stmt.where(tuple_(rank, Translation.created_at, Translation.id) < after)
+        stmt = stmt.order_by(desc(rank), desc(Translation.created_at), desc(Translation.id)).limit(limit)
+        result = await session.execute(stmt)
+        return list(result.mappings().all())
+
+    async def stream_export(
+        self,
+        session: AsyncSession,
+        realm: str,
+        *,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        direction: str | None = None,
+        after: tuple[datetime, UUID] | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """按 (created_at, id) 正序分批流式读取租户的完整翻译记录
+
+        使用服务端游标（yield_per）每次只拉取 batch_size 行，内存占用与导出总量无关；
+        只查询列而非 ORM 实体，不会在 Session 身份映射中累积对象。外置正文按批一次性解析。
+        时间范围为 [start, end)，可裁剪分区；after 为已导出的最后一条 (created_at, id)，用于断点续传。
+        """
+        stmt = select(*_EXPORT_COLUMNS).where(Translation.realm == realm)
+        if start is not None:
+            stmt = stmt.where(Translation.created_at >= start)
+        if end is not None:
+            stmt = stmt.where(Translation.created_at < end)
+        if direction:
+            stmt = stmt.where(Translation.direction == direction)
+        if after is not None:
+            stmt = stmt.where(tuple_(Translation.created_at, Translation.id) > after)
+        stmt = stmt.order_by(Translation.created_at, Translation.id).execution_options(yield_per=batch_size)
+        result = await session.stream(stmt)
+        async for partition in result.mappings().partitions(batch_size):
+            bodies = await self.resolve_bodies(
+                session, [digest for row in partition for digest in (row["content_hash"], row["translated_hash"])]
+            )
+            batch: list[dict[str, Any]] = []
+            for row in partition:
+                item = dict(row)
+                item["content"] = full_text(row["content"], item.pop("content_hash"), bodies)
+                item["translated_content"] = full_text(row["translated_content"], item.pop("translated_hash"), bodies)
+                batch.append(item)
+            yield batch
+
+    async def latest_created_at(self, session: AsyncSession, realm: str) -> datetime | None:
+        """获取租户最新一条记录的创建时间（走 (realm, created_at) 索引，代价很低）"""
+        stmt = select(func.max(Translation.created_at)).where(Translation.realm == realm)
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def count(self, session: AsyncSession, realm: str) -> int:
+        """统计租户翻译记录总数"""
+        stmt = select(func.count()).select_from(Translation).where(Translation.realm == realm)
         result = await session.execute(stmt)
         return result.scalar_one()
+
+    async def count_estimate(self, session: AsyncSession, realm: str, exact_threshold: int) -> tuple[int, bool]:
+        """统计租户翻译记录总数（大表返回规划器估算值）
+
+        先读取查询规划器基于统计信息给出的行数估算，低于 exact_threshold 时再执行精确 count(*)。
+
+        Returns:
+            (总数, 是否为估算值)
+        """
+        estimate = await self._estimate_rows(session, select(Translation.id).where(Translation.realm == realm))
+        if estimate < exact_threshold:
+            return await self.count(session, realm), False
+        return estimate, True
+
+    async def _estimate_rows(self, session: AsyncSession, stmt: Select[Any]) -> int:
+        """通过 EXPLAIN 获取规划器对查询结果行数的估算"""
+        compiled = stmt.compile(dialect=session.get_bind().dialect, compile_kwargs={"literal_binds": True})
+        result = await session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+        plan = result.scalar_one()
+        if isinstance(plan, str | bytes):
+            plan = orjson.loads(plan)
+        return int(cast(list[dict[str, Any]], plan)[0]["Plan"]["Plan Rows"])
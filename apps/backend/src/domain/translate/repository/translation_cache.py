@@ -0,0 +1,58 @@
+"""翻译详情读穿缓存"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from uuid import UUID
+
+import orjson
+
+from config import config_manager
+from core.cache.redis_service import RedisService
+from domain.translate.schema.response import TranslationRecord
+
+
+_NAMESPACE = "translation"
+
+
+def _encode(record: TranslationRecord) -> bytes:
+    return orjson.dumps(record.model_dump())
+
+
+def _decode(raw: str | bytes) -> TranslationRecord:
+    return TranslationRecord.model_validate(orjson.loads(raw))
+
+
+class TranslationCache:
+    """翻译详情缓存
+
+    翻译记录创建后不再修改，以租户 + ID 为 key 长期缓存，写入时直接回填。
+    """
+
+    def __init__(self, redis: RedisService) -> None:
+        self.redis = redis
+        self.ttl = config_manager.redis.translation_cache_ttl
+
+    @staticmethod
+    def _key(realm: str, translation_id: UUID) -> str:
+        return f"{_NAMESPACE}:{realm}:{translation_id}"
+
+    async def get_or_load(
+        self,
+        realm: str,
+        translation_id: UUID,
+        loader: Callable[[], Awaitable[TranslationRecord | None]],
+    ) -> TranslationRecord | None:
+        """读取缓存，未命中时回源加载并回填"""
+        return await self.redis.read_through(
+            self._key(realm, translation_id),
+            loader,
+            encode=_encode,
+            decode=_decode,
+            ex=self.ttl,
+            namespace=_NAMESPACE,
+        )
+
+    async def put(self, realm: str, record: TranslationRecord) -> None:
+        """写入缓存（持久化后回填）"""
+        await self.redis.set(self._key(realm, record.id), _encode(record), ex=self.ttl)
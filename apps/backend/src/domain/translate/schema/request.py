@@ -14,3 +14,7 @@ class TranslateRequest(BaseModel):
     content: str = Field(..., min_length=1, max_length=10000, description="待翻译内容")
     stream: bool = Field(default=True, description="是否流式输出")
     context: str | None = Field(default=None, max_length=2000, description="补充上下文")
+    lean_done: bool = Field(
+        default=False,
+        description="流式模式下 message_done 只返回 ID、长度与校验和（也可用 Prefer: return=minimal 请求头开启）",
+    )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 from uuid import UUID
 
@@ -17,6 +17,10 @@ def _empty_suggestions() -> list[str]:
     return []
 
 
+def _empty_stages() -> list[str]:
+    return []
+
+
 class TranslateResponse(BaseModel):
     """翻译响应（同步模式）"""
 
@@ -26,6 +30,10 @@ class TranslateResponse(BaseModel):
     detected_perspective: str = Field(description="识别的视角")
     gaps: list[dict[str, Any]] = Field(default_factory=_empty_gaps, description="识别的缺失信息")
     suggestions: list[str] = Field(default_factory=_empty_suggestions, description="补充建议")
+    skipped_stages: list[str] = Field(
+        default_factory=_empty_stages,
+        description="因请求时限不足、LLM 熔断或过载降级而跳过的阶段: detect_perspective / analyze_gaps",
+    )
 
 
 class TranslationRecord(BaseModel):
@@ -37,7 +45,75 @@ class TranslationRecord(BaseModel):
     direction: str = Field(description="翻译方向")
     detected_perspective: str | None = Field(default=None, description="识别的视角")
     gaps: list[dict[str, Any]] = Field(default_factory=_empty_gaps, description="识别的缺失信息")
+    status: str = Field(default="completed", description="状态: completed / cancelled（译文不完整）")
     created_at: datetime = Field(description="创建时间")
 
     class Config:
         from_attributes = True
+
+
+class TranslationSummary(BaseModel):
+    """翻译历史列表项（不含完整正文）"""
+
+    id: UUID
+    content_preview: str = Field(description="原始内容预览")
+    translated_preview: str = Field(description="翻译结果预览")
+    direction: str = Field(description="翻译方向")
+    detected_perspective: str | None = Field(default=None, description="识别的视角")
+    gap_count: int = Field(default=0, description="缺失信息数量")
+    status: str = Field(default="completed", description="状态: completed / cancelled（译文不完整）")
+    created_at: datetime = Field(description="创建时间")
+
+
+class TranslationHistory(BaseModel):
+    """翻译历史分页结果"""
+
+    content: list[TranslationSummary] = Field(description="当前页记录")
+    total: int = Field(description="记录总数")
+    total_estimated: bool = Field(default=False, description="总数是否为规划器估算值")
+    page: int = Field(description="页码")
+    size: int = Field(description="每页数量")
+    total_pages: int = Field(description="总页数")
+    next_cursor: str | None = Field(default=None, description="下一页游标，为空表示没有更多记录")
+
+
+class TranslationSearchHit(TranslationSummary):
+    """搜索结果项"""
+
+    rank: float = Field(description="相关度（三元组相似度）")
+
+
+class TranslationSearchResult(BaseModel):
+    """搜索分页结果"""
+
+    content: list[TranslationSearchHit] = Field(description="当前页结果")
+    size: int = Field(description="每页数量")
+    next_cursor: str | None = Field(default=None, description="下一页游标，为空表示没有更多结果")
+
+
+class DailyTranslationStat(BaseModel):
+    """每日翻译量"""
+
+    day: date = Field(description="日期（UTC）")
+    direction: str = Field(description="翻译方向")
+    perspective: str = Field(description="识别的视角")
+    count: int = Field(description="翻译数")
+
+
+class GapCategoryStat(BaseModel):
+    """缺失信息分类出现次数"""
+
+    category: str = Field(description="缺失信息分类")
+    count: int = Field(description="出现次数")
+
+
+class TranslationStats(BaseModel):
+    """翻译统计看板数据"""
+
+    start: date = Field(description="起始日期（含）")
+    end: date = Field(description="结束日期（含）")
+    total: int = Field(description="翻译总数")
+    by_direction: dict[str, int] = Field(description="按翻译方向汇总")
+    by_perspective: dict[str, int] = Field(description="按识别视角汇总")
+    daily: list[DailyTranslationStat] = Field(description="每日明细")
+    top_gap_categories: list[GapCategoryStat] = Field(description="出现最多的缺失信息分类")
@@ -0,0 +1,78 @@
+"""翻译历史导出格式（NDJSON / CSV）"""
+
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import Mapping, Sequence
+from typing import Any, Literal
+
+import orjson
+
+from core.api.cursor import encode_cursor
+
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# 格式 -> (Content-Type, 文件扩展名)
+EXPORT_MEDIA_TYPES: dict[str, tuple[str, str]] = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+}
+
+_CSV_FIELDS = (
+    "id",
+    "content",
+    "translated_content",
+    "direction",
+    "detected_perspective",
+    "gaps",
+    "suggestions",
+    "status",
+    "username",
+    "created_at",
+    "cursor",
+)
+
+
+def _export_record(row: Mapping[str, Any]) -> dict[str, Any]:
+    """数据库行转换为导出记录，cursor 可直接作为续传参数"""
+    gaps_identified = row["gaps_identified"] or {}
+    created_at = row["created_at"].isoformat()
+    translation_id = str(row["id"])
+    return {
+        "id": translation_id,
+        "content": row["content"],
+        "translated_content": row["translated_content"],
+        "direction": row["direction"],
+        "detected_perspective": row["detected_perspective"],
+        "gaps": gaps_identified.get("gaps", []),
+        "suggestions": gaps_identified.get("suggestions", []),
+        "status": row["status"],
+        "username": row["username"],
+        "created_at": created_at,
+        "cursor": encode_cursor([created_at, translation_id]),
+    }
+
+
+def export_header(fmt: ExportFormat) -> bytes:
+    """导出内容的起始部分（CSV 表头）"""
+    if fmt != "csv":
+        return b""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(_CSV_FIELDS)
+    return buffer.getvalue().encode()
+
+
+def encode_rows(fmt: ExportFormat, rows: Sequence[Mapping[str, Any]]) -> bytes:
+    """将一批行编码为一个输出块"""
+    records = [_export_record(row) for row in rows]
+    if fmt == "ndjson":
+        return b"".join(orjson.dumps(record) + b"\n" for record in records)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for record in records:
+        record["gaps"] = orjson.dumps(record["gaps"]).decode()
+        record["suggestions"] = orjson.dumps(record["suggestions"]).decode()
+        writer.writerow(record[field] for field in _CSV_FIELDS)
+    return buffer.getvalue().encode()
@@ -0,0 +1,116 @@
+"""翻译数据维护服务"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+from uuid import UUID
+
+from sqlalchemy import CursorResult, text
+
+from config import config_manager
+from core.database.partition import MonthlyPartitionManager, PartitionReport
+from core.database.session import session_scope
+from core.logging import get_logger
+from domain.translate.model.translation import Translation
+from domain.translate.repository.archive_repository import TranslationArchive
+from domain.translate.repository.translate_repository import TranslateRepository
+
+
+logger = get_logger(__name__)
+
+# 不再被任何翻译记录引用的外置正文
+_PURGE_ORPHAN_BODIES_SQL = text("""
+    DELETE FROM translation_bodies b
+    WHERE NOT EXISTS (SELECT 1 FROM translations t WHERE t.content_hash = b.hash)
+      AND NOT EXISTS (SELECT 1 FROM translations t WHERE t.translated_hash = b.hash)
+""")
+
+# 归档任务的事务级咨询锁，避免多实例同时归档同一批记录
+_ARCHIVE_LOCK_SQL = text("SELECT pg_try_advisory_xact_lock(hashtext('bridgetalk:translations:archive'))")
+
+
+@dataclass
+class ArchiveReport:
+    """一次归档的结果"""
+
+    segments: int = 0
+    archived: int = 0
+
+
+class TranslationMaintenance:
+    """翻译表维护：按月分区预建与过期分区清理、冷数据归档、孤立外置正文清理"""
+
+    def __init__(self, repository: TranslateRepository, archive: TranslationArchive) -> None:
+        self.partitions = MonthlyPartitionManager(Translation.__tablename__)
+        self.repository = repository
+        self.archive = archive
+
+    async def maintain_partitions(self) -> PartitionReport:
+        """预建未来分区，并按保留期分离或删除过期分区（替代逐行 DELETE）
+
+        过期分区被删除（drop_expired）且启用了正文外置时，随后清理不再被引用的外置正文；
+        仅分离的分区仍引用其正文，不做清理。
+        """
+        partition_config = config_manager.database.partitioning
+        async with session_scope() as session:
+            report = await self.partitions.maintain(
+                session,
+                months_ahead=partition_config.premake_months,
+                retention_months=partition_config.retention_months,
+                drop=partition_config.drop_expired,
+            )
+            await session.commit()
+        if partition_config.drop_expired and config_manager.database.body_store.enabled:
+            await self.purge_orphan_bodies()
+        return report
+
+    async def archive_cold(self) -> ArchiveReport:
+        """将早于 after_days 的记录移入归档段文件，并从热表删除
+
+        每批在一个事务内完成：读取 → 写段文件与索引 → 删除热表记录 → 提交；
+        提交失败时删除已写出的段文件，记录仍留在热表，下次重试。
+        """
+        archive_config = config_manager.archive
+        report = ArchiveReport()
+        if not archive_config.enabled:
+            return report
+        before = datetime.now(UTC) - timedelta(days=archive_config.after_days)
+        for _ in range(archive_config.max_batches):
+            async with session_scope() as session:
+                if not (await session.execute(_ARCHIVE_LOCK_SQL)).scalar_one():
+                    logger.info("归档任务正在其他实例执行，跳过")
+                    break
+                records = await self.repository.list_archivable(session, before, archive_config.batch_size)
+                if not records:
+                    break
+                segment = await self.archive.write_segment(session, records)
+                try:
+                    await self.repository.delete_archived(session, [UUID(record["id"]) for record in records], before)
+                    await session.commit()
+                except BaseException:
+                    await self.archive.discard(segment)
+                    raise
+            report.segments += 1
+            report.archived += len(records)
+            if len(records) < archive_config.batch_size:
+                break
+        if report.archived:
+            logger.info("冷数据归档完成: 段文件=%s, 记录数=%s", report.segments, report.archived)
+            if config_manager.database.body_store.enabled:
+                await self.purge_orphan_bodies()
+        return report
+
+    async def purge_orphan_bodies(self) -> int:
+        """删除不再被引用的外置正文
+
+        外键保证清理期间被新记录复用的正文不会被误删（此时本次清理失败，下次维护重试）。
+        """
+        async with session_scope() as session:
+            result = cast(CursorResult[Any], await session.execute(_PURGE_ORPHAN_BODIES_SQL))
+            await session.commit()
+        purged = result.rowcount
+        if purged:
+            logger.info("已清理孤立外置正文: %s 条", purged)
+        return purged
@@ -2,16 +2,161 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
+import hashlib
+from collections import Counter
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
 from langchain_core.language_models import BaseChatModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import config_manager
+from core.api.cursor import decode_cursor, encode_cursor
+from core.api.etag import make_etag
+from core.context.request import current_realm
+from core.database.ids import uuid7_time
+from core.database.session import mark_primary_write, read_session_scope, session_scope
+from core.logging import get_logger
+from core.metrics import metrics_registry
 from domain.translate.agent.translate_agent import TranslateAgent, TranslateResult
-from domain.translate.repository.translate_repository import TranslateRepository
-from domain.translate.schema.response import TranslateResponse, TranslationRecord
+from domain.translate.model.translation import Translation, TranslationStatus
+from domain.translate.repository.recent_history import RecentHistoryBuffer, epoch_micros
+from domain.translate.repository.stats_repository import TranslationStatsRepository
+from domain.translate.repository.translate_repository import PREVIEW_LENGTH, TranslateRepository, full_text
+from domain.translate.repository.translation_cache import TranslationCache
+from domain.translate.schema.response import (
+    DailyTranslationStat,
+    GapCategoryStat,
+    TranslateResponse,
+    TranslationRecord,
+    TranslationStats,
+    TranslationSummary,
+)
+from domain.translate.service.history_export import ExportFormat, encode_rows, export_header
+
+
+logger = get_logger(__name__)
+
+# 响应结构变化时递增，使客户端缓存的 ETag 失效
+REPRESENTATION_VERSION = 1
+
+# 统计接口默认查询最近的天数
+DEFAULT_STATS_DAYS = 30
+
+# 客户端断开时用于组装部分译文的预处理事件
+_PARTIAL_EVENTS = frozenset({"perspective_detected", "gaps_identified", "translation_start"})
+
+_stream_outcomes = metrics_registry.counter(
+    "bridgetalk_translate_streams_total",
+    "流式翻译结果（completed / failed / cancelled）",
+    labels=("outcome",),
+)
+
+
+def _to_record(translation: Translation, bodies: Mapping[bytes, str]) -> TranslationRecord:
+    """ORM 实体转换为详情记录（bodies 为已解析的外置正文）"""
+    return TranslationRecord(
+        id=translation.id,
+        content=full_text(translation.content, translation.content_hash, bodies),
+        translated_content=full_text(translation.translated_content, translation.translated_hash, bodies),
+        direction=translation.direction,
+        detected_perspective=translation.detected_perspective,
+        gaps=translation.gaps_identified.get("gaps", []) if translation.gaps_identified else [],
+        status=translation.status,
+        created_at=translation.created_at,
+    )
+
+
+def _to_summary(record: TranslationRecord) -> TranslationSummary:
+    """详情记录转换为列表摘要（与 SQL 摘要投影保持一致）"""
+    return TranslationSummary(
+        id=record.id,
+        content_preview=record.content[:PREVIEW_LENGTH],
+        translated_preview=record.translated_content[:PREVIEW_LENGTH],
+        direction=record.direction,
+        detected_perspective=record.detected_perspective,
+        gap_count=len(record.gaps),
+        status=record.status,
+        created_at=record.created_at,
+    )
+
+
+def _iso(value: datetime | str) -> str:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _build_history(
+    items: Sequence[Any],
+    last: Mapping[str, Any] | None,
+    total: int,
+    page: int,
+    size: int,
+    *,
+    estimated: bool,
+) -> dict[str, Any]:
+    """组装历史分页结果（结构同 TranslationHistory），满页时由最后一项生成下一页游标
+
+    items 为摘要字典或缓冲中已编码的摘要片段，直接交给 orjson 编码，不经过 Pydantic 模型。
+    """
+    next_cursor = None
+    if len(items) == size and last is not None:
+        next_cursor = encode_cursor([_iso(last["created_at"]), str(last["id"])])
+    return {
+        "content": items,
+        "total": total,
+        "total_estimated": estimated,
+        "page": page,
+        "size": size,
+        "total_pages": (total + size - 1) // size,
+        "next_cursor": next_cursor,
+    }
+
+
+def _lean_done_data(data: Mapping[str, Any]) -> dict[str, Any]:
+    """精简的 message_done 数据：内容长度与校验和基于增量拼接结果（即完整译文）的 UTF-8 编码"""
+    encoded = data.get("translated_content", "").encode()
+    lean: dict[str, Any] = {
+        "translation_id": data["translation_id"],
+        "content_length": len(encoded),
+        "sha256": hashlib.sha256(encoded).hexdigest(),
+    }
+    if skipped_stages := data.get("skipped_stages"):
+        lean["skipped_stages"] = skipped_stages
+    return lean
+
+
+def _maybe_unreplicated(translation_id: UUID) -> bool:
+    """ID 内嵌的创建时间落在写后读窗口内，副本可能尚未回放该记录"""
+    db_config = config_manager.database
+    if not db_config.replicas or (created_at := uuid7_time(translation_id)) is None:
+        return False
+    window = max(db_config.read_your_writes_window, db_config.replica_max_lag)
+    return datetime.now(UTC) - created_at < timedelta(seconds=window)
+
+
+def _decode_history_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """解析历史游标为 (created_at, id)"""
+    values = decode_cursor(cursor)
+    try:
+        created_at, translation_id = values
+        return datetime.fromisoformat(created_at), UUID(translation_id)
+    except (TypeError, ValueError) as exc:
+        msg = "无效的分页游标"
+        raise ValueError(msg) from exc
+
+
+def _decode_search_cursor(cursor: str) -> tuple[float, datetime, UUID]:
+    """解析搜索游标为 (rank, created_at, id)"""
+    values = decode_cursor(cursor)
+    try:
+        rank, created_at, translation_id = values
+        return float(rank), datetime.fromisoformat(created_at), UUID(translation_id)
+    except (TypeError, ValueError) as exc:
+        msg = "无效的分页游标"
+        raise ValueError(msg) from exc
 
 
 class TranslateService:
@@ -21,13 +166,18 @@ class TranslateService:
         self,
         llm: BaseChatModel,
         repository: TranslateRepository,
+        cache: TranslationCache,
+        recent: RecentHistoryBuffer,
+        stats: TranslationStatsRepository,
     ) -> None:
         self.agent = TranslateAgent(llm)
         self.repository = repository
+        self.cache = cache
+        self.recent = recent
+        self.stats = stats
 
     async def translate(
         self,
-        session: AsyncSession,
         content: str,
         context: str | None = None,
     ) -> TranslateResponse:
@@ -36,8 +186,7 @@ class TranslateService:
         result = await self.agent.translate(content, context)
 
         # 保存记录
-        await self.repository.create(session, result)
-        await session.commit()
+        await self._save(result)
 
         return TranslateResponse(
             translated_content=result.translated_content,
@@ -46,20 +195,36 @@ class TranslateService:
             detected_perspective=result.detected_perspective,
             gaps=result.gaps,
             suggestions=result.suggestions,
+            skipped_stages=result.skipped_stages,
         )
 
     async def translate_stream(
         self,
-        session: AsyncSession,
         content: str,
         context: str | None = None,
+        *,
+        lean_done: bool = False,
     ) -> AsyncIterator[dict[str, Any]]:
-        """执行翻译（流式模式）"""
+        """执行翻译（流式模式）
+
+        lean_done 时 message_done 不再重复译文、缺失信息与建议（客户端已通过增量与 gaps_identified 收到），
+        只返回 translation_id、译文 UTF-8 字节数与 SHA-256，供客户端校验拼接结果；
+        因请求时限不足跳过了阶段时附带 skipped_stages。
+        """
         final_result: TranslateResult | None = None
         final_event_data: dict[str, Any] | None = None
+        # 已推送的预处理结果与译文增量，客户端断开时用于保存部分译文
+        partial: dict[str, Any] = {}
+        deltas: list[str] = []
 
         try:
             async for event in self.agent.translate_stream(content, context):
+                if event.get("event") == "content_delta":
+                    deltas.append(event["data"]["delta"])
+                elif event.get("event") in _PARTIAL_EVENTS:
+                    partial.update(event["data"])
+                elif event.get("event") == "error":
+                    _stream_outcomes.inc(outcome="failed")
                 # 捕获最终结果用于保存
                 if event.get("event") == "message_done":
                     data = event.get("data", {})
@@ -70,65 +235,279 @@ class TranslateService:
                         direction=data.get("direction", "unknown"),
                         gaps=data.get("gaps", []),
                         suggestions=data.get("suggestions", []),
+                        skipped_stages=data.get("skipped_stages", []),
                     )
                     final_event_data = data
                     # 先不 yield message_done，等保存后再发送
                     continue
                 yield event
+        except asyncio.CancelledError:
+            await self._on_stream_cancelled(content, partial, deltas)
+            raise
         finally:
             # 保存记录并发送包含 ID 的 message_done
             if final_result and final_event_data:
-                translation = await self.repository.create(session, final_result)
-                await session.commit()
+                translation = await self._save(final_result)
+                _stream_outcomes.inc(outcome="completed")
                 # 在 message_done 中添加翻译 ID
                 final_event_data["translation_id"] = str(translation.id)
                 yield {
                     "event": "message_done",
-                    "data": final_event_data,
+                    "data": _lean_done_data(final_event_data) if lean_done else final_event_data,
                 }
 
+    async def _on_stream_cancelled(self, content: str, partial: Mapping[str, Any], deltas: list[str]) -> None:
+        """流被取消（客户端断开）：记录取消结果，按 disconnect_policy 保存已生成的部分译文"""
+        _stream_outcomes.inc(outcome="cancelled")
+        persist = config_manager.streaming.disconnect_policy == "persist_partial" and bool(deltas)
+        logger.info("流式翻译已取消（客户端断开）: 已生成 %s 个增量, 保存部分译文=%s", len(deltas), persist)
+        if not persist:
+            return
+        result = TranslateResult(
+            original_content=content,
+            translated_content="".join(deltas),
+            detected_perspective=partial.get("perspective", "unknown"),
+            direction=partial.get("direction", "unknown"),
+            gaps=partial.get("gaps", []),
+            suggestions=partial.get("suggestions", []),
+        )
+        try:
+            # 屏蔽再次取消，保证部分译文写入完成
+            await asyncio.shield(self._save(result, status=TranslationStatus.CANCELLED))
+        except Exception:
+            logger.exception("保存部分译文失败")
+
+    async def _save(
+        self,
+        result: TranslateResult,
+        status: TranslationStatus = TranslationStatus.COMPLETED,
+    ) -> Translation:
+        """保存翻译记录（写入时才借出连接，提交后立即归还），并回填详情缓存与最近历史缓冲
+
+        统计汇总在同一事务中累加，与原始记录保持一致。
+        """
+        async with session_scope() as session:
+            translation = await self.repository.create(session, result, status=status)
+            await self.stats.record(session, translation)
+            await session.commit()
+        mark_primary_write()
+        # 外置正文即本次写入的内容，无需回查
+        bodies = {
+            digest: body
+            for digest, body in (
+                (translation.content_hash, result.original_content),
+                (translation.translated_hash, result.translated_content),
+            )
+            if digest is not None
+        }
+        record = _to_record(translation, bodies)
+        await self.cache.put(translation.realm, record)
+        await self.recent.push(_to_summary(record), realm=translation.realm)
+        return translation
+
     async def get_history(
         self,
         session: AsyncSession,
         page: int = 1,
         size: int = 20,
-    ) -> tuple[list[TranslationRecord], int]:
-        """获取翻译历史"""
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        """获取当前租户的翻译历史（结构同 TranslationHistory，供快速响应路径直接编码）
+
+        传入 cursor 时使用键集分页（忽略 page），否则按页码分页：落在最近历史缓冲内的页直接读取 Redis，
+        其余页查询数据库，偏移量受 max_offset 限制。
+        """
+        history_config = config_manager.history
+        realm = current_realm()
         offset = (page - 1) * size
-        translations = await self.repository.list_recent(session, limit=size, offset=offset)
-        total = await self.repository.count(session)
-
-        records = [
-            TranslationRecord(
-                id=t.id,
-                content=t.content,
-                translated_content=t.translated_content,
-                direction=t.direction,
-                detected_perspective=t.detected_perspective,
-                gaps=t.gaps_identified.get("gaps", []) if t.gaps_identified else [],
-                created_at=t.created_at,
+        if cursor:
+            before = _decode_history_cursor(cursor)
+            translations = await self.repository.list_recent(session, realm, limit=size, before=before)
+        elif (recent_page := await self.recent.read(offset, size)) is not None:
+            return _build_history(
+                recent_page.items,
+                recent_page.last,
+                recent_page.total,
+                page,
+                size,
+                estimated=recent_page.estimated,
+            )
+        else:
+            if offset > history_config.max_offset:
+                msg = f"页码过大（偏移量超过 {history_config.max_offset}），请使用 cursor 分页"
+                raise ValueError(msg)
+            translations = await self.repository.list_recent(session, realm, limit=size, offset=offset)
+        total, estimated = await self.repository.count_estimate(session, realm, history_config.exact_count_threshold)
+
+        summaries = [dict(row) for row in translations]
+        return _build_history(summaries, summaries[-1] if summaries else None, total, page, size, estimated=estimated)
+
+    async def search(
+        self,
+        session: AsyncSession,
+        query: str,
+        *,
+        direction: str | None = None,
+        perspective: str | None = None,
+        category: str | None = None,
+        size: int = 20,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        """搜索当前租户的翻译历史（按相关度排序，键集分页；结构同 TranslationSearchResult）"""
+        after = _decode_search_cursor(cursor) if cursor else None
+        rows = await self.repository.search(
+            session,
+            current_realm(),
+            query,
+            direction=direction,
+            perspective=perspective,
+            category=category,
+            limit=size,
+            after=after,
+        )
+        hits = [dict(row) for row in rows]
+        next_cursor = None
+        if len(hits) == size:
+            last = hits[-1]
+            next_cursor = encode_cursor([last["rank"], last["created_at"].isoformat(), str(last["id"])])
+        return {"content": hits, "size": size, "next_cursor": next_cursor}
+
+    def export(
+        self,
+        fmt: ExportFormat,
+        *,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        direction: str | None = None,
+        cursor: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """导出当前租户的翻译历史
+
+        参数在返回流之前校验（非法游标或时间范围直接抛出 ValueError），
+        返回的字节流按 (created_at, id) 正序输出，每条记录携带可用于续传的 cursor。
+        """
+        after = _decode_history_cursor(cursor) if cursor else None
+        if start is not None and end is not None and start >= end:
+            msg = "时间范围无效：start 必须早于 end"
+            raise ValueError(msg)
+        return self._export_chunks(
+            fmt,
+            current_realm(),
+            start=start,
+            end=end,
+            direction=direction,
+            after=after,
+        )
+
+    async def _export_chunks(
+        self,
+        fmt: ExportFormat,
+        realm: str,
+        *,
+        start: datetime | None,
+        end: datetime | None,
+        direction: str | None,
+        after: tuple[datetime, UUID] | None,
+    ) -> AsyncIterator[bytes]:
+        """逐批编码输出，任一时刻内存中最多保留一批记录
+
+        服务端游标需要在整个导出期间占用一个连接，由独立的短生命周期只读 Session（优先只读副本）持有，
+        导出结束即归还。
+        """
+        yield export_header(fmt)
+        async with read_session_scope() as session:
+            batches = self.repository.stream_export(
+                session,
+                realm,
+                start=start,
+                end=end,
+                direction=direction,
+                after=after,
+                batch_size=config_manager.history.export_batch_size,
             )
-            for t in translations
-        ]
+            async for batch in batches:
+                yield encode_rows(fmt, batch)
+
+    async def get_stats(
+        self,
+        session: AsyncSession,
+        start: date | None = None,
+        end: date | None = None,
+        limit: int = 10,
+    ) -> TranslationStats:
+        """读取当前租户的统计看板数据（只查询汇总表）
+
+        默认查询截至今天（UTC）的最近 DEFAULT_STATS_DAYS 天。
+        """
+        end = end or datetime.now(UTC).date()
+        start = start or end - timedelta(days=DEFAULT_STATS_DAYS - 1)
+        max_days = config_manager.history.stats_max_days
+        if start > end:
+            msg = "日期范围无效：start 不能晚于 end"
+            raise ValueError(msg)
+        if (end - start).days + 1 > max_days:
+            msg = f"日期范围过大（最多 {max_days} 天）"
+            raise ValueError(msg)
+
+        realm = current_realm()
+        daily = [DailyTranslationStat.model_validate(row) for row in await self.stats.daily(session, realm, start, end)]
+        categories = await self.stats.top_gap_categories(session, realm, start, end, limit)
+        by_direction: Counter[str] = Counter()
+        by_perspective: Counter[str] = Counter()
+        for item in daily:
+            by_direction[item.direction] += item.count
+            by_perspective[item.perspective] += item.count
+        return TranslationStats(
+            start=start,
+            end=end,
+            total=sum(by_direction.values()),
+            by_direction=dict(by_direction),
+            by_perspective=dict(by_perspective),
+            daily=daily,
+            top_gap_categories=[GapCategoryStat.model_validate(row) for row in categories],
+        )
+
+    async def history_etag(self, session: AsyncSession) -> str:
+        """历史列表的弱 ETag：由最新记录的创建时间派生，有新记录时失效（优先读取最近历史缓冲）"""
+        if (marker := await self.recent.latest_marker()) is None:
+            latest = await self.repository.latest_created_at(session, current_realm())
+            marker = str(epoch_micros(latest)) if latest else "empty"
+        return make_etag("history", current_realm(), marker, f"v{REPRESENTATION_VERSION}", weak=True)
 
-        return records, total
+    @staticmethod
+    def detail_etag(translation_id: UUID) -> str:
+        """详情的强 ETag：记录不可变，由租户、ID 与版本号派生，无需加载记录"""
+        return make_etag(current_realm(), translation_id, f"v{REPRESENTATION_VERSION}")
 
     async def get_by_id(
         self,
         session: AsyncSession,
         translation_id: UUID,
     ) -> TranslationRecord | None:
-        """根据 ID 获取翻译记录"""
-        translation = await self.repository.get_by_id(session, translation_id)
-        if not translation:
-            return None
+        """根据 ID 获取当前租户的翻译记录（优先读取缓存）
 
-        return TranslationRecord(
-            id=translation.id,
-            content=translation.content,
-            translated_content=translation.translated_content,
-            direction=translation.direction,
-            detected_perspective=translation.detected_perspective,
-            gaps=translation.gaps_identified.get("gaps", []) if translation.gaps_identified else [],
-            created_at=translation.created_at,
-        )
+        session 可能来自只读副本：刚创建的记录在副本上未找到时（复制延迟），改从主库读取。
+        """
+        realm = current_realm()
+
+        async def load() -> TranslationRecord | None:
+            record = await self._load_record(session, realm, translation_id)
+            if record is None and _maybe_unreplicated(translation_id):
+                async with session_scope() as primary:
+                    record = await self._load_record(primary, realm, translation_id)
+            return record
+
+        return await self.cache.get_or_load(realm, translation_id, load)
+
+    async def _load_record(
+        self,
+        session: AsyncSession,
+        realm: str,
+        translation_id: UUID,
+    ) -> TranslationRecord | None:
+        """从数据库加载详情记录，外置正文在同一 Session 中解析"""
+        translation = await self.repository.get_by_id(session, realm, translation_id)
+        if translation is None:
+            return None
+        bodies = await self.repository.resolve_bodies(session, (translation.content_hash, translation.translated_hash))
+        return _to_record(translation, bodies)
@@ -0,0 +1,208 @@
+"""LLM 熔断器：按处理阶段统计调用失败率，上游故障时快速失败或降级"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from enum import Enum
+from typing import Any
+
+from config import config_manager
+from core.admission.controller import admission_controller
+from core.context.deadline import DeadlineExceededError
+from core.logging import get_logger
+from core.metrics import metrics_registry
+from llm.scheduler import llm_scheduler
+
+
+logger = get_logger(__name__)
+
+_circuit_state = metrics_registry.gauge(
+    "bridgetalk_llm_circuit_state",
+    "LLM 熔断器状态（0=closed, 1=half_open, 2=open）",
+    labels=("stage",),
+)
+_circuit_rejected = metrics_registry.counter(
+    "bridgetalk_llm_circuit_rejected_total",
+    "熔断期间被拒绝（快速失败或降级）的 LLM 调用数",
+    labels=("stage",),
+)
+_circuit_transitions = metrics_registry.counter(
+    "bridgetalk_llm_circuit_transitions_total",
+    "熔断器状态切换次数",
+    labels=("stage", "state"),
+)
+
+
+class CircuitState(str, Enum):
+    """熔断器状态"""
+
+    CLOSED = "closed"  # 正常调用，统计失败率
+    HALF_OPEN = "half_open"  # 冷却结束，放行少量探测调用
+    OPEN = "open"  # 熔断中，直接拒绝
+
+
+_STATE_VALUES = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+class CircuitOpenError(RuntimeError):
+    """熔断器打开，调用被拒绝"""
+
+    def __init__(self, stage: str) -> None:
+        super().__init__(f"LLM 服务暂不可用（{stage} 已熔断）")
+        self.stage = stage
+
+
+class CircuitBreaker:
+    """单个阶段的熔断器
+
+    closed 时在 window_seconds 滑动窗口内统计调用结果，调用数不少于 min_calls 且失败率达到 failure_rate 时打开；
+    打开 open_seconds 后进入 half_open，放行 half_open_probes 个探测调用，全部成功则关闭，任一失败重新打开。
+    请求时限不足（DeadlineExceededError）与取消不计入结果。
+    """
+
+    def __init__(self, stage: str) -> None:
+        self.stage = stage
+        self._state = CircuitState.CLOSED
+        # 滑动窗口内的调用结果：每项为完成时间与是否失败
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        self._probes = 0  # 进行中的探测调用数
+        self._probe_successes = 0
+        _circuit_state.set(0, stage=stage)
+
+    @property
+    def state(self) -> CircuitState:
+        """当前状态（打开超过 open_seconds 后转为 half_open）"""
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= config_manager.llm.circuit_breaker.open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def allow(self) -> bool:
+        """是否允许调用（不占用探测名额，用于提前判断是否快速失败）"""
+        if not config_manager.llm.circuit_breaker.enabled:
+            return True
+        state = self.state
+        if state is CircuitState.HALF_OPEN:
+            return self._probes < config_manager.llm.circuit_breaker.half_open_probes
+        return state is CircuitState.CLOSED
+
+    def snapshot(self) -> dict[str, Any]:
+        """状态快照（健康检查使用）"""
+        self._trim(time.monotonic())
+        failures = sum(failed for _, failed in self._outcomes)
+        return {
+            "state": self.state.value,
+            "calls": len(self._outcomes),
+            "failure_rate": round(failures / len(self._outcomes), 3) if self._outcomes else 0.0,
+        }
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[None]:
+        """包裹一次 LLM 调用：熔断时抛出 CircuitOpenError，否则经调度器排队后调用并记录结果
+
+        调用（含排队）计入进行中的 LLM 调用；排队超过请求时限抛出 DeadlineExceededError，不计入失败。
+        """
+        if not config_manager.llm.circuit_breaker.enabled:
+            with admission_controller.llm_call():
+                async with llm_scheduler.slot():
+                    yield
+            return
+        probe = self._acquire()
+        try:
+            with admission_controller.llm_call():
+                async with llm_scheduler.slot():
+                    yield
+        except DeadlineExceededError:
+            raise
+        except Exception:
+            self._record(probe, failed=True)
+            raise
+        else:
+            self._record(probe, failed=False)
+        finally:
+            if probe:
+                self._probes -= 1
+
+    def _acquire(self) -> bool:
+        """占用一次调用名额，返回是否为探测调用"""
+        if not self.allow():
+            _circuit_rejected.inc(stage=self.stage)
+            raise CircuitOpenError(self.stage)
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes += 1
+            return True
+        return False
+
+    def _record(self, probe: bool, *, failed: bool) -> None:
+        breaker_config = config_manager.llm.circuit_breaker
+        if probe:
+            if failed:
+                self._open()
+            else:
+                self._probe_successes += 1
+                if self._probe_successes >= breaker_config.half_open_probes:
+                    self._outcomes.clear()
+                    self._transition(CircuitState.CLOSED)
+            return
+        if self._state is not CircuitState.CLOSED:
+            return  # 打开前发出的调用，结果不再影响状态
+        now = time.monotonic()
+        self._outcomes.append((now, failed))
+        self._trim(now)
+        failures = sum(failed for _, failed in self._outcomes)
+        if len(self._outcomes) >= breaker_config.min_calls and failures / len(self._outcomes) >= (
+            breaker_config.failure_rate
+        ):
+            self._open()
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - config_manager.llm.circuit_breaker.window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        if state is CircuitState.HALF_OPEN:
+            self._probe_successes = 0
+        if state is self._state:
+            return
+        logger.warning("LLM 熔断器状态变化: stage=%s %s -> %s", self.stage, self._state.value, state.value)
+        self._state = state
+        _circuit_state.set(_STATE_VALUES[state], stage=self.stage)
+        _circuit_transitions.inc(stage=self.stage, state=state.value)
+
+
+class CircuitBreakerRegistry:
+    """按处理阶段划分的熔断器集合"""
+
+    def __init__(self, stages: Iterable[str]) -> None:
+        self._breakers = {stage: CircuitBreaker(stage) for stage in stages}
+
+    def __getitem__(self, stage: str) -> CircuitBreaker:
+        return self._breakers[stage]
+
+    def guard(self, stage: str) -> AbstractAsyncContextManager[None]:
+        """包裹指定阶段的一次 LLM 调用（见 CircuitBreaker.guard）"""
+        return self._breakers[stage].guard()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """全部阶段的状态快照"""
+        return {stage: breaker.snapshot() for stage, breaker in self._breakers.items()}
+
+    @property
+    def degraded(self) -> bool:
+        """是否有阶段处于熔断或探测中"""
+        return any(breaker.state is not CircuitState.CLOSED for breaker in self._breakers.values())
+
+
+llm_breakers = CircuitBreakerRegistry(("detect_perspective", "analyze_gaps", "translate"))
@@ -0,0 +1,153 @@
+"""LLM 调用调度：按请求类型分优先级，同一优先级内按租户权重公平排队"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+
+from config import config_manager
+from core.context.deadline import DeadlineExceededError, remaining_time
+from core.context.request import current_realm
+from core.metrics import metrics_registry
+
+
+_queue_wait = metrics_registry.histogram(
+    "bridgetalk_llm_queue_wait_seconds",
+    "LLM 调用排队等待时间",
+    labels=("request_class",),
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+_queue_depth = metrics_registry.gauge(
+    "bridgetalk_llm_queue_depth",
+    "排队中的 LLM 调用数",
+    labels=("request_class",),
+)
+
+
+class RequestClass(str, Enum):
+    """请求类型，按声明顺序优先级从高到低"""
+
+    INTERACTIVE = "interactive"  # 流式翻译，用户正在等待首个 token
+    SYNC = "sync"  # 同步翻译
+    BATCH = "batch"  # 其他调用（运维命令、后台任务等）
+
+
+_request_class: ContextVar[RequestClass] = ContextVar("llm_request_class", default=RequestClass.BATCH)
+
+
+def set_request_class(request_class: RequestClass) -> None:
+    """设置当前请求的类型"""
+    _request_class.set(request_class)
+
+
+def clear_request_class() -> None:
+    """清理当前请求的类型（恢复为 batch）"""
+    _request_class.set(RequestClass.BATCH)
+
+
+@dataclass(order=True)
+class _Waiter:
+    start_tag: float
+    seq: int
+    request_class: RequestClass = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False)
+
+
+class LLMScheduler:
+    """LLM 并发调度器（进程内）
+
+    进行中的调用达到 max_concurrency 后新调用排队，空出名额时先调度高优先级类型（interactive > sync > batch）。
+    同一类型内采用起始时间公平排队（SFQ）：每个租户的调用按 1/权重 推进该租户的虚拟时间，
+    调度起始标签最小的调用，权重高的租户获得更多名额，单个租户的大量调用不会饿死其他租户。
+    """
+
+    def __init__(self) -> None:
+        self._active = 0
+        self._queues: dict[RequestClass, list[_Waiter]] = {request_class: [] for request_class in RequestClass}
+        self._virtual_time: dict[RequestClass, float] = dict.fromkeys(RequestClass, 0.0)
+        self._finish_tags: dict[tuple[RequestClass, str], float] = {}
+        self._seq = itertools.count()
+
+    @property
+    def active(self) -> int:
+        """进行中的调用数"""
+        return self._active
+
+    def queued(self) -> int:
+        """排队中的调用数"""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """占用一个调用名额，排队时间受请求剩余时间限制（超时抛出 DeadlineExceededError）"""
+        scheduler_config = config_manager.llm.scheduler
+        if not scheduler_config.enabled:
+            yield
+            return
+        request_class = _request_class.get()
+        started = time.monotonic()
+        if self._active < scheduler_config.max_concurrency and not self.queued():
+            self._active += 1
+        else:
+            await self._wait(request_class, current_realm())
+        _queue_wait.observe(time.monotonic() - started, request_class=request_class.value)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _wait(self, request_class: RequestClass, realm: str) -> None:
+        weight = config_manager.llm.scheduler.realm_weights.get(realm, config_manager.llm.scheduler.default_weight)
+        key = (request_class, realm)
+        start_tag = max(self._virtual_time[request_class], self._finish_tags.get(key, 0.0))
+        self._finish_tags[key] = start_tag + 1 / weight
+        waiter = _Waiter(start_tag, next(self._seq), request_class, asyncio.get_running_loop().create_future())
+        heapq.heappush(self._queues[request_class], waiter)
+        _queue_depth.set(len(self._queues[request_class]), request_class=request_class.value)
+        # 队列中可能只剩已取消的等待者，立即尝试调度
+        self._dispatch()
+        try:
+            async with asyncio.timeout(remaining_time()):
+                await waiter.future
+        except BaseException as exc:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release()  # 名额已分配但调用方已放弃
+            else:
+                waiter.future.cancel()  # 仍在队列中，调度时跳过
+            if isinstance(exc, TimeoutError):
+                msg = "LLM 调用排队超过请求时限"
+                raise DeadlineExceededError(msg) from exc
+            raise
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        max_concurrency = config_manager.llm.scheduler.max_concurrency
+        while self._active < max_concurrency and (waiter := self._next()) is not None:
+            self._active += 1
+            waiter.future.set_result(None)
+
+    def _next(self) -> _Waiter | None:
+        """按优先级取出下一个未取消的等待者，并推进该类型的虚拟时间"""
+        for request_class in RequestClass:
+            queue = self._queues[request_class]
+            while queue:
+                waiter = heapq.heappop(queue)
+                _queue_depth.set(len(queue), request_class=request_class.value)
+                if waiter.future.done():
+                    continue
+                self._virtual_time[request_class] = waiter.start_tag
+                return waiter
+        return None
+
+
+llm_scheduler = LLMScheduler()
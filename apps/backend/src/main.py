@@ -10,14 +10,20 @@ from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import PlainTextResponse
 
 from config import config_manager
 from container import AppContainer
+from core.admission import AdmissionMiddleware, admission_controller
 from core.cache.redis_service import redis_service
-from core.database.session import close_db_engines, initialize_db_engines, run_migrations
+from core.context.middleware import RequestContextMiddleware
+from core.database.session import check_replica_lag, close_db_engines, initialize_db_engines, run_migrations
 from core.logging import configure_logging, get_bootstrap_logger, get_startup_logger
+from core.metrics import metrics_registry
+from core.tasks import PeriodicTask
+from core.web import CompressionMiddleware, PrecompressedStaticFiles
 from domain.translate.api.routes import router as translate_router
+from llm.breaker import llm_breakers
 
 
 # 静态文件目录
@@ -52,12 +58,55 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     _app.state.container = container
     startup_logger.info("依赖注入容器已初始化")
 
+    partition_task = PeriodicTask(
+        "translations-partition-maintenance",
+        config_manager.database.partitioning.maintenance_interval,
+        container.translation_maintenance().maintain_partitions,
+    )
+    partition_task.start()
+    startup_logger.info("分区维护任务已启动")
+
+    archive_task: PeriodicTask | None = None
+    if config_manager.archive.enabled:
+        archive_task = PeriodicTask(
+            "translations-archive",
+            config_manager.archive.interval,
+            container.translation_maintenance().archive_cold,
+            run_immediately=False,
+        )
+        archive_task.start()
+        startup_logger.info("冷数据归档任务已启动: 归档 %s 天前的记录", config_manager.archive.after_days)
+
+    replica_lag_task: PeriodicTask | None = None
+    if config_manager.database.replicas:
+        replica_lag_task = PeriodicTask(
+            "db-replica-lag-check",
+            config_manager.database.replica_lag_check_interval,
+            check_replica_lag,
+        )
+        replica_lag_task.start()
+        startup_logger.info("只读副本延迟检测已启动: %s 个副本", len(config_manager.database.replicas))
+
+    loop_lag_task = PeriodicTask(
+        "event-loop-lag-sample",
+        config_manager.admission.loop_lag_interval,
+        admission_controller.sample_loop_lag,
+    )
+    loop_lag_task.start()
+
     startup_logger.info("BridgeTalk 启动完成")
 
     yield
 
     startup_logger.info("正在关闭 BridgeTalk...")
 
+    await loop_lag_task.stop()
+    await partition_task.stop()
+    if archive_task is not None:
+        await archive_task.stop()
+    if replica_lag_task is not None:
+        await replica_lag_task.stop()
+
     await redis_service().close()
     startup_logger.info("Redis 连接已关闭")
 
@@ -66,8 +115,20 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
 
 
 async def health_check() -> dict[str, Any]:
-    """健康检查端点"""
-    return {"status": "ok", "service": "BridgeTalk"}
+    """健康检查端点（LLM 熔断、探测中或过载降级时 status 为 degraded）"""
+    admission = admission_controller.snapshot()
+    degraded = llm_breakers.degraded or admission["level"] > 0
+    return {
+        "status": "degraded" if degraded else "ok",
+        "service": "BridgeTalk",
+        "llm": llm_breakers.snapshot(),
+        "admission": admission,
+    }
+
+
+async def metrics() -> PlainTextResponse:
+    """指标端点（Prometheus 文本格式）"""
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
 
 
 def create_app() -> FastAPI:
@@ -79,6 +140,11 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # 后注册的中间件在外层：CORS 包裹请求上下文中间件，拒绝响应同样带有 CORS 头；
+    # 准入控制在请求上下文之内、压缩之外，压缩位于最内层
+    application.add_middleware(CompressionMiddleware)
+    application.add_middleware(AdmissionMiddleware)
+    application.add_middleware(RequestContextMiddleware)
     application.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -89,9 +155,10 @@ def create_app() -> FastAPI:
 
     application.include_router(translate_router)
     application.add_api_route("/health", health_check, methods=["GET"])
+    application.add_api_route("/metrics", metrics, methods=["GET"], include_in_schema=False)
 
     if STATIC_DIR.exists():
-        application.mount("/", StaticFiles(directory=STATIC_DIR, html=True), name="static")
+        application.mount("/", PrecompressedStaticFiles(directory=STATIC_DIR, html=True), name="static")
 
     return application
 
@@ -0,0 +1,135 @@
+"""BridgeTalk 运维命令
+
+用法（在 apps/backend 目录下）::
+
+    python src/manage.py recent-history check [--realm default]
+    python src/manage.py recent-history rebuild [--realm default]
+    python src/manage.py partitions maintain
+    python src/manage.py stats rebuild [--realm default]
+    python src/manage.py archive run
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from collections.abc import Awaitable, Callable
+
+from config import config_manager
+from container import AppContainer
+from core.cache.redis_service import redis_service
+from core.context.request import RequestContextParams, set_request_context
+from core.database.session import close_db_engines, initialize_db_engines, session_scope
+from core.logging import configure_logging, get_logger
+
+
+logger = get_logger("manage")
+
+Command = Callable[[argparse.Namespace, AppContainer], Awaitable[int]]
+
+
+async def recent_history_check(args: argparse.Namespace, container: AppContainer) -> int:
+    """检查最近历史缓冲与数据库是否一致"""
+    buffer = container.recent_history()
+    async with session_scope() as session:
+        report = await buffer.check(session, args.realm)
+    print(
+        f"realm={report.realm} buffered={report.buffered} "
+        f"total_buffer={report.total_buffer} total_db={report.total_db} "
+        f"missing={len(report.missing)} unexpected={len(report.unexpected)}"
+    )
+    return 0 if report.consistent else 1
+
+
+async def recent_history_rebuild(args: argparse.Namespace, container: AppContainer) -> int:
+    """从数据库重建最近历史缓冲（例如 Redis 被清空后）"""
+    buffer = container.recent_history()
+    async with session_scope() as session:
+        count = await buffer.rebuild(session, args.realm, reset=True)
+    print(f"realm={args.realm} rebuilt={count}")
+    return 0
+
+
+async def partitions_maintain(_args: argparse.Namespace, container: AppContainer) -> int:
+    """预建未来月分区并按保留期清理过期分区"""
+    report = await container.translation_maintenance().maintain_partitions()
+    print(f"created={report.created} detached={report.detached} dropped={report.dropped}")
+    return 0
+
+
+async def stats_rebuild(args: argparse.Namespace, container: AppContainer) -> int:
+    """从原始记录重算统计汇总（回填或修复）"""
+    async with session_scope() as session:
+        await container.translation_stats_repository().rebuild(session, args.realm)
+        await session.commit()
+    print(f"realm={args.realm} stats rebuilt")
+    return 0
+
+
+async def archive_run(_args: argparse.Namespace, container: AppContainer) -> int:
+    """将过期的冷数据移入归档段文件（需启用 archive.enabled）"""
+    if not config_manager.archive.enabled:
+        print("archive disabled")
+        return 1
+    report = await container.translation_maintenance().archive_cold()
+    print(f"segments={report.segments} archived={report.archived}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """构建命令行解析器"""
+    parser = argparse.ArgumentParser(prog="manage", description="BridgeTalk 运维命令")
+    commands = parser.add_subparsers(dest="group", required=True)
+
+    recent = commands.add_parser("recent-history", help="Redis 最近历史缓冲")
+    recent_actions = recent.add_subparsers(dest="action", required=True)
+    for name, handler, help_text in (
+        ("check", recent_history_check, "一致性检查"),
+        ("rebuild", recent_history_rebuild, "从数据库重建"),
+    ):
+        action = recent_actions.add_parser(name, help=help_text)
+        action.add_argument("--realm", default="default", help="租户")
+        action.set_defaults(handler=handler)
+
+    partitions = commands.add_parser("partitions", help="translations 表月分区")
+    partition_actions = partitions.add_subparsers(dest="action", required=True)
+    partition_actions.add_parser("maintain", help="预建与过期清理").set_defaults(handler=partitions_maintain)
+
+    stats = commands.add_parser("stats", help="统计汇总表")
+    stats_actions = stats.add_subparsers(dest="action", required=True)
+    rebuild = stats_actions.add_parser("rebuild", help="从原始记录重算")
+    rebuild.add_argument("--realm", default="default", help="租户")
+    rebuild.set_defaults(handler=stats_rebuild)
+
+    archive = commands.add_parser("archive", help="冷数据归档")
+    archive_actions = archive.add_subparsers(dest="action", required=True)
+    archive_actions.add_parser("run", help="执行一次归档").set_defaults(handler=archive_run)
+
+    return parser
+
+
+async def run(args: argparse.Namespace) -> int:
+    """初始化基础设施并执行命令"""
+    config_manager.initialize()
+    configure_logging(level=config_manager.logging.level)
+    if realm := getattr(args, "realm", None):
+        set_request_context(RequestContextParams(realm=realm, username="manage"))
+    redis_service()
+    await initialize_db_engines()
+    handler: Command = args.handler
+    try:
+        return await handler(args, AppContainer())
+    finally:
+        await redis_service().close()
+        await close_db_engines()
+
+
+def main() -> None:
+    """命令行入口"""
+    args = build_parser().parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""测试公共配置：使用配置模板初始化 config_manager"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from config import config_manager
+
+
+_TEMPLATE = Path(__file__).resolve().parents[1] / "config.yaml.template"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _config() -> Iterator[None]:
+    """以 config.yaml.template 初始化配置（测试中按需用 monkeypatch 修改单项）"""
+    os.environ.setdefault("CONFIG_PATH", str(_TEMPLATE))
+    config_manager.initialize()
+    yield
@@ -0,0 +1,129 @@
+"""流式翻译只在写入时借出数据库连接：极小连接池下并发大量流式请求"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from core.database import database_registry
+from core.database.ids import uuid7
+from core.database.session import db_session
+from domain.translate.agent.translate_agent import TranslateResult
+from domain.translate.model.translation import Translation, TranslationStatus
+from domain.translate.service import translate_service
+from domain.translate.service.translate_service import TranslateService
+
+
+_STREAMS = 50
+_LLM_SECONDS = 0.2  # 单个流的 LLM 耗时，远大于连接池等待时限
+_POOL_TIMEOUT = 0.1
+
+
+class _FakeAgent:
+    async def translate_stream(self, content: str, context: str | None = None) -> AsyncIterator[dict[str, Any]]:
+        yield {"event": "translation_start", "data": {"direction": "pm_to_dev"}}
+        for word in ("模拟", "译文"):
+            await asyncio.sleep(_LLM_SECONDS / 2)
+            yield {"event": "content_delta", "data": {"delta": word}}
+        yield {
+            "event": "message_done",
+            "data": {
+                "translated_content": "模拟译文",
+                "detected_perspective": "pm",
+                "direction": "pm_to_dev",
+                "gaps": [],
+                "suggestions": [],
+            },
+        }
+
+
+class _FakeRepository:
+    async def create(
+        self,
+        session: AsyncSession,
+        result: TranslateResult,
+        *,
+        status: TranslationStatus = TranslationStatus.COMPLETED,
+    ) -> Translation:
+        await session.execute(text("SELECT 1"))  # 实际借出连接
+        return Translation(
+            id=uuid7(),
+            content=result.original_content,
+            translated_content=result.translated_content,
+            direction=result.direction,
+            detected_perspective=result.detected_perspective,
+            status=status.value,
+            realm="default",
+            username="anonymous",
+            created_at=datetime.now(UTC),
+        )
+
+
+class _Noop:
+    async def record(self, *args: Any) -> None:
+        pass
+
+    async def put(self, *args: Any) -> None:
+        pass
+
+    async def push(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def tiny_pool() -> Iterator[AsyncEngine]:
+    """单连接、不允许溢出的连接池，等待连接超过 _POOL_TIMEOUT 即失败"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=_POOL_TIMEOUT,
+    )
+    database_registry.register_engine("default", engine)
+    database_registry.register_session_factory(
+        "default", async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    )
+    yield engine
+    database_registry.clear()
+    engine.sync_engine.dispose()
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> TranslateService:
+    monkeypatch.setattr(translate_service, "TranslateAgent", lambda llm: _FakeAgent())
+    noop = _Noop()
+    return TranslateService(llm=None, repository=_FakeRepository(), cache=noop, recent=noop, stats=noop)  # type: ignore[arg-type]
+
+
+async def _consume(service: TranslateService) -> dict[str, Any]:
+    events = [event async for event in service.translate_stream("需求")]
+    return events[-1]
+
+
+async def test_concurrent_streams_share_tiny_pool(tiny_pool: AsyncEngine, service: TranslateService) -> None:
+    done_events = await asyncio.gather(*(_consume(service) for _ in range(_STREAMS)))
+
+    assert all(event["event"] == "message_done" for event in done_events)
+    assert len({event["data"]["translation_id"] for event in done_events}) == _STREAMS
+    assert tiny_pool.pool.checkedout() == 0  # type: ignore[attr-defined]
+
+
+async def test_request_scoped_session_exhausts_tiny_pool(tiny_pool: AsyncEngine) -> None:
+    """对照：整个流期间持有连接时，第二个并发流等待连接超时"""
+
+    async def stream_holding_session() -> None:
+        async for session in db_session():
+            await session.execute(text("SELECT 1"))
+            await asyncio.sleep(_LLM_SECONDS)
+
+    results = await asyncio.gather(stream_holding_session(), stream_holding_session(), return_exceptions=True)
+
+    assert sum(isinstance(result, TimeoutError) for result in results) == 1
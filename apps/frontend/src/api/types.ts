@@ -66,6 +66,16 @@ export interface TranslationRecord {
   created_at: string
 }
 
+export interface TranslationSummary {
+  id: string
+  content_preview: string
+  translated_preview: string
+  direction: string
+  detected_perspective: string | null
+  gap_count: number
+  created_at: string
+}
+
 export type ApiResponse<T> = {
   code: number
   message: string
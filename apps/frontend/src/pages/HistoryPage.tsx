@@ -6,11 +6,11 @@ import { cn } from '@/utils/cn'
 
 type TranslationItem = {
   id: string
-  content: string
-  translated_content: string
+  content_preview: string
+  translated_preview: string
   direction: string
   detected_perspective: string | null
-  gaps: Array<{ category: string; description: string; importance: string }>
+  gap_count: number
   created_at: string
 }
 
@@ -139,10 +139,10 @@ export function HistoryPage() {
                   </div>
                 </div>
                 <p className="text-sm text-slate-600">
-                  {truncateText(item.content, 100)}
+                  {truncateText(item.content_preview, 100)}
                 </p>
                 <p className="mt-2 text-sm text-slate-500">
-                  {truncateText(item.translated_content, 150)}
+                  {truncateText(item.translated_preview, 150)}
                 </p>
               </Link>
             ))}